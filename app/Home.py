@@ -18,6 +18,7 @@ from scrapers.logging_config import setup_logger
 logger = setup_logger("", log_file="app/card_catalog_app.log", clear=True)
 
 from config import PAGE_CONFIG, COLORS, LOGOS_DIR
+from utils.llm_cache import clear_semantic_cache
 
 # Configure page
 page_config = PAGE_CONFIG.copy()
@@ -41,6 +42,8 @@ def main():
             st.rerun()
         if st.button("🗑️ Clear Cache", help="Clear cached data and reload"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            clear_semantic_cache()
             st.rerun()
 
     # Logos at top
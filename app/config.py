@@ -4,7 +4,9 @@ Contains color schemes, paths, LLM prompts, and other settings.
 """
 
 import os
+import string
 from pathlib import Path
+from typing import Callable
 
 # Base paths
 APP_DIR = Path(__file__).parent
@@ -42,44 +44,59 @@ MAX_TOKENS_ANALYSIS = 4000
 MAX_TOKENS_SCORING = 2000
 TEMPERATURE = 0.7
 
+# Output budget of each of the four code deep-dive section requests
+DEEP_DIVE_SECTION_MAX_TOKENS = MAX_TOKENS_ANALYSIS // 3
+
+# Concurrent scoring requests in batch_score_repositories, and the per-minute
+# request cap they share when aiolimiter is installed
+SCORING_CONCURRENCY = 20
+SCORING_REQUESTS_PER_MINUTE = 40
+
+# Repositories scored per request in batch_score_repositories
+SCORING_BATCH_SIZE = 20
+
+# On-disk LLM response cache (utils/llm_cache.py): entry lifetime in seconds,
+# and the highest sampling temperature whose responses are reused
+LLM_CACHE_TTL = 30 * 24 * 3600
+LLM_CACHE_MAX_TEMPERATURE = TEMPERATURE
+
+# Semantic cache for near-duplicate analysis prompts: embedding model, the
+# cosine similarity at which a stored response is reused, and the most entries
+# kept (they also expire after LLM_CACHE_TTL)
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_ENTRIES = 2000
+
 # Token limits for safety
 MAX_INPUT_TOKENS = 180000  # Leave buffer for response
 MAX_GRAPH_NODES = 100  # Maximum nodes for KG generation
 
 # LLM Prompts
-PROMPTS = {
+# Each analysis sends its static instructions as a cached system prompt
+# (SYSTEM_PROMPTS) and only the data as the user message (PROMPTS), so the
+# instructions form a prefix Anthropic prompt caching can reuse across calls
+SYSTEM_PROMPTS = {
     "dataset_analysis": """You are analyzing a collection of neuroscience and brain disorder research datasets.
 
-Dataset Information:
-{dataset_info}
-
-Based on these datasets, provide:
+Based on the datasets in the user's message, provide:
 1. **Key Patterns & Trends**: Identify patterns across the collection
 2. **Common Modalities & Diseases**: Most frequent data types and disease focuses
 3. **Gaps & Opportunities**: Notable gaps in the dataset landscape
 4. **Recommendations**: Actionable guidance for researchers
 
-5. **Comparative Analysis** (if comparative context provided above):
+5. **Comparative Analysis** (if comparative context provided):
    - How does this selection differ from the full catalog?
    - What makes this subset unique or specialized?
    - How does it align with current research trends in the field?
 
 Keep your response concise, insightful, and actionable. Use bullet points and clear section headers.""",
 
-    "knowledge_graph_summary": """You have a knowledge graph representing relationships between neuroscience datasets.
-
-Graph Statistics:
-- Number of datasets: {num_nodes}
-- Number of connections: {num_edges}
-- Connection drivers: {edge_types}
-
-Top connected datasets:
-{top_nodes}
+    "knowledge_graph_summary": """You have a knowledge graph representing relationships between neuroscience datasets. The user's message gives its statistics and most connected datasets.
 
 Provide a detailed summary with these sections:
 1. **Network Overview**: What the main clusters or groups represent
 2. **Central Nodes**: Which datasets are most connected and why (mention specific connection strengths)
-3. **Connection Drivers**: What features/characteristics are driving the connections (based on the connection drivers listed above)
+3. **Connection Drivers**: What features/characteristics are driving the connections (based on the connection drivers listed)
 4. **Notable Patterns**: Interesting patterns in how datasets relate to each other
 5. **Comparative Insights** (if comparative context provided): How this graph compares to the full catalog
 
@@ -87,15 +104,12 @@ Use clear section headers and bullet points. Be specific about connection streng
 
     "publication_analysis": """You are analyzing a collection of scientific publications related to neuroscience and brain disorders.
 
-Publication Information:
-{publication_info}
-
 IMPORTANT: Clearly distinguish in your analysis between:
 - **THIS FILTERED SUBSET** (quantify with exact counts and percentages)
 - **THE FULL CATALOG** (when comparative context provided)
 - **GENERAL FIELD TRENDS** (broader research landscape)
 
-Based on these publications, provide:
+Based on the publications in the user's message, provide:
 
 1. **Major Research Themes & Topics** (in THIS subset):
    - Specify: "In this subset of N publications..."
@@ -120,11 +134,7 @@ Based on these publications, provide:
 
 Use exact numbers and percentages. Always clarify scope: "this subset", "the full catalog", or "general field trends".""",
 
-    "code_cleanliness_score": """Analyze the following GitHub repository for code quality and cleanliness.
-
-Repository: {repo_name}
-Languages: {languages}
-Summary: {summary}
+    "code_cleanliness_score": """Analyze the GitHub repository in the user's message for code quality and cleanliness.
 
 Rate the repository on a scale of 1-10 for:
 1. Code cleanliness (organization, style consistency, readability)
@@ -132,11 +142,7 @@ Rate the repository on a scale of 1-10 for:
 Provide ONLY a single number (1-10) for cleanliness score, no explanation.
 If insufficient information, return "N/A".""",
 
-    "code_completeness_score": """Analyze the following GitHub repository for completeness.
-
-Repository: {repo_name}
-Languages: {languages}
-Summary: {summary}
+    "code_completeness_score": """Analyze the GitHub repository in the user's message for completeness.
 
 Rate the repository on a scale of 1-10 for:
 1. Completeness (documentation, tests, dependencies specified, examples)
@@ -144,11 +150,7 @@ Rate the repository on a scale of 1-10 for:
 Provide ONLY a single number (1-10) for completeness score, no explanation.
 If insufficient information, return "N/A".""",
 
-    "code_runnable_score": """Analyze the following GitHub repository for how easily it can be run out-of-the-box.
-
-Repository: {repo_name}
-Languages: {languages}
-Summary: {summary}
+    "code_runnable_score": """Analyze the GitHub repository in the user's message for how easily it can be run out-of-the-box.
 
 Rate the repository on a scale of 1-10 for:
 1. Run-out-of-box score (setup instructions, dependencies, configuration, ease of getting started)
@@ -156,12 +158,17 @@ Rate the repository on a scale of 1-10 for:
 Provide ONLY a single number (1-10) for runnable score, no explanation.
 If insufficient information, return "N/A".""",
 
-    "repository_analysis": """You are analyzing a collection of code repositories related to neuroscience and brain disorder research.
+    "code_batch_score": """Analyze each of the GitHub repositories in the user's message for {criterion}.
+
+Rate each repository on a scale of 1-10 for:
+1. {criterion_detail}
 
-Repository Information:
-{repository_info}
+Provide ONLY a JSON array with one score per repository, in the order given, no explanation.
+Each score is a single number (1-10), or null if there is insufficient information.""",
+
+    "repository_analysis": """You are analyzing a collection of code repositories related to neuroscience and brain disorder research.
 
-Based on these repositories, provide:
+Based on the repositories in the user's message, provide:
 
 1. **Programming Languages & Technologies**: Most commonly used languages and frameworks
 2. **Data Types & Research Focus**: Types of data processed and research domains
@@ -169,21 +176,34 @@ Based on these repositories, provide:
 4. **Collaboration & Reusability**: Insights into code sharing, documentation quality, and potential for reuse
 5. **Gaps & Opportunities**: Underrepresented areas or technologies that could benefit from more development
 
-6. **Comparative Analysis** (if comparative context provided above):
+6. **Comparative Analysis** (if comparative context provided):
    - How does this selection differ from the full catalog?
    - What makes this subset unique in terms of technology or research focus?
    - How does it align with current trends in computational neuroscience?
 
 Keep your response concise, insightful, and actionable. Use bullet points and clear section headers.""",
 
-    "cellular_models_analysis": """You are analyzing a collection of human iPSC cellular models from the iNDI (iPSC Neurodegenerative Disease Initiative) collection.
+    "code_deep_dive": """Analyze the code repositories in the user's message for quality and best practices.
 
-Cellular Model Information:
-{summary}
+Write only the section of the analysis requested at the end of the message, starting with its heading.
+
+Be specific with repository names and quantify findings. Use exact counts and percentages.""",
+
+    "code_deep_dive_synthesis": """You are completing a code quality analysis of a set of code repositories. The user's message gives its first three sections.
 
-{comparison}
+Write only the final section, starting with its heading:
+
+## 4. Summary Scores & Recommendations
+- Provide average scores (1-10) for each dimension
+- Highlight exemplary repositories
+- Key recommendations for improvement
+- Priorities for researchers using these tools
+
+Be specific with repository names and quantify findings. Use exact counts and percentages.""",
+
+    "cellular_models_analysis": """You are analyzing a collection of human iPSC cellular models from the iNDI (iPSC Neurodegenerative Disease Initiative) collection.
 
-Provide a comprehensive analysis with the following sections:
+Using the cellular model information in the user's message, provide a comprehensive analysis with the following sections:
 
 ## 1. Disease & Gene Distribution
 - Quantify gene representation in this subset vs full catalog (if comparison provided)
@@ -227,6 +247,133 @@ Provide a comprehensive analysis with the following sections:
 Be specific with gene names, disease mechanisms, and pathway details. Use exact counts and percentages. Focus on actionable insights for neurodegenerative disease research.""",
 }
 
+PROMPTS = {
+    "dataset_analysis": """Dataset Information:
+{dataset_info}""",
+
+    "knowledge_graph_summary": """Graph Statistics:
+- Number of datasets: {num_nodes}
+- Number of connections: {num_edges}
+- Connection drivers: {edge_types}
+
+Top connected datasets:
+{top_nodes}""",
+
+    "publication_analysis": """Publication Information:
+{publication_info}""",
+
+    "code_cleanliness_score": """Repository: {repo_name}
+Languages: {languages}
+Summary: {summary}""",
+
+    "code_completeness_score": """Repository: {repo_name}
+Languages: {languages}
+Summary: {summary}""",
+
+    "code_runnable_score": """Repository: {repo_name}
+Languages: {languages}
+Summary: {summary}""",
+
+    "code_batch_score": """{count} repositories:
+
+{repositories}""",
+
+    "repository_analysis": """Repository Information:
+{repository_info}""",
+
+    "code_deep_dive": """{count} code repositories:
+
+{summary}""",
+
+    "code_deep_dive_synthesis": """Analysis of {count} code repositories:
+
+{sections}""",
+
+    "cellular_models_analysis": """Cellular Model Information:
+{summary}
+
+{comparison}""",
+}
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format template into a function that renders it.
+
+    The template is parsed once here and turned into an f-string whose fields
+    are keyword-only parameters, so rendering runs no format-spec parsing.
+    Templates with format specs, conversions or non-identifier fields keep
+    using str.format.
+
+    Args:
+        template: Template with {name} fields
+
+    Returns:
+        Function taking the fields as keyword arguments and returning the text
+    """
+    body = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return template.format
+        body.append("{" + field + "}")
+        if field not in fields:
+            fields.append(field)
+
+    parameters = f"*, {', '.join(fields)}" if fields else ""
+    namespace = {}
+    exec(f"def render({parameters}):\n    return f{''.join(body)!r}\n", namespace)
+    return namespace["render"]
+
+
+# PROMPTS compiled once at import; PROMPT_TEMPLATES[name](**fields) == PROMPTS[name].format(**fields)
+PROMPT_TEMPLATES = {name: _compile_template(template) for name, template in PROMPTS.items()}
+
+
+# What each batched score type rates: (topic, criterion) for SYSTEM_PROMPTS["code_batch_score"]
+SCORING_CRITERIA = {
+    "cleanliness": (
+        "code quality and cleanliness",
+        "Code cleanliness (organization, style consistency, readability)",
+    ),
+    "completeness": (
+        "completeness",
+        "Completeness (documentation, tests, dependencies specified, examples)",
+    ),
+    "runnable": (
+        "how easily they can be run out-of-the-box",
+        "Run-out-of-box score (setup instructions, dependencies, configuration, ease of getting started)",
+    ),
+}
+
+# Sections 1-3 of the code deep dive, each written by its own concurrent request
+# on the shared repository summary; SYSTEM_PROMPTS["code_deep_dive_synthesis"] writes section 4
+DEEP_DIVE_SECTIONS = {
+    "cleanliness": """## 1. Code Cleanliness Assessment
+- Overall code organization and structure patterns
+- Style consistency across repositories
+- Readability and maintainability trends
+- Common issues or anti-patterns identified
+- Best practices observed""",
+
+    "completeness": """## 2. Documentation & Completeness
+- Documentation quality and coverage
+- README comprehensiveness
+- Dependency specification practices
+- Test coverage and examples
+- Common gaps in completeness""",
+
+    "usability": """## 3. Usability & Runnability
+- Setup and installation clarity
+- Configuration requirements
+- Ease of getting started
+- Reproducibility considerations
+- Barriers to adoption""",
+}
+
 # Column mappings and aliases
 DATASET_COLUMNS = {
     "Resource Name": "study_name",
@@ -34,6 +34,7 @@ from utils.graph_builder import (
     filter_graph_by_degree
 )
 from utils.llm_utils import analyze_datasets, summarize_knowledge_graph
+from utils.llm_cache import clear_semantic_cache
 from utils.export_utils import (
     export_dataframe_csv,
     export_dataframe_tsv,
@@ -82,6 +83,8 @@ def main():
             st.rerun()
         if st.button("🗑️ Clear Cache", help="Clear cached data and reload"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            clear_semantic_cache()
             st.rerun()
         st.markdown("---")
 
@@ -129,11 +132,13 @@ def main():
     st.sidebar.markdown("---")
 
     # Apply filters
-    filtered_df = df.copy()
-
-    # Keyword search first
+    # Keyword search first. Searching the loaded frame itself (not a copy) lets
+    # search_across_columns reuse its cached search index; both branches give
+    # a new frame that is safe to modify.
     if search_term:
-        filtered_df = search_across_columns(filtered_df, search_term)
+        filtered_df = search_across_columns(df, search_term)
+    else:
+        filtered_df = df.copy()
 
     # Apply other filters
     filters = {}
@@ -20,8 +20,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from config import COLORS, SESSION_KEYS, HELP_TEXT
 from utils.data_loader import (
     load_code_repos,
-    load_fair_compliance,
-    merge_fair_compliance,
+    load_code_repos_with_fair,
     get_unique_values,
     filter_dataframe,
     search_across_columns
@@ -40,6 +39,7 @@ from utils.llm_utils import (
     summarize_knowledge_graph,
     deep_dive_code_analysis
 )
+from utils.llm_cache import clear_semantic_cache
 from utils.export_utils import (
     export_dataframe_csv,
     export_dataframe_tsv,
@@ -71,14 +71,13 @@ def main():
 
     # Load data
     code_df = load_code_repos()
-    fair_df = load_fair_compliance()
 
     if code_df.empty:
         st.error("No code repository data available. Please check data files.")
         return
 
-    # Merge FAIR compliance data
-    df = merge_fair_compliance(code_df, fair_df)
+    # Merge FAIR compliance data (cached, so reruns search the same frame)
+    df = load_code_repos_with_fair()
 
     # Store original dataframe
     if 'original_code_df' not in st.session_state:
@@ -91,6 +90,8 @@ def main():
             st.rerun()
         if st.button("🗑️ Clear Cache", help="Clear cached data and reload"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            clear_semantic_cache()
             st.rerun()
             st.rerun()
         st.markdown("---")
@@ -170,11 +171,13 @@ def main():
     st.sidebar.markdown("---")
 
     # Apply filters
-    filtered_df = df.copy()
-
-    # Keyword search first
+    # Keyword search first. Searching the loaded frame itself (not a copy) lets
+    # search_across_columns reuse its cached search index; both branches give
+    # a new frame that is safe to modify.
     if search_term:
-        filtered_df = search_across_columns(filtered_df, search_term)
+        filtered_df = search_across_columns(df, search_term)
+    else:
+        filtered_df = df.copy()
 
     # Apply other filters
     filters = {}
@@ -16,8 +16,10 @@ import pandas as pd
 from pathlib import Path
 import sys
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Add parent directory to path once; reruns re-execute this module
+APP_DIR = str(Path(__file__).parent.parent)
+if APP_DIR not in sys.path:
+    sys.path.append(APP_DIR)
 
 from config import COLORS, SESSION_KEYS
 from utils.data_loader import (
@@ -26,11 +28,7 @@ from utils.data_loader import (
     filter_dataframe,
     search_across_columns
 )
-from utils.export_utils import (
-    export_dataframe_csv,
-    export_dataframe_json
-)
-from utils.llm_utils import analyze_cellular_models
+from utils.llm_cache import clear_semantic_cache
 
 # Page config
 st.set_page_config(
@@ -39,17 +37,56 @@ st.set_page_config(
     layout="wide"
 )
 
+
+@st.cache_data
+def _css(path: str) -> str:
+    """Read the stylesheet once and return it wrapped in a <style> tag."""
+    css_path = Path(path)
+    return f"<style>{css_path.read_text()}</style>" if css_path.exists() else ""
+
+
 # Load custom CSS
 css_file = Path(__file__).parent.parent / "assets" / "style.css"
-if css_file.exists():
-    with open(css_file) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+css_html = _css(str(css_file))
+if css_html:
+    st.markdown(css_html, unsafe_allow_html=True)
+
+# Browse-tab columns mapped to identifier-safe namedtuple fields
+BROWSE_FIELDS = {
+    "Product Code": "product_code",
+    "Gene": "gene",
+    "Gene Variant": "gene_variant",
+    "Condition_display": "condition_display",
+    "Genotype": "genotype",
+    "dbSNP": "dbsnp",
+    "Parental Line": "parental_line",
+    "Other Names": "other_names",
+    "Genome Assembly": "genome_assembly",
+    "Procurement link": "procurement_link",
+    "Protospacer Sequence": "protospacer_sequence",
+    "Genomic Coordinate": "genomic_coordinate",
+    "Genomic Sequence": "genomic_sequence",
+    "About this gene": "about_gene",
+    "About this variant": "about_variant",
+}
+
+# Fallbacks for columns absent from the inventory file
+BROWSE_DEFAULTS = {column: "N/A" for column in BROWSE_FIELDS}
+BROWSE_DEFAULTS.update({
+    "Product Code": "Unknown",
+    "Procurement link": "",
+    "About this gene": "",
+    "About this variant": "",
+})
 
 
 def truncate_text(text: str, max_length: int = 200) -> str:
     """
     Truncate text to max_length characters.
 
+    Missing values are filled with "" by the loader, so this avoids the
+    per-call pd.isna dispatch and only guards against None.
+
     Args:
         text: Text to truncate
         max_length: Maximum length
@@ -57,16 +94,257 @@ def truncate_text(text: str, max_length: int = 200) -> str:
     Returns:
         Truncated text with ellipsis if needed
     """
-    if not text or pd.isna(text):
+    if text is None:
         return ""
 
-    text_str = str(text).strip()
+    text_str = (text if isinstance(text, str) else str(text)).strip()
     if len(text_str) <= max_length:
         return text_str
 
     return text_str[:max_length] + "..."
 
 
+@st.fragment
+def _render_table_tab(filtered_df: pd.DataFrame):
+    """Render the filterable data table tab."""
+    st.subheader("Filterable Data Table")
+
+    if filtered_df.empty:
+        st.warning("No cell lines match the current filters.")
+    else:
+        # Prepare display dataframe with truncated long columns
+        display_df = filtered_df.drop(columns=["Condition_display"], errors="ignore")
+
+        # Truncate long text columns for display
+        if 'About this gene' in display_df.columns:
+            display_df['About this gene'] = display_df['About this gene'].apply(
+                lambda x: truncate_text(x, 150)
+            )
+
+        if 'About this variant' in display_df.columns:
+            display_df['About this variant'] = display_df['About this variant'].apply(
+                lambda x: truncate_text(x, 150)
+            )
+
+        # Keep Procurement link as plain URL (Streamlit will auto-link it)
+        if 'Procurement link' in display_df.columns:
+            display_df['Procurement link'] = display_df['Procurement link'].apply(
+                lambda x: str(x) if x and str(x).strip() else ""
+            )
+
+        # Display dataframe
+        st.dataframe(
+            display_df,
+            width="stretch",
+            height=600
+        )
+
+        st.info("Note: Long text columns are truncated in the table view. Use the Browse tab to see full details.")
+
+
+@st.fragment
+def _render_browse_tab(filtered_df: pd.DataFrame):
+    """Render the expandable cell line catalog tab."""
+    st.subheader("Cell Line Catalog")
+
+    if filtered_df.empty:
+        st.warning("No cell lines match the current filters.")
+    else:
+        # Display as expandable records. Select the displayed columns once (missing
+        # ones get their defaults) and iterate namedtuples for attribute access.
+        browse_df = (
+            filtered_df.reindex(columns=list(BROWSE_FIELDS))
+            .fillna(BROWSE_DEFAULTS)
+            .rename(columns=BROWSE_FIELDS)
+        )
+
+        for row in browse_df.itertuples(index=False, name="CellLine"):
+            product_code = row.product_code
+            gene = row.gene
+            variant = row.gene_variant
+            condition_display = row.condition_display
+
+            with st.expander(f"**{product_code}** - {gene} {variant} ({condition_display})"):
+                # Procurement link - make clickable
+                procurement_link = row.procurement_link
+                if not (procurement_link and str(procurement_link).strip()):
+                    procurement_link = "N/A"
+
+                # One markdown element per column instead of one per field
+                left_md = "\n\n".join([
+                    f"**Product Code:** {product_code}",
+                    f"**Gene:** {gene}",
+                    f"**Gene Variant:** {variant}",
+                    f"**Genotype:** {row.genotype}",
+                    f"**dbSNP:** {row.dbsnp}",
+                    f"**Condition:** {condition_display}",
+                ])
+                right_md = "\n\n".join([
+                    f"**Parental Line:** {row.parental_line}",
+                    f"**Other Names:** {row.other_names}",
+                    f"**Genome Assembly:** {row.genome_assembly}",
+                    f"**Procurement:** {procurement_link}",
+                ])
+
+                col1, col2 = st.columns(2)
+                col1.markdown(left_md)
+                col2.markdown(right_md)
+
+                # Genomic information
+                genomic_seq = row.genomic_sequence
+                long_sequence = bool(genomic_seq) and len(str(genomic_seq)) > 100
+                shown_seq = truncate_text(genomic_seq, 100) if long_sequence else genomic_seq
+
+                st.markdown("\n".join([
+                    "---",
+                    "",
+                    "**Genomic Details:**",
+                    "",
+                    f"- **Protospacer Sequence:** `{row.protospacer_sequence}`",
+                    f"- **Genomic Coordinate:** {row.genomic_coordinate}",
+                    f"- **Genomic Sequence:** `{shown_seq}`",
+                ]))
+
+                if long_sequence:
+                    with st.expander("View full sequence"):
+                        st.code(genomic_seq, language="text")
+
+                # About this gene - expandable
+                about_gene = row.about_gene
+                if about_gene and str(about_gene).strip():
+                    with st.expander("📖 About this gene"):
+                        st.markdown(about_gene)
+
+                # About this variant - expandable
+                about_variant = row.about_variant
+                if about_variant and str(about_variant).strip():
+                    with st.expander("🧬 About this variant"):
+                        st.markdown(about_variant)
+
+
+@st.fragment
+def _render_analysis_tab(filtered_df: pd.DataFrame, df: pd.DataFrame):
+    """Render the AI analysis tab."""
+    st.subheader("AI-Powered Cellular Models Analysis")
+
+    st.markdown("""
+    Use AI to analyze the filtered cellular models collection. The analysis includes:
+    - **Disease & Gene Distribution**: Compare subset to full catalog
+    - **Gene Function Analysis**: Insights from gene/variant descriptions
+    - **Pathway & Interaction Analysis**: Biological pathways and protein interactions
+    - **Publications of Interest**: Recent relevant research focused on neurodegeneration
+    - **Utility for Functional & Precision Medicine**: CRISPR models and clinical insights
+    """)
+
+    if filtered_df.empty:
+        st.warning("No cell lines to analyze. Please adjust filters.")
+    else:
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            if st.button("🤖 Analyze Cellular Models", type="primary"):
+                # Deferred import: the Anthropic SDK is only needed once analysis is requested
+                from utils.llm_utils import analyze_cellular_models
+
+                # Store full df for comparison
+                full_df = st.session_state.get('original_indi_df', df)
+
+                # Run analysis
+                analysis_result = analyze_cellular_models(filtered_df, full_df)
+
+                if analysis_result:
+                    st.session_state["indi_analysis_result"] = analysis_result
+                    st.success("Analysis complete!")
+                else:
+                    st.error("Analysis failed. Please check your API configuration.")
+
+        with col2:
+            st.info(f"Ready to analyze {len(filtered_df)} cell lines")
+
+        # Display results
+        if "indi_analysis_result" in st.session_state:
+            st.markdown("---")
+            st.markdown("### Analysis Results")
+
+            analysis_text = st.session_state["indi_analysis_result"]
+            st.markdown(analysis_text)
+
+            # Download button
+            st.download_button(
+                label="📥 Download Analysis Report",
+                data=analysis_text,
+                file_name=f"indi_cellular_models_analysis_{len(filtered_df)}_lines.txt",
+                mime="text/plain",
+                help="Download the AI analysis as a text file"
+            )
+
+
+@st.fragment
+def _render_export_tab(filtered_df: pd.DataFrame):
+    """Render the export tab."""
+    st.subheader("Export Cell Line Data")
+
+    if filtered_df.empty:
+        st.warning("No cell lines to export.")
+    else:
+        from utils.export_utils import export_dataframe_csv, export_dataframe_json
+
+        # Derived display column is not part of the source inventory
+        export_df = filtered_df.drop(columns=["Condition_display"], errors="ignore")
+
+        st.markdown(f"**Export {len(filtered_df)} filtered cell lines**")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### Export as CSV")
+            st.markdown("Export filtered cell line data as CSV file for use in spreadsheet applications.")
+
+            st.download_button(
+                label="📥 Download CSV",
+                data=export_dataframe_csv(export_df),
+                file_name="indi_cell_lines_export.csv",
+                mime="text/csv",
+                help="Export filtered cell lines as CSV file"
+            )
+
+        with col2:
+            st.markdown("#### Export as JSON")
+            st.markdown("Export filtered cell line data as JSON file for programmatic access.")
+
+            st.download_button(
+                label="📥 Download JSON",
+                data=export_dataframe_json(export_df),
+                file_name="indi_cell_lines_export.json",
+                mime="application/json",
+                help="Export filtered cell lines as JSON file"
+            )
+
+        # Summary statistics
+        st.markdown("---")
+        st.markdown("#### Export Summary")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown("**Genes in Export:**")
+            gene_counts = filtered_df["Gene"].value_counts().head(10)
+            for gene, count in gene_counts.items():
+                st.markdown(f"- {gene}: {count}")
+
+        with col2:
+            st.markdown("**Conditions in Export:**")
+            condition_counts = filtered_df["Condition_display"].value_counts().head(10)
+            for condition, count in condition_counts.items():
+                st.markdown(f"- {condition}: {count}")
+
+        with col3:
+            st.markdown("**Parental Lines in Export:**")
+            line_counts = filtered_df["Parental Line"].value_counts().head(10)
+            for line, count in line_counts.items():
+                st.markdown(f"- {line}: {count}")
+
+
 def main():
     """Main Human Cellular Models page."""
 
@@ -87,6 +365,8 @@ def main():
             st.rerun()
         if st.button("🗑️ Clear Cache", help="Clear cached data and reload"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            clear_semantic_cache()
             st.rerun()
             st.rerun()
         st.markdown("---")
@@ -121,8 +401,7 @@ def main():
     )
 
     # Condition filter
-    conditions = sorted(df["Condition"].unique().tolist()) if "Condition" in df.columns else []
-    conditions = [c for c in conditions if c and str(c).strip() and str(c) != "0"]
+    conditions = sorted(df["Condition_display"].unique().tolist()) if "Condition_display" in df.columns else []
     selected_conditions = st.sidebar.multiselect(
         "Condition",
         options=conditions,
@@ -141,18 +420,20 @@ def main():
     st.sidebar.markdown("---")
 
     # Apply filters
-    filtered_df = df.copy()
-
-    # Keyword search first (across all columns)
+    # Keyword search first (across all columns). Searching the loaded frame
+    # itself (not a copy) lets search_across_columns reuse its cached search
+    # index; both branches give a new frame that is safe to modify.
     if search_term:
-        filtered_df = search_across_columns(filtered_df, search_term)
+        filtered_df = search_across_columns(df, search_term)
+    else:
+        filtered_df = df.copy()
 
     # Apply other filters
     if selected_genes:
         filtered_df = filtered_df[filtered_df["Gene"].isin(selected_genes)]
 
     if selected_conditions:
-        filtered_df = filtered_df[filtered_df["Condition"].isin(selected_conditions)]
+        filtered_df = filtered_df[filtered_df["Condition_display"].isin(selected_conditions)]
 
     if selected_parental_lines:
         filtered_df = filtered_df[filtered_df["Parental Line"].isin(selected_parental_lines)]
@@ -171,12 +452,7 @@ def main():
         st.metric("Unique Genes", unique_genes)
 
     with col3:
-        # Count non-zero, non-empty conditions
-        if "Condition" in filtered_df.columns:
-            unique_conditions = len([c for c in filtered_df["Condition"].unique()
-                                   if c and str(c).strip() and str(c) != "0"])
-        else:
-            unique_conditions = 0
+        unique_conditions = filtered_df["Condition_display"].nunique() if "Condition_display" in filtered_df.columns else 0
         st.metric("Unique Conditions", unique_conditions)
 
     with col4:
@@ -196,224 +472,19 @@ def main():
 
     # Tab 1: Data Table
     with tab1:
-        st.subheader("Filterable Data Table")
-
-        if filtered_df.empty:
-            st.warning("No cell lines match the current filters.")
-        else:
-            # Prepare display dataframe with truncated long columns
-            display_df = filtered_df.copy()
-
-            # Truncate long text columns for display
-            if 'About this gene' in display_df.columns:
-                display_df['About this gene'] = display_df['About this gene'].apply(
-                    lambda x: truncate_text(x, 150)
-                )
-
-            if 'About this variant' in display_df.columns:
-                display_df['About this variant'] = display_df['About this variant'].apply(
-                    lambda x: truncate_text(x, 150)
-                )
-
-            # Keep Procurement link as plain URL (Streamlit will auto-link it)
-            if 'Procurement link' in display_df.columns:
-                display_df['Procurement link'] = display_df['Procurement link'].apply(
-                    lambda x: str(x) if x and str(x).strip() else ""
-                )
-
-            # Display dataframe
-            st.dataframe(
-                display_df,
-                width="stretch",
-                height=600
-            )
-
-            st.info("Note: Long text columns are truncated in the table view. Use the Browse tab to see full details.")
+        _render_table_tab(filtered_df)
 
     # Tab 2: Browse Cell Lines
     with tab2:
-        st.subheader("Cell Line Catalog")
-
-        if filtered_df.empty:
-            st.warning("No cell lines match the current filters.")
-        else:
-            # Display as expandable records
-            for idx, row in filtered_df.iterrows():
-                product_code = row.get('Product Code', 'Unknown')
-                gene = row.get('Gene', 'N/A')
-                variant = row.get('Gene Variant', 'N/A')
-                condition = row.get('Condition', 'N/A')
-
-                # Format condition display
-                if condition == "0" or not condition or str(condition).strip() == "":
-                    condition_display = "Control/Wildtype"
-                else:
-                    condition_display = condition
-
-                with st.expander(f"**{product_code}** - {gene} {variant} ({condition_display})"):
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.markdown(f"**Product Code:** {product_code}")
-                        st.markdown(f"**Gene:** {gene}")
-                        st.markdown(f"**Gene Variant:** {variant}")
-                        st.markdown(f"**Genotype:** {row.get('Genotype', 'N/A')}")
-                        st.markdown(f"**dbSNP:** {row.get('dbSNP', 'N/A')}")
-                        st.markdown(f"**Condition:** {condition_display}")
-
-                    with col2:
-                        st.markdown(f"**Parental Line:** {row.get('Parental Line', 'N/A')}")
-                        st.markdown(f"**Other Names:** {row.get('Other Names', 'N/A')}")
-                        st.markdown(f"**Genome Assembly:** {row.get('Genome Assembly', 'N/A')}")
-
-                        # Procurement link - make clickable
-                        procurement_link = row.get('Procurement link', '')
-                        if procurement_link and str(procurement_link).strip():
-                            st.markdown(f"**Procurement:** {procurement_link}")
-                        else:
-                            st.markdown(f"**Procurement:** N/A")
-
-                    # Genomic information
-                    st.markdown("---")
-                    st.markdown("**Genomic Details:**")
-
-                    protospacer = row.get('Protospacer Sequence', 'N/A')
-                    st.markdown(f"- **Protospacer Sequence:** `{protospacer}`")
-
-                    genomic_coord = row.get('Genomic Coordinate', 'N/A')
-                    st.markdown(f"- **Genomic Coordinate:** {genomic_coord}")
-
-                    genomic_seq = row.get('Genomic Sequence', 'N/A')
-                    if genomic_seq and len(str(genomic_seq)) > 100:
-                        st.markdown(f"- **Genomic Sequence:** `{truncate_text(genomic_seq, 100)}`")
-                        with st.expander("View full sequence"):
-                            st.code(genomic_seq, language="text")
-                    else:
-                        st.markdown(f"- **Genomic Sequence:** `{genomic_seq}`")
-
-                    # About this gene - expandable
-                    about_gene = row.get('About this gene', '')
-                    if about_gene and str(about_gene).strip():
-                        with st.expander("📖 About this gene"):
-                            st.markdown(about_gene)
-
-                    # About this variant - expandable
-                    about_variant = row.get('About this variant', '')
-                    if about_variant and str(about_variant).strip():
-                        with st.expander("🧬 About this variant"):
-                            st.markdown(about_variant)
+        _render_browse_tab(filtered_df)
 
     # Tab 3: AI Analysis
     with tab3:
-        st.subheader("AI-Powered Cellular Models Analysis")
-
-        st.markdown("""
-        Use AI to analyze the filtered cellular models collection. The analysis includes:
-        - **Disease & Gene Distribution**: Compare subset to full catalog
-        - **Gene Function Analysis**: Insights from gene/variant descriptions
-        - **Pathway & Interaction Analysis**: Biological pathways and protein interactions
-        - **Publications of Interest**: Recent relevant research focused on neurodegeneration
-        - **Utility for Functional & Precision Medicine**: CRISPR models and clinical insights
-        """)
-
-        if filtered_df.empty:
-            st.warning("No cell lines to analyze. Please adjust filters.")
-        else:
-            col1, col2 = st.columns([1, 3])
-
-            with col1:
-                if st.button("🤖 Analyze Cellular Models", type="primary"):
-                    # Store full df for comparison
-                    full_df = st.session_state.get('original_indi_df', df)
-
-                    # Run analysis
-                    analysis_result = analyze_cellular_models(filtered_df, full_df)
-
-                    if analysis_result:
-                        st.session_state["indi_analysis_result"] = analysis_result
-                        st.success("Analysis complete!")
-                    else:
-                        st.error("Analysis failed. Please check your API configuration.")
-
-            with col2:
-                st.info(f"Ready to analyze {len(filtered_df)} cell lines")
-
-            # Display results
-            if "indi_analysis_result" in st.session_state:
-                st.markdown("---")
-                st.markdown("### Analysis Results")
-
-                analysis_text = st.session_state["indi_analysis_result"]
-                st.markdown(analysis_text)
-
-                # Download button
-                st.download_button(
-                    label="📥 Download Analysis Report",
-                    data=analysis_text,
-                    file_name=f"indi_cellular_models_analysis_{len(filtered_df)}_lines.txt",
-                    mime="text/plain",
-                    help="Download the AI analysis as a text file"
-                )
+        _render_analysis_tab(filtered_df, df)
 
     # Tab 4: Export
     with tab4:
-        st.subheader("Export Cell Line Data")
-
-        if filtered_df.empty:
-            st.warning("No cell lines to export.")
-        else:
-            st.markdown(f"**Export {len(filtered_df)} filtered cell lines**")
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("#### Export as CSV")
-                st.markdown("Export filtered cell line data as CSV file for use in spreadsheet applications.")
-
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=export_dataframe_csv(filtered_df),
-                    file_name="indi_cell_lines_export.csv",
-                    mime="text/csv",
-                    help="Export filtered cell lines as CSV file"
-                )
-
-            with col2:
-                st.markdown("#### Export as JSON")
-                st.markdown("Export filtered cell line data as JSON file for programmatic access.")
-
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=export_dataframe_json(filtered_df),
-                    file_name="indi_cell_lines_export.json",
-                    mime="application/json",
-                    help="Export filtered cell lines as JSON file"
-                )
-
-            # Summary statistics
-            st.markdown("---")
-            st.markdown("#### Export Summary")
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.markdown("**Genes in Export:**")
-                gene_counts = filtered_df["Gene"].value_counts().head(10)
-                for gene, count in gene_counts.items():
-                    st.markdown(f"- {gene}: {count}")
-
-            with col2:
-                st.markdown("**Conditions in Export:**")
-                condition_counts = filtered_df["Condition"].value_counts().head(10)
-                for condition, count in condition_counts.items():
-                    condition_display = "Control/Wildtype" if condition == "0" or not condition else condition
-                    st.markdown(f"- {condition_display}: {count}")
-
-            with col3:
-                st.markdown("**Parental Lines in Export:**")
-                line_counts = filtered_df["Parental Line"].value_counts().head(10)
-                for line, count in line_counts.items():
-                    st.markdown(f"- {line}: {count}")
+        _render_export_tab(filtered_df)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,26 @@
 """
 Data loading and caching utilities for CARD Catalog.
 Handles loading all data files with proper caching and normalization.
+
+The load_* functions are cached with st.cache_resource, so every caller gets the
+same DataFrame object back instead of a fresh unpickled copy. Treat the returned
+frames as read-only: take a .copy() before adding or overwriting columns.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 import streamlit as st
 from pathlib import Path
 from typing import Dict, List, Optional
 import glob
+import os
 import re
 import logging
 import unicodedata
+import weakref
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
@@ -18,6 +28,35 @@ from config import TABLES_DIR, SCRAPERS_DIR, DATA_FILES_PTRS, FAIR_LOG_PATTERN
 
 logger = logging.getLogger(__name__)
 
+# Apostrophe variants folded to ASCII "'" by normalize_list_field
+# U+2019 ('), U+02BC (ʼ), U+0060 (`), U+00B4 (´), U+2018 ('), U+201B (‛)
+_APOSTROPHE_TABLE = str.maketrans({c: "'" for c in '\u2019\u02BC\u0060\u00B4\u2018\u201B'})
+_PAREN_CONTENT_RE = re.compile(r'\(([^)]+)\)')
+_PAREN_STRIP_RE = re.compile(r'\s*\([^)]*\)')
+# Standalone middle initial, ignored when deduplicating author names
+_MIDDLE_INITIAL_RE = re.compile(r'\s+[A-Z]\s+')
+# Duplicated PMC prefix in PubMed Central links ("PMCPMC123" -> "PMC123")
+_PMC_DUP_RE = re.compile(r'PMCPMC(\d+)')
+# Legacy combined modality field: "[coarse, types] granular; types"
+_DATA_MODALITIES_RE = re.compile(r'^\[(?P<coarse>.*?)\]\s*(?P<granular>.*)$')
+
+# Low-cardinality text columns stored as pandas categoricals after loading.
+# Only columns the pages never concatenate, fill with new values, or
+# value_count on filtered subsets (which would list empty categories) are
+# included; the iNDI browse tab fills its columns, so it has none.
+LOW_CARDINALITY_COLUMNS = {
+    "datasets": ["Dataset Type", "Resource Type"],
+    "code_repos": ["Diseases Included", "Languages"],
+    "publications": ["Diseases Included", "Coarse Data Modality"],
+    "fair_compliance": ["Study", "Issue Type"],
+}
+
+# Separator placed between columns when search_across_columns joins them
+SEARCH_SEPARATOR = '\x1f'
+
+# id(df) -> (weakref to df, searched columns, joined column blob)
+_SEARCH_BLOBS: Dict[int, tuple] = {}
+
 current_dir = Path.cwd()
 
 def get_latest_file(pattern, directory=''):
@@ -35,7 +74,154 @@ def get_latest_file(pattern, directory=''):
     return Path(latest_file)
 
 
-@st.cache_data(ttl=3600)
+def _read_tsv(file_path) -> pd.DataFrame:
+    """
+    Read a TSV file with pyarrow's multithreaded CSV reader.
+
+    String columns come back Arrow-backed (string[pyarrow]); numeric columns keep
+    the NumPy dtypes pd.read_csv would give them, so downstream fillna("") and
+    numeric handling are unchanged. Falls back to pd.read_csv if pyarrow cannot
+    parse the file. ISO timestamps are parsed to datetime64 rather than left as
+    text, which sorts the same way.
+
+    Args:
+        file_path: Path to the TSV/TAB file
+
+    Returns:
+        DataFrame with the file contents
+    """
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(delimiter='\t', newlines_in_values=True),
+            # Treat "N/A", "NA", "" etc. as missing in string columns, like pandas
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        )
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+    except pa.ArrowInvalid as e:
+        logger.warning(f"pyarrow could not parse {file_path} ({e}); falling back to pandas")
+        return pd.read_csv(file_path, sep='\t', encoding='utf-8')
+
+
+def _parquet_cache_path(file_path, kind: str) -> Path:
+    """Hidden Parquet side-cache next to a TSV, e.g. tables/.foo.tab.publications.parquet"""
+    file_path = Path(file_path)
+    return file_path.with_name(f".{file_path.name}.{kind}.parquet")
+
+
+def _read_parquet_cache(file_path, kind: str) -> Optional[pd.DataFrame]:
+    """
+    Return the already-normalized DataFrame cached for a TSV, if still valid.
+
+    The cache only counts if it is newer than both the TSV and this module, so
+    editing the source table or the normalization code rebuilds it.
+
+    Args:
+        file_path: Path to the source TSV/TAB file
+        kind: Loader name, so each loader keeps its own cache
+
+    Returns:
+        Cached DataFrame, or None if there is no valid cache
+    """
+    cache_path = _parquet_cache_path(file_path, kind)
+    try:
+        cache_mtime = cache_path.stat().st_mtime
+        if cache_mtime < max(Path(file_path).stat().st_mtime, Path(__file__).stat().st_mtime):
+            return None
+        df = pd.read_parquet(cache_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Parquet cache {cache_path}: {e}")
+        return None
+
+    # Parquet round-trips StringDtype columns with the default (python) storage;
+    # restore the Arrow-backed strings the TSV path produces
+    df = df.astype({col: "string[pyarrow]" for col in df.columns
+                    if isinstance(df[col].dtype, pd.StringDtype)})
+
+    logger.info(f"Loaded {kind} from Parquet cache: {cache_path}")
+    return df
+
+
+def _write_parquet_cache(df: pd.DataFrame, file_path, kind: str) -> None:
+    """
+    Write a normalized DataFrame to its Parquet side-cache atomically.
+    Failures (e.g. a read-only deployment) are logged and otherwise ignored.
+
+    Args:
+        df: Normalized DataFrame returned by the loader
+        file_path: Path to the source TSV/TAB file
+        kind: Loader name, so each loader keeps its own cache
+    """
+    cache_path = _parquet_cache_path(file_path, kind)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write Parquet cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _categorize(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    """
+    Convert the loader's low-cardinality columns (LOW_CARDINALITY_COLUMNS) to
+    categoricals: one copy of each distinct string plus small integer codes.
+
+    Args:
+        df: Normalized DataFrame
+        kind: Loader name
+
+    Returns:
+        DataFrame with those columns as category dtype
+    """
+    # Categories are plain Python strings whatever the source dtype, so a frame
+    # read back from the Parquet cache has the same dtypes as a fresh load
+    for col in LOW_CARDINALITY_COLUMNS.get(kind, []):
+        if col in df.columns:
+            df[col] = df[col].astype(object).astype("category")
+    return df
+
+
+def _split_data_modalities(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Split a legacy combined 'Data Modalities' column into the
+    'Coarse Data Modality' / 'Granular Data Modality' pair the pages expect.
+
+    Older inventories store both in one field as "[coarse, types] granular; types".
+    The split is a single vectorized str.extract; values without a leading
+    [...] block are kept whole as the granular modality.
+
+    Args:
+        df: DataFrame that may contain a 'Data Modalities' column
+
+    Returns:
+        The same DataFrame, modified in place, with the two modality columns
+        in place of 'Data Modalities'
+    """
+    if 'Data Modalities' not in df.columns or 'Coarse Data Modality' in df.columns:
+        return df
+
+    modalities = df['Data Modalities'].astype(str).str.strip()
+    # Pass the pattern string (not the compiled object) so Arrow-backed columns
+    # stay on Arrow's regex kernels
+    extracted = modalities.str.extract(_DATA_MODALITIES_RE.pattern)
+    unbracketed = extracted['coarse'].isna()
+    extracted.loc[unbracketed, 'granular'] = modalities[unbracketed]
+    extracted = extracted.fillna("")
+
+    # Put the new columns where 'Data Modalities' was, in place: insert/del
+    # only touch those columns, where drop() would copy the whole frame
+    pos = df.columns.get_loc('Data Modalities')
+    df.insert(pos + 1, 'Coarse Data Modality', extracted['coarse'])
+    df.insert(pos + 2, 'Granular Data Modality', extracted['granular'])
+    del df['Data Modalities']
+    return df
+
+
+@st.cache_resource(ttl=3600)
 def load_datasets() -> pd.DataFrame:
     """
     Load dataset inventory from tables directory.
@@ -51,8 +237,12 @@ def load_datasets() -> pd.DataFrame:
         st.error(f"Dataset file not found: {file_path}")
         return pd.DataFrame()
 
+    cached = _read_parquet_cache(file_path, "datasets")
+    if cached is not None:
+        return cached
+
     try:
-        df = pd.read_csv(file_path, sep='\t', encoding='utf-8')
+        df = _read_tsv(file_path)
 
         # Clean column names
         df.columns = df.columns.str.strip()
@@ -60,13 +250,17 @@ def load_datasets() -> pd.DataFrame:
         # Handle missing values
         df = df.fillna("")
 
+        df = _split_data_modalities(df)
+
         # Normalize disease names (split on both ";" and "," to handle inconsistent source data)
-        df['Diseases Included'] = df['Diseases Included'].apply(
-            lambda x: normalize_list_field(x, delimiter=";", split_delimiters=[";", ","])
+        df['Diseases Included'] = normalize_list_column(
+            df['Diseases Included'], delimiter=";", split_delimiters=[";", ","]
         )
 
         df = df.drop(columns=[c for c in ["Notes", "Remove"] if c in df.columns])
 
+        df = _categorize(df, "datasets")
+        _write_parquet_cache(df, file_path, "datasets")
         logger.info(f"Datasets loaded: {len(df)} rows, {len(df.columns)} columns")
         return df
     except Exception as e:
@@ -75,7 +269,7 @@ def load_datasets() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_code_repos() -> pd.DataFrame:
     """
     Load code repository data from tables directory.
@@ -91,8 +285,12 @@ def load_code_repos() -> pd.DataFrame:
         st.error(f"Code repos file not found: {file_path}")
         return pd.DataFrame()
 
+    cached = _read_parquet_cache(file_path, "code_repos")
+    if cached is not None:
+        return cached
+
     try:
-        df = pd.read_csv(file_path, sep='\t', encoding='utf-8')
+        df = _read_tsv(file_path)
 
         # Clean column names
         df.columns = df.columns.str.strip()
@@ -101,22 +299,24 @@ def load_code_repos() -> pd.DataFrame:
         df = df.fillna("")
 
         # Normalize diseases
-        df['Diseases Included'] = df['Diseases Included'].apply(normalize_list_field)
+        df['Diseases Included'] = normalize_list_column(df['Diseases Included'])
 
         # Normalize data types and tooling
         if 'Data Types' in df.columns:
-            df['Data Types'] = df['Data Types'].apply(normalize_list_field)
+            df['Data Types'] = normalize_list_column(df['Data Types'])
 
         if 'Tooling' in df.columns:
-            df['Tooling'] = df['Tooling'].apply(normalize_list_field)
+            df['Tooling'] = normalize_list_column(df['Tooling'])
 
         # Deduplicate languages
         if 'Languages' in df.columns:
-            df['Languages'] = df['Languages'].apply(normalize_list_field)
+            df['Languages'] = normalize_list_column(df['Languages'])
 
         # Drop heavy unused column
         df = df.drop(columns=[c for c in ['Content_For_Analysis'] if c in df.columns])
 
+        df = _categorize(df, "code_repos")
+        _write_parquet_cache(df, file_path, "code_repos")
         logger.info(f"Code repos loaded: {len(df)} rows, {len(df.columns)} columns")
         return df
     except Exception as e:
@@ -125,10 +325,15 @@ def load_code_repos() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+# Fields that count towards a publication's Data Completeness score
+PUBLICATION_COMPLETENESS_FIELDS = ['PubMed Central Link', 'Abstract', 'Keywords', 'Authors', 'Affiliations']
+
+
 def calculate_publication_completeness(row: pd.Series) -> float:
     """
     Calculate completeness score for a publication (0-100%).
     Checks: PMC Link, Abstract, Keywords, Authors, Affiliations.
+    Scalar version of the column-wise score computed in load_publications.
 
     Args:
         row: DataFrame row
@@ -136,18 +341,17 @@ def calculate_publication_completeness(row: pd.Series) -> float:
     Returns:
         Completeness percentage (0-100)
     """
-    fields_to_check = ['PubMed Central Link', 'Abstract', 'Keywords', 'Authors', 'Affiliations']
     completed = 0
-    total = len(fields_to_check)
+    total = len(PUBLICATION_COMPLETENESS_FIELDS)
 
-    for field in fields_to_check:
+    for field in PUBLICATION_COMPLETENESS_FIELDS:
         if field in row and row[field] and str(row[field]).strip() != '':
             completed += 1
 
     return (completed / total) * 100
 
 
-@st.cache_data(ttl=3600, hash_funcs={pd.DataFrame: lambda x: None})
+@st.cache_resource(ttl=3600)
 def load_publications() -> pd.DataFrame:
     """
     Load publications data from tables directory.
@@ -164,8 +368,12 @@ def load_publications() -> pd.DataFrame:
         st.error(f"Publications file not found: {file_path}")
         return pd.DataFrame()
 
+    cached = _read_parquet_cache(file_path, "publications")
+    if cached is not None:
+        return cached
+
     try:
-        df = pd.read_csv(file_path, sep='\t', encoding='utf-8')
+        df = _read_tsv(file_path)
 
         # Clean column names
         df.columns = df.columns.str.strip()
@@ -173,27 +381,40 @@ def load_publications() -> pd.DataFrame:
         # Handle missing values
         df = df.fillna("")
 
+        df = _split_data_modalities(df)
+
         # Fix PMC links - remove duplicate PMC prefix
         if 'PubMed Central Link' in df.columns:
-            df['PubMed Central Link'] = df['PubMed Central Link'].apply(fix_pmc_link)
+            # Vectorized equivalent of fix_pmc_link over the whole column
+            df['PubMed Central Link'] = df['PubMed Central Link'].str.replace(
+                _PMC_DUP_RE.pattern, r'PMC\1', regex=True
+            )
 
         # Normalize author names
         if 'Authors' in df.columns:
-            df['Authors'] = df['Authors'].apply(normalize_author_names)
+            df['Authors'] = df['Authors'].map(normalize_author_names)
 
         # Normalize diseases (split on both ";" and "," to handle inconsistent source data)
         if 'Diseases Included' in df.columns:
-            df['Diseases Included'] = df['Diseases Included'].apply(
-                lambda x: normalize_list_field(x, delimiter=";", split_delimiters=[";", ","])
+            df['Diseases Included'] = normalize_list_column(
+                df['Diseases Included'], delimiter=";", split_delimiters=[";", ","]
             )
 
         # Normalize keywords to fix duplicates
         if 'Keywords' in df.columns:
-            df['Keywords'] = df['Keywords'].apply(normalize_list_field)
+            df['Keywords'] = normalize_list_column(df['Keywords'])
 
         # Calculate data completeness score
-        df['Data Completeness'] = df.apply(calculate_publication_completeness, axis=1)
+        # (column-wise; same result as calculate_publication_completeness per row)
+        completed = sum(
+            (df[field].astype(str).str.strip().ne('')
+             for field in PUBLICATION_COMPLETENESS_FIELDS if field in df.columns),
+            0
+        )
+        df['Data Completeness'] = completed / len(PUBLICATION_COMPLETENESS_FIELDS) * 100
 
+        df = _categorize(df, "publications")
+        _write_parquet_cache(df, file_path, "publications")
         logger.info(f"Publications loaded: {len(df)} rows, {len(df.columns)} columns")
         return df
     except Exception as e:
@@ -202,11 +423,12 @@ def load_publications() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_fair_compliance() -> pd.DataFrame:
     """
     Load FAIR compliance logs from scrapers directory.
-    Merges all FAIR compliance log files.
+    Only the most recent log file is read (each run writes a complete log), via
+    the threaded pyarrow reader in _read_tsv.
 
     Returns:
         DataFrame with FAIR compliance information
@@ -223,8 +445,12 @@ def load_fair_compliance() -> pd.DataFrame:
     latest_file = max(fair_files, key=lambda x: Path(x).stat().st_mtime)
     logger.info(f"Loading latest FAIR compliance log: {latest_file}")
 
+    cached = _read_parquet_cache(latest_file, "fair_compliance")
+    if cached is not None:
+        return cached
+
     try:
-        combined_df = pd.read_csv(latest_file, sep='\t', encoding='utf-8')
+        combined_df = _read_tsv(latest_file)
     except Exception as e:
         logger.warning(f"Error loading {latest_file}: {e}")
         return pd.DataFrame()
@@ -234,11 +460,13 @@ def load_fair_compliance() -> pd.DataFrame:
         combined_df = combined_df.sort_values('Timestamp', ascending=False)
         combined_df = combined_df.drop_duplicates(subset=['Repository', 'Study', 'Issue Type'], keep='first')
 
+    combined_df = _categorize(combined_df, "fair_compliance")
+    _write_parquet_cache(combined_df, latest_file, "fair_compliance")
     logger.info(f"FAIR compliance loaded: {len(combined_df)} records")
     return combined_df
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_indi_inventory() -> pd.DataFrame:
     """
     Load iNDI inventory data.
@@ -254,10 +482,30 @@ def load_indi_inventory() -> pd.DataFrame:
         st.warning(f"iNDI inventory file not found: {file_path}")
         return pd.DataFrame()
 
+    cached = _read_parquet_cache(file_path, "indi")
+    if cached is not None:
+        return cached
+
     try:
-        df = pd.read_csv(file_path, sep='\t', encoding='utf-8')
+        df = _read_tsv(file_path)
         df.columns = df.columns.str.strip()
         df = df.fillna("")
+
+        # Store text columns as Arrow-backed strings so .str operations
+        # (strip, slice, contains) run in Arrow's compute kernels
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].astype("string[pyarrow]")
+
+        # Canonical condition label: empty / "0" conditions are control lines
+        if 'Condition' in df.columns:
+            condition = df['Condition'].astype("string[pyarrow]").str.strip()
+            df['Condition_display'] = condition.mask(
+                (condition == "") | (condition == "0"), "Control/Wildtype"
+            )
+
+        df = _categorize(df, "indi")
+        _write_parquet_cache(df, file_path, "indi")
         logger.info(f"iNDI inventory loaded: {len(df)} rows, {len(df.columns)} columns")
         return df
     except Exception as e:
@@ -288,58 +536,60 @@ def normalize_list_field(field: str, delimiter: str = ";", split_delimiters: Lis
 
     separators = split_delimiters if split_delimiters else [delimiter]
 
-    items = [str(field)]
+    # Normalize Unicode (NFKC) and fold apostrophe variants once for the whole
+    # field instead of once per item
+    text = unicodedata.normalize('NFKC', str(field)).translate(_APOSTROPHE_TABLE)
+
+    items = [text]
     for sep in separators:
         items = [part for item in items for part in item.split(sep)]
     # Expand parenthetical content into additional items
     # e.g. "Alz(PD,AD,ADRD)" -> ["Alz", "PD", "AD", "ADRD"]
     expanded = []
     for item in items:
-        paren_match = re.search(r'\(([^)]+)\)', item)
+        paren_match = _PAREN_CONTENT_RE.search(item)
         if paren_match:
             # Add the base (without parenthetical)
-            base = re.sub(r'\s*\([^)]*\)', '', item).strip()
-            if base:
-                expanded.append(base)
+            expanded.append(_PAREN_STRIP_RE.sub('', item))
             # Add each comma-separated value inside the parentheses
-            for sub in paren_match.group(1).split(','):
-                sub = sub.strip()
-                if sub:
-                    expanded.append(sub)
+            expanded.extend(paren_match.group(1).split(','))
         else:
             expanded.append(item)
 
-    items_to_process = expanded
-    items = []
-    for item in items_to_process:
-        # Strip regular and Unicode whitespace
+    # Strip whitespace and remove duplicates (case-insensitive, first spelling wins)
+    seen = {}
+    for item in expanded:
         cleaned = item.strip()
-        # Normalize Unicode characters (NFKC normalization)
-        cleaned = unicodedata.normalize('NFKC', cleaned)
-        # Replace all apostrophe variants with standard ASCII apostrophe
-        # U+2019 ('), U+02BC (ʼ), U+0060 (`), U+00B4 (´), etc.
-        apostrophe_variants = ['\u2019', '\u02BC', '\u0060', '\u00B4', '\u2018', '\u201B']
-        for variant in apostrophe_variants:
-            cleaned = cleaned.replace(variant, "'")
-        # Strip again after normalization
-        cleaned = cleaned.strip()
         if cleaned:
-            items.append(cleaned)
+            seen.setdefault(cleaned.lower(), cleaned)
 
-    # Remove duplicates (case-insensitive)
-    seen = {}
-    unique_items = []
-    for item in items:
-        lower = item.lower()
-        if lower not in seen:
-            seen[lower] = item
-            unique_items.append(item)
+    # Sort and rejoin
+    return delimiter.join(sorted(seen.values()))
 
-    items = unique_items
 
-    # Sort and rejoin
-    items.sort()
-    return delimiter.join(items)
+def normalize_list_column(
+    values: pd.Series,
+    delimiter: str = ";",
+    split_delimiters: List[str] = None
+) -> pd.Series:
+    """
+    Apply normalize_list_field to a column, normalizing each distinct value once.
+    List columns repeat heavily (e.g. ~70 distinct disease lists across 3,500
+    publications), so most rows become a dict lookup.
+
+    Args:
+        values: Series of delimited strings
+        delimiter: Output delimiter character (default ";")
+        split_delimiters: List of delimiters to split on (default: [delimiter])
+
+    Returns:
+        Series of normalized strings, aligned with values
+    """
+    normalized = {
+        value: normalize_list_field(value, delimiter=delimiter, split_delimiters=split_delimiters)
+        for value in values.unique()
+    }
+    return values.map(normalized)
 
 
 def fix_pmc_link(link: str) -> str:
@@ -358,7 +608,7 @@ def fix_pmc_link(link: str) -> str:
         return ""
 
     # Fix duplicate PMC prefix
-    link = re.sub(r'PMCPMC(\d+)', r'PMC\1', link)
+    link = _PMC_DUP_RE.sub(r'PMC\1', link)
 
     return link
 
@@ -406,7 +656,7 @@ def normalize_author_names(authors: str) -> str:
     unique_authors = []
     for author in normalized:
         # Normalize for comparison (remove middle initials)
-        normalized_key = re.sub(r'\s+[A-Z]\s+', ' ', author).lower()
+        normalized_key = _MIDDLE_INITIAL_RE.sub(' ', author).lower()
         if normalized_key not in seen:
             seen.add(normalized_key)
             unique_authors.append(author)
@@ -433,16 +683,15 @@ def get_unique_values(df: pd.DataFrame, column: str, delimiter: str | List[str]
     delimiters = delimiter if isinstance(delimiter, list) else [delimiter]
     logger.info(f"Extracting unique values from column '{column}' using delimiters: {delimiters}")
 
-    all_values = []
-    for value in df[column].dropna():
-        if value and str(value).strip():
-            items = [str(value)]
-            for sep in delimiters:
-                items = [part for item in items for part in item.split(sep)]
-            all_values.extend([item.strip() for item in items if item.strip()])
+    # Split, trim and dedupe in Arrow compute kernels rather than per row in Python
+    items = pa.array(df[column].dropna().astype(str), pa.large_string())
+    for sep in delimiters:
+        items = pc.list_flatten(pc.split_pattern(items, pattern=sep))
+    items = pc.utf8_trim_whitespace(items)
+    items = pc.filter(items, pc.not_equal(items, ""))
 
     # Remove duplicates and sort
-    unique_values = sorted(list(set(all_values)))
+    unique_values = sorted(pc.unique(items).to_pylist())
 
     return unique_values
 
@@ -460,32 +709,78 @@ def filter_dataframe(
         filters: Dictionary of column: value/list filters
 
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame (the input itself if no filter applies)
     """
-    filtered_df = df.copy()
+    # AND every filter into one mask and index the frame once at the end
+    mask = None
 
     for column, value in filters.items():
-        if column not in filtered_df.columns:
+        if column not in df.columns:
             continue
 
         if not value:
             continue
 
         if isinstance(value, list) and len(value) > 0:
-            # Multiple selection - match any
-            mask = filtered_df[column].apply(
-                lambda x: any(v in str(x) for v in value)
+            # Multiple selection - match any (substring), as one regex pass over
+            # the column rather than a Python loop per row and selected value
+            pattern = '|'.join(re.escape(str(v)) for v in value)
+            column_mask = df[column].astype(str).str.contains(
+                pattern, case=True, na=False, regex=True
             )
-            filtered_df = filtered_df[mask]
 
         elif isinstance(value, str) and value:
             # Keyword search - case insensitive partial match
-            mask = filtered_df[column].str.contains(
+            column_mask = df[column].str.contains(
                 value, case=False, na=False, regex=False
             )
-            filtered_df = filtered_df[mask]
 
-    return filtered_df
+        else:
+            continue
+
+        mask = column_mask if mask is None else mask & column_mask
+
+    # No active filters: hand back the input rather than copying it
+    if mask is None:
+        return df
+
+    return df[mask.to_numpy(dtype=bool)]
+
+
+def _search_blob(df: pd.DataFrame, columns: List[str]) -> pa.Array:
+    """
+    Searched columns joined into one string per row, built once per DataFrame
+    and column set and reused on later searches.
+
+    The columns are joined with Arrow's element-wise join; the unit separator
+    keeps matches from spanning two columns. Blobs are keyed by the frame's
+    identity (not df.attrs, which pandas deep-copies on every operation) and
+    dropped when the frame is garbage collected; this relies on the read-only
+    contract for the cached load_* frames.
+
+    Args:
+        df: DataFrame being searched
+        columns: Columns to include
+
+    Returns:
+        Arrow string array aligned with df's rows
+    """
+    key = id(df)
+    entry = _SEARCH_BLOBS.get(key)
+    if entry is not None and entry[0]() is df and entry[1] == tuple(columns):
+        return entry[2]
+
+    arrays = [pa.array(df[column].astype(str).to_numpy(object), pa.large_string())
+              if not isinstance(df[column].dtype, pd.StringDtype)
+              else pa.array(df[column], pa.large_string())
+              for column in columns]
+    joined = pc.binary_join_element_wise(
+        *arrays, pa.scalar(SEARCH_SEPARATOR, pa.large_string()), null_handling='replace'
+    )
+
+    ref = weakref.ref(df, lambda _, key=key: _SEARCH_BLOBS.pop(key, None))
+    _SEARCH_BLOBS[key] = (ref, tuple(columns), joined)
+    return joined
 
 
 def search_across_columns(
@@ -511,15 +806,14 @@ def search_across_columns(
     if columns is None:
         columns = df.columns.tolist()
 
-    # Create a mask for rows matching the search term
-    mask = pd.Series([False] * len(df), index=df.index)
+    columns = [column for column in columns if column in df.columns]
+    if not columns:
+        return df.iloc[0:0]
 
-    for column in columns:
-        if column in df.columns:
-            column_mask = df[column].astype(str).str.contains(
-                search_term, case=False, na=False, regex=False
-            )
-            mask = mask | column_mask
+    # One Arrow scan over the (cached) joined columns
+    blob = _search_blob(df, columns)
+    mask = pc.match_substring(blob, search_term, ignore_case=True)
+    mask = mask.to_numpy(zero_copy_only=False)
 
     return df[mask]
 
@@ -536,23 +830,27 @@ def merge_fair_compliance(code_df: pd.DataFrame, fair_df: pd.DataFrame) -> pd.Da
         Merged DataFrame with FAIR compliance information
     """
     if fair_df.empty:
-        # Add empty FAIR columns
-        code_df['FAIR Issues'] = ""
-        code_df['FAIR Score'] = 0
-        return code_df
-
-    # Group FAIR issues by repository
-    fair_summary = fair_df.groupby('Repository').agg({
-        'Issue Type': lambda x: '; '.join(x.unique()),
-        'Details': 'count'
-    }).reset_index()
+        # Add empty FAIR columns (assign() leaves the cached code_df untouched)
+        return code_df.assign(**{'FAIR Issues': "", 'FAIR Score': 0})
+
+    # Group FAIR issues by repository: distinct issue types (in order of first
+    # appearance) and the number of logged issues
+    issue_types = (
+        fair_df.drop_duplicates(['Repository', 'Issue Type'])
+        .groupby('Repository', sort=False)['Issue Type']
+        .agg('; '.join)
+        .astype("string[pyarrow]")
+    )
+    issue_counts = fair_df.groupby('Repository', sort=False)['Details'].count()
 
-    fair_summary.columns = ['Repository Link', 'FAIR Issues', 'FAIR Issue Count']
+    fair_summary = pd.DataFrame({
+        'Repository Link': issue_types.index,
+        'FAIR Issues': issue_types.array,
+        'FAIR Issue Count': issue_counts.reindex(issue_types.index).to_numpy()
+    })
 
     # Calculate FAIR score (10 - issue count, min 0)
-    fair_summary['FAIR Score'] = fair_summary['FAIR Issue Count'].apply(
-        lambda x: max(0, 10 - x)
-    )
+    fair_summary['FAIR Score'] = np.clip(10 - fair_summary['FAIR Issue Count'].to_numpy(), 0, None)
 
     # Merge with code data
     merged_df = code_df.merge(
@@ -566,3 +864,18 @@ def merge_fair_compliance(code_df: pd.DataFrame, fair_df: pd.DataFrame) -> pd.Da
     merged_df['FAIR Score'] = merged_df['FAIR Score'].fillna(10)  # No issues = perfect score
 
     return merged_df
+
+
+@st.cache_resource(ttl=3600)
+def load_code_repos_with_fair() -> pd.DataFrame:
+    """
+    Load code repositories merged with their FAIR compliance summary.
+
+    Cached like the other load_* frames, so every rerun of the Code page gets
+    the same DataFrame back and search_across_columns can reuse its search
+    index. Read-only, like the frames it is built from.
+
+    Returns:
+        DataFrame from merge_fair_compliance
+    """
+    return merge_fair_compliance(load_code_repos(), load_fair_compliance())
@@ -5,14 +5,24 @@ Supports CSV, TSV, JSON, and Excel formats.
 
 import pandas as pd
 import io
+import importlib.util
 from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from config import EXPORT_FORMATS
 
+# xlsxwriter streams rows to disk in constant_memory mode; openpyxl builds the
+# whole workbook in memory, so it is only used when xlsxwriter is missing
+HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+
 
 def export_dataframe_csv(df: pd.DataFrame) -> str:
     """
@@ -64,11 +74,44 @@ def export_dataframe_excel(df: pd.DataFrame) -> bytes:
         Excel file bytes
     """
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Data')
+    if HAS_XLSXWRITER:
+        _write_excel_streaming(df, output)
+    else:
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name='Data')
     return output.getvalue()
 
 
+def _write_excel_streaming(df: pd.DataFrame, output: io.BytesIO) -> None:
+    """
+    Write DataFrame rows to an xlsx workbook with xlsxwriter in constant_memory
+    mode, which flushes each row as it goes.
+
+    pandas' to_excel can't be used here: it writes column by column, and
+    constant_memory only keeps cells written in row order.
+
+    Args:
+        df: DataFrame to export
+        output: Buffer to write the workbook to
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    worksheet = workbook.add_worksheet('Data')
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+
+    # Missing values become blank cells
+    values = df.astype(object).where(df.notna(), None)
+    for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, row)
+
+    workbook.close()
+
+
 def export_text_summary(df: pd.DataFrame, title: str = "Data Summary") -> str:
     """
     Export DataFrame as formatted text summary.
@@ -91,21 +134,24 @@ def export_text_summary(df: pd.DataFrame, title: str = "Data Summary") -> str:
         ""
     ]
 
-    # Add records
-    for idx, row in df.iterrows():
+    # Add records (itertuples avoids building a Series per row)
+    columns = [str(col) for col in df.columns]
+    labels = [f"{col}: " for col in columns]
+    for idx, row in zip(df.index, df.itertuples(index=False, name=None)):
         lines.append(f"Record {idx + 1}:")
         lines.append("-" * 80)
 
-        for col in df.columns:
-            value = row[col]
-            if pd.notna(value) and str(value).strip():
+        for col, label, value in zip(columns, labels, row):
+            if pd.notna(value):
+                text = str(value)
+                if not text.strip():
+                    continue
                 # Format multiline values
-                if '\n' in str(value):
+                if '\n' in text:
                     lines.append(f"{col}:")
-                    for line in str(value).split('\n'):
-                        lines.append(f"  {line}")
+                    lines.extend(f"  {line}" for line in text.split('\n'))
                 else:
-                    lines.append(f"{col}: {value}")
+                    lines.append(label + text)
 
         lines.append("")
 
@@ -157,10 +203,14 @@ def export_graph_summary(
             "-" * 80,
         ])
 
-        for idx, row in edge_details.head(20).iterrows():
-            lines.append(f"\n{row['Node 1']} <-> {row['Node 2']}")
-            lines.append(f"  Weight: {row['Weight']}")
-            lines.append(f"  Shared: {row['Shared Features']}")
+        top_edges = edge_details.head(20)
+        for node1, node2, weight, shared in zip(
+            top_edges['Node 1'], top_edges['Node 2'],
+            top_edges['Weight'], top_edges['Shared Features']
+        ):
+            lines.append(f"\n{node1} <-> {node2}")
+            lines.append(f"  Weight: {weight}")
+            lines.append(f"  Shared: {shared}")
 
         if len(edge_details) > 20:
             lines.append(f"\n... and {len(edge_details) - 20} more connections")
@@ -288,6 +338,15 @@ def create_metadata_summary(df: pd.DataFrame) -> dict:
     return metadata
 
 
+def _json_default(obj):
+    """Fallback JSON encoding for values orjson/json can't serialize themselves."""
+    if pd.isna(obj):
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
 def export_with_metadata(df: pd.DataFrame, format: str = "json") -> str:
     """
     Export DataFrame with metadata.
@@ -306,4 +365,12 @@ def export_with_metadata(df: pd.DataFrame, format: str = "json") -> str:
         "data": df.to_dict(orient='records')
     }
 
-    return json.dumps(export_data, indent=2)
+    if orjson is not None:
+        # orjson encodes in C and handles NumPy scalars and Timestamps natively
+        return orjson.dumps(
+            export_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default
+        ).decode()
+
+    return json.dumps(export_data, indent=2, default=_json_default)
@@ -0,0 +1,327 @@
+"""
+Compiled Fruchterman-Reingold layout for medium and large knowledge graphs.
+Uses Numba when it is installed; HAS_NUMBA is False otherwise.
+"""
+
+import numpy as np
+import networkx as nx
+from scipy import sparse
+from typing import Dict, List, Tuple
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Quadtree cells are not split below this depth; coincident nodes share a leaf
+QUADTREE_MAX_DEPTH = 24
+
+
+if HAS_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _attraction(pos, i, indptr, indices, weights, k):
+        """Weighted attraction d/k pulling node i along its edges."""
+        xi = pos[i, 0]
+        yi = pos[i, 1]
+        fx = 0.0
+        fy = 0.0
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            dx = xi - pos[j, 0]
+            dy = yi - pos[j, 1]
+            d = np.sqrt(dx * dx + dy * dy)
+            if d < 0.01:
+                d = 0.01
+            force = weights[p] * d / k
+            fx -= dx * force
+            fy -= dy * force
+        return fx, fy
+
+    @njit(fastmath=True, cache=True)
+    def _move(pos, displacement, t):
+        """Move each node by at most the temperature t; returns the step norm."""
+        moved = 0.0
+        for i in range(pos.shape[0]):
+            length = np.sqrt(displacement[i, 0] ** 2 + displacement[i, 1] ** 2)
+            if length < 0.01:
+                length = 0.1
+            step_x = displacement[i, 0] * t / length
+            step_y = displacement[i, 1] * t / length
+            pos[i, 0] += step_x
+            pos[i, 1] += step_y
+            moved += step_x * step_x + step_y * step_y
+        return np.sqrt(moved)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fr_iterate(pos, indptr, indices, weights, k, iterations, threshold):
+        """
+        Run Fruchterman-Reingold iterations in place on pos.
+
+        Follows networkx's dense solver (repulsion k^2/d^2 between every pair,
+        weighted attraction d/k along edges, distances clipped at 0.01, linear
+        cooling), but accumulates forces per node instead of materializing the
+        N x N x 2 displacement array. Each node's row is written by one thread
+        only, so the outer loop parallelizes without atomics.
+        """
+        n = pos.shape[0]
+        k2 = k * k
+        t = max(pos[:, 0].max() - pos[:, 0].min(), pos[:, 1].max() - pos[:, 1].min()) * 0.1
+        dt = t / (iterations + 1)
+        displacement = np.zeros_like(pos)
+
+        for _ in range(iterations):
+            for i in prange(n):
+                xi = pos[i, 0]
+                yi = pos[i, 1]
+                dx_sum = 0.0
+                dy_sum = 0.0
+
+                # Repulsion from every other node, in squared distances (no sqrt)
+                for j in range(n):
+                    dx = xi - pos[j, 0]
+                    dy = yi - pos[j, 1]
+                    d2 = dx * dx + dy * dy
+                    if d2 < 1e-4:
+                        d2 = 1e-4
+                    force = k2 / d2
+                    dx_sum += dx * force
+                    dy_sum += dy * force
+
+                fx, fy = _attraction(pos, i, indptr, indices, weights, k)
+                displacement[i, 0] = dx_sum + fx
+                displacement[i, 1] = dy_sum + fy
+
+            moved = _move(pos, displacement, t)
+            t -= dt
+            if moved / n < threshold:
+                break
+
+        return pos
+
+    @njit(fastmath=True, cache=True)
+    def _build_quadtree(pos, children, center, half, mass, com, body):
+        """
+        Insert every node into a quadtree stored in flat arrays.
+
+        Cell 0 is the root; children of a cell always have higher indices, so
+        masses and centers of mass are summed in one reverse pass. Returns the
+        number of cells used, or -1 if the arrays are too small.
+        """
+        n = pos.shape[0]
+        capacity = children.shape[0]
+        x_min = pos[:, 0].min()
+        x_max = pos[:, 0].max()
+        y_min = pos[:, 1].min()
+        y_max = pos[:, 1].max()
+
+        children[0, :] = -1
+        center[0, 0] = (x_min + x_max) / 2
+        center[0, 1] = (y_min + y_max) / 2
+        half[0] = max(x_max - x_min, y_max - y_min) / 2 + 1e-9
+        mass[0] = 0.0
+        com[0, :] = 0.0
+        body[0] = -1
+        n_cells = 1
+
+        for b in range(n):
+            cell = 0
+            depth = 0
+            while True:
+                if body[cell] == -1 and mass[cell] == 0.0 and children[cell, 0] == -1 \
+                        and children[cell, 1] == -1 and children[cell, 2] == -1 and children[cell, 3] == -1:
+                    # Empty leaf (only the root starts out empty)
+                    body[cell] = b
+                    mass[cell] = 1.0
+                    com[cell, 0] = pos[b, 0]
+                    com[cell, 1] = pos[b, 1]
+                    break
+
+                if body[cell] >= 0:
+                    if depth >= QUADTREE_MAX_DEPTH:
+                        # Too deep to separate; treat the leaf as one heavier particle
+                        mass[cell] += 1.0
+                        com[cell, 0] += pos[b, 0]
+                        com[cell, 1] += pos[b, 1]
+                        break
+
+                    # Split the leaf: push its particle(s) down into a child
+                    if n_cells >= capacity:
+                        return -1
+                    resident = body[cell]
+                    quadrant = (pos[resident, 0] >= center[cell, 0]) * 1 + (pos[resident, 1] >= center[cell, 1]) * 2
+                    child = n_cells
+                    n_cells += 1
+                    children[child, :] = -1
+                    half[child] = half[cell] / 2
+                    center[child, 0] = center[cell, 0] + (half[child] if quadrant & 1 else -half[child])
+                    center[child, 1] = center[cell, 1] + (half[child] if quadrant & 2 else -half[child])
+                    body[child] = resident
+                    mass[child] = mass[cell]
+                    com[child, 0] = com[cell, 0]
+                    com[child, 1] = com[cell, 1]
+                    children[cell, quadrant] = child
+                    body[cell] = -1
+                    mass[cell] = 0.0
+                    com[cell, :] = 0.0
+
+                # Internal cell: descend, creating the child if needed
+                quadrant = (pos[b, 0] >= center[cell, 0]) * 1 + (pos[b, 1] >= center[cell, 1]) * 2
+                child = children[cell, quadrant]
+                if child == -1:
+                    if n_cells >= capacity:
+                        return -1
+                    child = n_cells
+                    n_cells += 1
+                    children[child, :] = -1
+                    half[child] = half[cell] / 2
+                    center[child, 0] = center[cell, 0] + (half[child] if quadrant & 1 else -half[child])
+                    center[child, 1] = center[cell, 1] + (half[child] if quadrant & 2 else -half[child])
+                    body[child] = b
+                    mass[child] = 1.0
+                    com[child, 0] = pos[b, 0]
+                    com[child, 1] = pos[b, 1]
+                    children[cell, quadrant] = child
+                    break
+                cell = child
+                depth += 1
+
+        # Leaves hold coordinate sums; total them up the tree, then divide
+        for cell in range(n_cells - 1, -1, -1):
+            if body[cell] == -1:
+                for q in range(4):
+                    child = children[cell, q]
+                    if child != -1:
+                        mass[cell] += mass[child]
+                        com[cell, 0] += com[child, 0]
+                        com[cell, 1] += com[child, 1]
+        for cell in range(n_cells):
+            if mass[cell] > 0:
+                com[cell, 0] /= mass[cell]
+                com[cell, 1] /= mass[cell]
+
+        return n_cells
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fr_iterate_barnes_hut(pos, indptr, indices, weights, k, iterations, threshold, theta):
+        """
+        Fruchterman-Reingold iterations with Barnes-Hut approximate repulsion.
+
+        A quadtree is rebuilt from the current positions every iteration; a cell
+        whose width is small relative to its distance (width / d < theta) repels
+        as a single particle at its center of mass, so each node visits
+        O(log N) cells instead of N nodes. Attraction and cooling are the same
+        as _fr_iterate.
+        """
+        n = pos.shape[0]
+        k2 = k * k
+        theta2 = theta * theta
+        t = max(pos[:, 0].max() - pos[:, 0].min(), pos[:, 1].max() - pos[:, 1].min()) * 0.1
+        dt = t / (iterations + 1)
+        displacement = np.zeros_like(pos)
+
+        capacity = 4 * n + 64
+        children = np.empty((capacity, 4), dtype=np.int64)
+        center = np.empty((capacity, 2))
+        half = np.empty(capacity)
+        mass = np.empty(capacity)
+        com = np.empty((capacity, 2))
+        body = np.empty(capacity, dtype=np.int64)
+
+        for _ in range(iterations):
+            n_cells = _build_quadtree(pos, children, center, half, mass, com, body)
+            while n_cells < 0:
+                capacity *= 2
+                children = np.empty((capacity, 4), dtype=np.int64)
+                center = np.empty((capacity, 2))
+                half = np.empty(capacity)
+                mass = np.empty(capacity)
+                com = np.empty((capacity, 2))
+                body = np.empty(capacity, dtype=np.int64)
+                n_cells = _build_quadtree(pos, children, center, half, mass, com, body)
+
+            for i in prange(n):
+                xi = pos[i, 0]
+                yi = pos[i, 1]
+                dx_sum = 0.0
+                dy_sum = 0.0
+
+                stack = np.empty(4 * QUADTREE_MAX_DEPTH + 4, dtype=np.int64)
+                stack[0] = 0
+                top = 1
+                while top > 0:
+                    top -= 1
+                    cell = stack[top]
+                    if body[cell] == i and mass[cell] == 1.0:
+                        continue
+                    dx = xi - com[cell, 0]
+                    dy = yi - com[cell, 1]
+                    d2 = dx * dx + dy * dy
+                    width = 2 * half[cell]
+                    if body[cell] >= 0 or width * width < theta2 * d2:
+                        if d2 < 1e-4:
+                            d2 = 1e-4
+                        force = mass[cell] * k2 / d2
+                        dx_sum += dx * force
+                        dy_sum += dy * force
+                    else:
+                        for q in range(4):
+                            child = children[cell, q]
+                            if child != -1:
+                                stack[top] = child
+                                top += 1
+
+                fx, fy = _attraction(pos, i, indptr, indices, weights, k)
+                displacement[i, 0] = dx_sum + fx
+                displacement[i, 1] = dy_sum + fy
+
+            moved = _move(pos, displacement, t)
+            t -= dt
+            if moved / n < threshold:
+                break
+
+        return pos
+
+
+def fruchterman_reingold_layout(
+    adjacency: sparse.csr_matrix,
+    nodes: List,
+    initial: np.ndarray,
+    k: float,
+    iterations: int,
+    scale: float,
+    barnes_hut: bool = False,
+    theta: float = 0.9
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Force-directed layout equivalent to nx.spring_layout, run by the Numba kernels.
+
+    Args:
+        adjacency: Weighted adjacency matrix in the order of nodes
+        nodes: Node order matching the rows of adjacency and initial
+        initial: Starting positions, shape (len(nodes), 2)
+        k: Optimal distance between nodes
+        iterations: Maximum number of iterations
+        scale: Scale factor for the returned positions
+        barnes_hut: Approximate repulsion with a quadtree (for large graphs)
+        theta: Barnes-Hut opening angle; larger is faster and coarser
+
+    Returns:
+        Dictionary mapping node names to (x, y) positions
+    """
+    adjacency = sparse.csr_matrix(adjacency, dtype=np.float64)
+    args = (
+        np.array(initial, dtype=np.float64),
+        adjacency.indptr.astype(np.int64),
+        adjacency.indices.astype(np.int64),
+        adjacency.data,
+        float(k),
+        int(iterations),
+        1e-4
+    )
+    if barnes_hut:
+        pos = _fr_iterate_barnes_hut(*args, float(theta))
+    else:
+        pos = _fr_iterate(*args)
+    pos = nx.rescale_layout(pos, scale=scale)
+    return dict(zip(nodes, pos))
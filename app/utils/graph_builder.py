@@ -8,8 +8,15 @@ import networkx as nx
 import plotly.graph_objects as go
 from typing import List, Dict, Tuple, Optional
 import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import svds
 import streamlit as st
 
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -20,8 +27,52 @@ from config import (
     MAX_GRAPH_NODES,
     COLORS
 )
+from utils.fr_layout import HAS_NUMBA, fruchterman_reingold_layout
+
+# Graphs with more nodes than this use igraph's compiled layout when it is installed
+IGRAPH_LAYOUT_MIN_NODES = 200
+
+# Node counts laid out by the exact Numba kernel when Numba is installed;
+# larger graphs use its Barnes-Hut variant
+NUMBA_LAYOUT_NODE_RANGE = (500, 2000)
+
+# Above this many nodes, betweenness centrality is computed by igraph or from this many sampled sources
+BETWEENNESS_SAMPLE_SIZE = 500
+
+# Adjacency exports below this edge density are returned as sparse DataFrames
+ADJACENCY_SPARSE_DENSITY = 0.1
+
+
+# Common words to filter out from knowledge graph connections
+_STOPWORDS = frozenset({
+    # Common articles, prepositions, conjunctions
+    'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can',
+    # Common general words
+    'data', 'analysis', 'study', 'research', 'using', 'based', 'method',
+    'methods', 'approach', 'approaches', 'model', 'models', 'system',
+    'systems', 'tool', 'tools', 'use', 'used', 'uses', 'application',
+    'applications', 'code', 'software', 'program', 'programs', 'package',
+    'packages', 'library', 'libraries', 'framework', 'frameworks',
+    # Short words (likely not meaningful)
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+    'vs', 'etc', 'eg', 'ie'
+})
 
+# Text-heavy fields (summaries, descriptions, etc.) whose values get stopwords removed
+_TEXT_FIELDS = ('Code Summary', 'Summary', 'Description', 'Abstract',
+                'Languages', 'Tools/Packages', 'Tooling', 'Data Types',
+                'FAIR Issues', 'Biomedical Relevance')
 
+
+def _graph_cache_key(G: nx.Graph) -> int:
+    """Cache key for a graph: its nodes and weighted edges, in order."""
+    return hash((tuple(G.nodes()), tuple(G.edges(data="weight"))))
+
+
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
 def build_knowledge_graph(
     df: pd.DataFrame,
     connection_features: List[str],
@@ -32,6 +83,10 @@ def build_knowledge_graph(
     """
     Build a knowledge graph from a DataFrame based on shared features.
 
+    Cached with st.cache_resource, so reruns with the same inputs get the same
+    graph object back: treat it as read-only (filter_graph_by_degree returns
+    a new graph).
+
     Args:
         df: DataFrame containing the data
         connection_features: List of column names to use for creating connections
@@ -46,93 +101,152 @@ def build_knowledge_graph(
 
     # Note: No size limit - graph construction is fast enough for full datasets
 
-    # Add nodes
-    for idx, row in df.iterrows():
-        node_name = row.get(name_column, f"Item_{idx}")
+    # Add nodes, reading rows straight from the values array rather than
+    # boxing each one into a Series with iterrows()
+    columns = df.columns.tolist()
+    df_values = df.to_numpy()
+    name_position = columns.index(name_column) if name_column in columns else None
+    node_names = []
 
-        # Create node attributes
-        attributes = {
-            "index": idx,
-            "label": node_name
-        }
+    def node_entries():
+        for idx, row_values in zip(df.index, df_values):
+            node_name = row_values[name_position] if name_position is not None else f"Item_{idx}"
+            node_names.append(node_name)
+
+            # Create node attributes
+            attributes = {
+                "index": idx,
+                "label": node_name
+            }
+
+            # Add all row data as attributes
+            attributes.update(zip(columns, row_values))
 
-        # Add all row data as attributes
-        for col in df.columns:
-            attributes[col] = row[col]
+            yield node_name, attributes
 
-        G.add_node(node_name, **attributes)
+    G.add_nodes_from(node_entries())
 
     # Add edges based on shared features
     nodes = list(G.nodes())
-
-    for i, node1 in enumerate(nodes):
-        for node2 in nodes[i + 1:]:
-            # Check for shared features
-            shared_features = []
-
-            for feature in connection_features:
-                if feature not in df.columns:
-                    continue
-
-                # Get values for both nodes
-                val1 = G.nodes[node1].get(feature, "")
-                val2 = G.nodes[node2].get(feature, "")
-
-                # Determine if stopwords should be removed for this feature
-                # Apply to text-heavy fields like summaries, descriptions, etc.
-                text_fields = ['Code Summary', 'Summary', 'Description', 'Abstract',
-                              'Languages', 'Tools/Packages', 'Tooling', 'Data Types',
-                              'FAIR Issues', 'Biomedical Relevance']
-                remove_stopwords = any(field in feature for field in text_fields)
-
-                # Parse multi-value fields
-                items1 = set(parse_delimited_field(val1, delimiter, remove_stopwords=remove_stopwords))
-                items2 = set(parse_delimited_field(val2, delimiter, remove_stopwords=remove_stopwords))
-
-                # Find intersection
-                shared = items1.intersection(items2)
-
-                if shared:
-                    shared_features.append({
-                        "feature": feature,
-                        "shared_values": list(shared)
-                    })
-
-            # Add edge only if minimum shared features threshold is met
-            if len(shared_features) >= min_shared_features:
-                G.add_edge(
-                    node1,
-                    node2,
-                    weight=len(shared_features),
-                    shared_features=shared_features
-                )
+    n_nodes = len(nodes)
+    features = [feature for feature in connection_features if feature in df.columns]
+
+    # Row of df_values behind each node, so feature values are read by
+    # position instead of through G.nodes[node]. A repeated name keeps its last
+    # row, matching the attributes add_nodes_from left on the node
+    last_row = {}
+    for position, node_name in enumerate(node_names):
+        last_row[node_name] = position
+    node_rows = [last_row[node] for node in nodes]
+    column_positions = {col: position for position, col in enumerate(columns)}
+
+    # Parse every node's values once per feature, then find the pairs sharing at
+    # least one value through a sparse node x value incidence matrix (M @ M.T)
+    # instead of comparing every pair of nodes in Python. Each pair's shared
+    # features are kept as a bitset, bit b set if it shares features[b]
+    parsed = []
+    shared_bits = sparse.csr_matrix((n_nodes, n_nodes), dtype=np.int64)
+
+    for bit, feature in enumerate(features):
+        # Determine if stopwords should be removed for this feature
+        remove_stopwords = any(field in feature for field in _TEXT_FIELDS)
+
+        # Parse multi-value fields, once per distinct cell value
+        parsed_values = {}
+        items = []
+        for value in df_values[node_rows, column_positions[feature]]:
+            if isinstance(value, str):
+                if value not in parsed_values:
+                    parsed_values[value] = frozenset(parse_delimited_field(value, delimiter, remove_stopwords=remove_stopwords))
+                items.append(parsed_values[value])
+            else:
+                items.append(frozenset(parse_delimited_field(value, delimiter, remove_stopwords=remove_stopwords)))
+        parsed.append(items)
+
+        vocabulary = {}
+        rows, cols = [], []
+        for i, values in enumerate(items):
+            for value in values:
+                rows.append(i)
+                cols.append(vocabulary.setdefault(value, len(vocabulary)))
+
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(n_nodes, len(vocabulary))
+        )
+        # Upper triangle only: each unordered pair once, no self-pairs
+        shares_value = sparse.triu(incidence @ incidence.T, k=1).tocsr().astype(np.int64)
+        shares_value.data[:] = 1 << bit
+        shared_bits = shared_bits + shares_value
+
+    # Candidate pairs in the same (i, j) order the pairwise loop produced
+    if min_shared_features > 0:
+        shared_bits = shared_bits.tocoo()
+        n_shared = sum((shared_bits.data >> bit) & 1 for bit in range(len(features)))
+        keep = n_shared >= min_shared_features
+        pair_rows, pair_cols, pair_bits = shared_bits.row[keep], shared_bits.col[keep], shared_bits.data[keep]
+        order = np.lexsort((pair_cols, pair_rows))
+        pair_rows, pair_cols, pair_bits = pair_rows[order], pair_cols[order], pair_bits[order]
+    else:
+        # Every pair meets a non-positive threshold
+        pair_rows, pair_cols = np.triu_indices(n_nodes, k=1)
+        pair_bits = np.asarray(shared_bits[pair_rows, pair_cols]).ravel()
+
+    # Generated intersection kernel per bitset of shared features
+    kernels = {}
+
+    def edge_entries():
+        for i, j, bits in zip(pair_rows.tolist(), pair_cols.tolist(), pair_bits.tolist()):
+            if bits not in kernels:
+                kernels[bits] = _shared_features_kernel(features, parsed, bits)
+            shared_features = kernels[bits](i, j)
+
+            yield nodes[i], nodes[j], {"weight": len(shared_features), "shared_features": shared_features}
+
+    G.add_edges_from(edge_entries())
 
     return G
 
 
-def get_stopwords() -> set:
+def _shared_features_kernel(features: List[str], parsed: List[List[frozenset]], bits: int):
+    """
+    Generate a function returning the shared_features list for one pair of rows.
+
+    The features set in bits are unrolled into a single list display with each
+    feature name and parsed column bound as a constant, so building an edge runs
+    no per-feature loop, tuple unpacking or bit test.
+
+    Args:
+        features: Connection features, in bit order
+        parsed: Parsed item sets per feature, indexed by row position
+        bits: Bitset of the features the pair shares
+
+    Returns:
+        Function (i, j) -> list of {"feature", "shared_values"} dicts
+    """
+    namespace = {}
+    entries = []
+    for bit, feature in enumerate(features):
+        if bits >> bit & 1:
+            namespace[f"feature_{bit}"] = feature
+            namespace[f"items_{bit}"] = parsed[bit]
+            entries.append(
+                f'{{"feature": feature_{bit}, "shared_values": list(items_{bit}[i].intersection(items_{bit}[j]))}}'
+            )
+
+    source = f"def shared_features(i, j):\n    return [{', '.join(entries)}]\n"
+    exec(source, namespace)
+    return namespace["shared_features"]
+
+
+def get_stopwords() -> frozenset:
     """
     Get common words to filter out from knowledge graph connections.
 
     Returns:
         Set of stopwords
     """
-    return {
-        # Common articles, prepositions, conjunctions
-        'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'should', 'could', 'may', 'might', 'must', 'can',
-        # Common general words
-        'data', 'analysis', 'study', 'research', 'using', 'based', 'method',
-        'methods', 'approach', 'approaches', 'model', 'models', 'system',
-        'systems', 'tool', 'tools', 'use', 'used', 'uses', 'application',
-        'applications', 'code', 'software', 'program', 'programs', 'package',
-        'packages', 'library', 'libraries', 'framework', 'frameworks',
-        # Short words (likely not meaningful)
-        'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
-        'vs', 'etc', 'eg', 'ie'
-    }
+    return _STOPWORDS
 
 
 def parse_delimited_field(field: str, delimiter: str = ";", remove_stopwords: bool = False) -> List[str]:
@@ -150,16 +264,18 @@ def parse_delimited_field(field: str, delimiter: str = ";", remove_stopwords: bo
     if not field or pd.isna(field) or field == "":
         return []
 
-    items = [item.strip() for item in str(field).split(delimiter)]
+    # Intern the items so equal values across rows share one string object,
+    # which keeps token sets small and lets set intersections compare by identity
+    items = [sys.intern(item.strip()) for item in str(field).split(delimiter)]
     items = [item for item in items if item]
 
     if remove_stopwords:
-        stopwords = get_stopwords()
-        items = [item for item in items if item.lower() not in stopwords and len(item) > 2]
+        items = [item for item in items if item.lower() not in _STOPWORDS and len(item) > 2]
 
     return items
 
 
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False, hash_funcs={nx.Graph: _graph_cache_key})
 def calculate_graph_layout(G: nx.Graph) -> Dict[str, Tuple[float, float]]:
     """
     Calculate node positions for graph visualization.
@@ -174,11 +290,46 @@ def calculate_graph_layout(G: nx.Graph) -> Dict[str, Tuple[float, float]]:
     if len(G.nodes()) == 0:
         return {}
 
-    # Use spring layout with custom parameters
+    nodes = list(G.nodes())
+    adjacency = weighted_adjacency(G, nodes)
+    initial = _initial_layout(adjacency, seed=42)
+
+    # Large graphs get fewer iterations; each one is quadratic in the node count
+    iterations = min(GRAPH_LAYOUT_SETTINGS["iterations"], max(10, 100000 // len(nodes)))
+
+    if HAS_NUMBA and len(nodes) >= NUMBA_LAYOUT_NODE_RANGE[0]:
+        # Same algorithm as networkx's dense solver, compiled, without its N x N
+        # arrays; past the range, repulsion is approximated with a quadtree
+        return fruchterman_reingold_layout(
+            adjacency,
+            nodes,
+            initial,
+            k=GRAPH_LAYOUT_SETTINGS["k"],
+            iterations=iterations,
+            scale=GRAPH_LAYOUT_SETTINGS["scale"],
+            barnes_hut=len(nodes) > NUMBA_LAYOUT_NODE_RANGE[1]
+        )
+
+    if igraph is not None and len(nodes) > IGRAPH_LAYOUT_MIN_NODES:
+        # igraph's Fruchterman-Reingold runs in C; build it from the edge list
+        # only, since igraph.Graph.from_networkx would copy every node attribute
+        node_index = {node: i for i, node in enumerate(nodes)}
+        edges = list(G.edges(data="weight", default=1))
+        ig_graph = igraph.Graph(n=len(nodes), edges=[(node_index[u], node_index[v]) for u, v, _ in edges])
+        layout = ig_graph.layout_fruchterman_reingold(
+            weights=[weight for _, _, weight in edges] if edges else None,
+            niter=iterations,
+            seed=initial.tolist()
+        )
+        coords = nx.rescale_layout(np.array(layout.coords), scale=GRAPH_LAYOUT_SETTINGS["scale"])
+        return dict(zip(nodes, coords))
+
+    # Use spring layout with custom parameters, warm-started from the spectral positions
     pos = nx.spring_layout(
         G,
         k=GRAPH_LAYOUT_SETTINGS["k"],
-        iterations=GRAPH_LAYOUT_SETTINGS["iterations"],
+        pos=dict(zip(nodes, initial)),
+        iterations=iterations,
         scale=GRAPH_LAYOUT_SETTINGS["scale"],
         seed=42  # For reproducibility
     )
@@ -186,6 +337,73 @@ def calculate_graph_layout(G: nx.Graph) -> Dict[str, Tuple[float, float]]:
     return pos
 
 
+def _initial_layout(adjacency: sparse.csr_matrix, seed: int = 42) -> np.ndarray:
+    """
+    Starting positions for the force-directed layout, taken from the two leading
+    singular vectors of the adjacency matrix so connected nodes start close together.
+
+    Args:
+        adjacency: Weighted adjacency matrix; rows give the node order
+        seed: Seed for the jitter that separates nodes the SVD places together
+
+    Returns:
+        Array of shape (number of nodes, 2) with positions in [0, 1]
+    """
+    n_nodes = adjacency.shape[0]
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1, size=(n_nodes, 2))
+
+    if n_nodes < 4 or adjacency.nnz == 0:
+        return positions
+
+    try:
+        u, s, _ = svds(adjacency, k=2, v0=rng.uniform(0, 1, size=n_nodes))
+    except Exception:
+        return positions
+
+    spectral = u * s
+    spread = spectral.max(axis=0) - spectral.min(axis=0)
+    spread[spread == 0] = 1
+    spectral = (spectral - spectral.min(axis=0)) / spread
+
+    # Isolated nodes and small components all land near the same point, so keep
+    # part of the random start to pull them apart
+    return 0.8 * spectral + 0.2 * positions
+
+
+def weighted_adjacency(G: nx.Graph, nodes: List) -> sparse.csr_matrix:
+    """
+    Build the symmetric edge-weight adjacency matrix of an undirected graph.
+    Equivalent to nx.to_scipy_sparse_array(G, nodelist=nodes, weight="weight"),
+    which is several times slower on graphs with many edges.
+
+    Args:
+        G: NetworkX graph
+        nodes: Node order for the rows and columns
+
+    Returns:
+        CSR matrix of float edge weights (1 for edges without a weight)
+    """
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array(
+        [(node_index[u], node_index[v], weight) for u, v, weight in G.edges(data="weight", default=1)],
+        dtype=float
+    ).reshape(-1, 3)
+    rows = edges[:, 0].astype(np.int64)
+    cols = edges[:, 1].astype(np.int64)
+    weights = edges[:, 2]
+
+    # Mirror every edge except self-loops, which sit on the diagonal once
+    mirrored = rows != cols
+    return sparse.csr_matrix(
+        (
+            np.concatenate([weights, weights[mirrored]]),
+            (np.concatenate([rows, cols[mirrored]]), np.concatenate([cols, rows[mirrored]]))
+        ),
+        shape=(len(nodes), len(nodes))
+    )
+
+
 def create_interactive_graph(
     G: nx.Graph,
     title: str = "Knowledge Graph",
@@ -220,8 +438,9 @@ def create_interactive_graph(
     degrees = dict(G.degree())
     max_degree = max(degrees.values()) if degrees and max(degrees.values()) > 0 else 1
 
-    # Create edge traces
-    edge_traces = []
+    # Create edge traces: one WebGL trace per edge width, with each edge's
+    # segment separated by None, instead of one trace per edge
+    edges_by_width = {}
 
     for edge in G.edges(data=True):
         node1, node2, data = edge
@@ -245,9 +464,15 @@ def create_interactive_graph(
                 shared_vals += f" (+{len(sf['shared_values'])-2} more)"
             hover_text += f"{sf['feature']}: {shared_vals}<br>"
 
-        edge_trace = go.Scatter(
-            x=[x0, x1, None],
-            y=[y0, y1, None],
+        edge_x, edge_y, edge_text = edges_by_width.setdefault(edge_width, ([], [], []))
+        edge_x.extend((x0, x1, None))
+        edge_y.extend((y0, y1, None))
+        edge_text.extend((hover_text, hover_text, None))
+
+    edge_traces = [
+        go.Scattergl(
+            x=edge_x,
+            y=edge_y,
             mode='lines',
             line=dict(
                 width=edge_width,
@@ -255,152 +480,34 @@ def create_interactive_graph(
             ),
             opacity=GRAPH_EDGE_SETTINGS["edge_opacity"],
             hoverinfo='text',
-            text=hover_text,
+            text=edge_text,
             showlegend=False
         )
-        edge_traces.append(edge_trace)
+        for edge_width, (edge_x, edge_y, edge_text) in sorted(edges_by_width.items())
+    ]
 
     # Create node trace
-    node_x = []
-    node_y = []
-    node_text = []
-    node_size = []
-    node_color = []
-
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-
-        # Node info for hover
-        node_attrs = G.nodes[node]
-
-        # Detect node type: publication, code repository, or dataset
-        is_publication = 'Title' in node_attrs and 'Authors' in node_attrs
-        is_code_repo = 'Repository Link' in node_attrs and 'Languages' in node_attrs
-
-        if is_code_repo:
-            # Code repository hover info: Repo name, Link, Languages, FAIR Issues
-            repo_name = node
-            hover_text = f"<b>{repo_name}</b><br>"
-
-            # Add repository link
-            repo_link = node_attrs.get('Repository Link', '')
-            if repo_link and str(repo_link).strip():
-                hover_text += f"Link: {repo_link}<br>"
-
-            # Add languages
-            languages = str(node_attrs.get('Languages', ''))
-            if languages:
-                if len(languages) > 50:
-                    languages = languages[:47] + "..."
-                hover_text += f"Languages: {languages}<br>"
-
-            # Add FAIR Score if present
-            fair_score = node_attrs.get('FAIR Score', '')
-            if fair_score and str(fair_score).strip():
-                hover_text += f"FAIR Score: {fair_score}/10<br>"
-
-            # Add FAIR issues if present
-            fair_issues = str(node_attrs.get('FAIR Issues', ''))
-            if fair_issues and fair_issues.strip():
-                if len(fair_issues) > 60:
-                    fair_issues = fair_issues[:57] + "..."
-                hover_text += f"FAIR Issues: {fair_issues}<br>"
-
-            # Add other key attributes
-            for key in ['Resource Name', 'Data Types', 'Tooling']:
-                if key in node_attrs and node_attrs[key]:
-                    value = str(node_attrs[key])
-                    if len(value) > 50:
-                        value = value[:47] + "..."
-                    hover_text += f"{key}: {value}<br>"
-
-        elif is_publication:
-            # Publication hover info: Title, Authors (truncated), Link
-            title = node_attrs.get('Title', node)
-            hover_text = f"<b>{title}</b><br>"
-
-            # Add truncated author list
-            authors = str(node_attrs.get('Authors', ''))
-            if authors:
-                author_list = authors.split(';')
-                if len(author_list) > 3:
-                    truncated_authors = '; '.join(author_list[:3]) + f' (+{len(author_list)-3} more)'
-                else:
-                    truncated_authors = authors
-                hover_text += f"Authors: {truncated_authors}<br>"
-
-            # Add PMC link if available
-            pmc_link = node_attrs.get('PubMed Central Link', '')
-            if pmc_link and str(pmc_link).strip():
-                hover_text += f"Link: {pmc_link}<br>"
-
-            # Add key publication attributes
-            for key in ['Resource Name', 'Diseases Included']:
-                if key in node_attrs and node_attrs[key]:
-                    value = str(node_attrs[key])
-                    if len(value) > 60:
-                        value = value[:57] + "..."
-                    hover_text += f"{key}: {value}<br>"
-        else:
-            # Dataset hover info (original behavior)
-            hover_text = f"<b>{node}</b><br>"
-            for key in ['Abbreviation', 'Diseases Included', 'Coarse Data Modality', 'FAIR Compliance Notes']:
-                if key in node_attrs and node_attrs[key]:
-                    value = str(node_attrs[key])
-                    # Truncate long values
-                    if len(value) > 80:
-                        value = value[:77] + "..."
-                    hover_text += f"{key}: {value}<br>"
-
-        # Add connection count
-        degree = degrees[node]
-        hover_text += f"Connections: {degree}"
-
-        node_text.append(hover_text)
-
-        # Node size based on connections
-        size = GRAPH_NODE_SETTINGS["node_size_min"] + (
-            (degree / max_degree) *
-            (GRAPH_NODE_SETTINGS["node_size_max"] - GRAPH_NODE_SETTINGS["node_size_min"])
-        )
-        node_size.append(size)
-
-        # Color based on specified attribute
-        if color_by == "completeness":
-            # Color by data completeness (0-100%)
-            completeness = node_attrs.get('Data Completeness', 50)  # Default to 50% if not found
-            color_value = completeness / 100 * 3  # Scale to 0-3 range
-        elif is_code_repo and 'FAIR Score' in node_attrs:
-            # For code repositories, use numeric FAIR Score (0-10)
-            fair_score = node_attrs.get('FAIR Score', 5)
-            try:
-                fair_score = float(fair_score)
-                color_value = (fair_score / 10) * 3  # Scale 0-10 to 0-3 range
-            except (ValueError, TypeError):
-                color_value = 1.5  # Default if score is invalid
-        else:
-            # Color based on FAIR compliance keywords (default for datasets)
-            fair_notes = node_attrs.get('FAIR Compliance Notes', '').lower()
-            if 'strong' in fair_notes or 'excellent' in fair_notes:
-                color_value = 3  # Dark green
-            elif 'good' in fair_notes:
-                color_value = 2  # Medium green
-            elif 'moderate' in fair_notes or 'fair' in fair_notes:
-                color_value = 1  # Light green
-            elif 'limited' in fair_notes or 'poor' in fair_notes or 'weak' in fair_notes:
-                color_value = 0  # Very light/yellow
-            else:
-                color_value = 1.5  # Default/unknown
-        node_color.append(color_value)
+    nodes = list(G.nodes())
+    node_pos = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    node_x = node_pos[:, 0]
+    node_y = node_pos[:, 1]
+    node_text = _build_hover_text(G, nodes, degrees)
+    node_color = _node_color_values(G, nodes, color_by)
+
+    # Node size based on connections
+    node_degree = np.fromiter((degrees[node] for node in nodes), dtype=float, count=len(nodes))
+    node_size = GRAPH_NODE_SETTINGS["node_size_min"] + (
+        (node_degree / max_degree) *
+        (GRAPH_NODE_SETTINGS["node_size_max"] - GRAPH_NODE_SETTINGS["node_size_min"])
+    )
 
-    node_trace = go.Scatter(
+    # WebGL node trace; hover strings go through customdata/hovertemplate
+    node_trace = go.Scattergl(
         x=node_x,
         y=node_y,
         mode='markers',
-        hoverinfo='text',
-        text=node_text,
+        customdata=np.array(node_text, dtype=object).reshape(-1, 1),
+        hovertemplate='%{customdata[0]}<extra></extra>',
         marker=dict(
             size=node_size,
             color=node_color,
@@ -453,6 +560,163 @@ def create_interactive_graph(
     return fig
 
 
+def _node_color_values(G: nx.Graph, nodes: List, color_by: str) -> np.ndarray:
+    """
+    Compute the 0-3 color value of every node in one vectorized pass.
+
+    Args:
+        G: NetworkX graph
+        nodes: Node order for the returned array
+        color_by: "completeness" or "fair_compliance"
+
+    Returns:
+        Array of color values, one per node
+    """
+    node_attrs = [G.nodes[node] for node in nodes]
+    frame = pd.DataFrame(node_attrs, columns=['Data Completeness', 'FAIR Score', 'FAIR Compliance Notes'], dtype=object)
+
+    if color_by == "completeness":
+        # Color by data completeness (0-100%), default to 50% if not found
+        completeness = pd.to_numeric(frame['Data Completeness'], errors='coerce').fillna(50)
+        return completeness.to_numpy(dtype=float) / 100 * 3  # Scale to 0-3 range
+
+    # Color based on FAIR compliance keywords (default for datasets); one
+    # regex pass per level, checked in priority order
+    notes = frame['FAIR Compliance Notes'].fillna('').astype(str).str.lower()
+    color_value = np.select(
+        [
+            notes.str.contains('strong|excellent', regex=True).to_numpy(),   # Dark green
+            notes.str.contains('good', regex=False).to_numpy(),               # Medium green
+            notes.str.contains('moderate|fair', regex=True).to_numpy(),       # Light green
+            notes.str.contains('limited|poor|weak', regex=True).to_numpy(),   # Very light/yellow
+        ],
+        [3.0, 2.0, 1.0, 0.0],
+        default=1.5  # Default/unknown
+    )
+
+    # For code repositories, use numeric FAIR Score (0-10)
+    has_fair_score = np.array(
+        ['Repository Link' in attrs and 'Languages' in attrs and 'FAIR Score' in attrs for attrs in node_attrs],
+        dtype=bool
+    )
+    if has_fair_score.any():
+        fair_score = pd.to_numeric(frame['FAIR Score'], errors='coerce').to_numpy(dtype=float)
+        score_color = np.where(np.isnan(fair_score), 1.5, fair_score / 10 * 3)  # 1.5 if score is invalid
+        color_value = np.where(has_fair_score, score_color, color_value)
+
+    return color_value
+
+
+def _truncate(values: pd.Series, max_length: int) -> pd.Series:
+    """Cut strings longer than max_length down to max_length - 3 characters plus "..."."""
+    return values.where(values.str.len() <= max_length, values.str.slice(0, max_length - 3) + "...")
+
+
+def _hover_line(
+    frame: pd.DataFrame,
+    key: str,
+    max_length: Optional[int] = None,
+    label: Optional[str] = None,
+    suffix: str = "",
+    hide_zero: bool = False
+) -> pd.Series:
+    """
+    Format one hover line per node, "label: value<br>", or "" where the value is empty.
+
+    Args:
+        frame: Node attributes, one row per node
+        key: Attribute to show
+        max_length: Truncate longer values (None to keep them whole)
+        label: Label to show instead of the attribute name
+        suffix: Text to append after the value
+        hide_zero: Treat a value of 0 as empty (e.g. an unscored FAIR Score)
+
+    Returns:
+        Series of hover lines aligned with frame
+    """
+    values = frame[key].astype(str)
+    if max_length is not None:
+        values = _truncate(values, max_length)
+    present = frame[key].notna() & values.str.strip().ne("")
+    if hide_zero:
+        present &= frame[key].ne(0)
+    return (f"{label or key}: " + values + f"{suffix}<br>").where(present, "")
+
+
+def _build_hover_text(G: nx.Graph, nodes: List, degrees: Dict) -> List[str]:
+    """
+    Build the hover text for every node with pandas string operations,
+    branching once per node type (code repository, publication, dataset)
+    instead of once per node.
+
+    Args:
+        G: NetworkX graph
+        nodes: Node order for the returned list
+        degrees: Mapping of node to number of connections
+
+    Returns:
+        List of HTML hover strings, one per node
+    """
+    keys = ['Repository Link', 'Languages', 'FAIR Score', 'FAIR Issues', 'Resource Name', 'Data Types',
+            'Tooling', 'Title', 'Authors', 'PubMed Central Link', 'Diseases Included', 'Abbreviation',
+            'Coarse Data Modality', 'FAIR Compliance Notes']
+    node_attrs = [G.nodes[node] for node in nodes]
+    frame = pd.DataFrame(node_attrs, columns=keys, dtype=object)
+    names = pd.Series(nodes, dtype=object).astype(str)
+
+    # Detect node type: publication, code repository, or dataset
+    is_code_repo = np.array(['Repository Link' in attrs and 'Languages' in attrs for attrs in node_attrs], dtype=bool)
+    is_publication = np.array(['Title' in attrs and 'Authors' in attrs for attrs in node_attrs], dtype=bool) & ~is_code_repo
+    is_dataset = ~(is_code_repo | is_publication)
+
+    hover_text = pd.Series("", index=frame.index, dtype=object)
+
+    if is_code_repo.any():
+        # Code repository hover info: Repo name, Link, Languages, FAIR Issues
+        repos = frame[is_code_repo]
+        hover_text[is_code_repo] = (
+            "<b>" + names[is_code_repo] + "</b><br>"
+            + _hover_line(repos, 'Repository Link', label='Link')
+            + _hover_line(repos, 'Languages', 50)
+            + _hover_line(repos, 'FAIR Score', suffix='/10', hide_zero=True)
+            + _hover_line(repos, 'FAIR Issues', 60)
+            + _hover_line(repos, 'Resource Name', 50)
+            + _hover_line(repos, 'Data Types', 50)
+            + _hover_line(repos, 'Tooling', 50)
+        )
+
+    if is_publication.any():
+        # Publication hover info: Title, Authors (truncated), Link
+        pubs = frame[is_publication]
+        titles = pubs['Title'].where(pubs['Title'].notna(), names[is_publication])
+        author_lists = pubs['Authors'].astype(str).str.split(';')
+        authors = author_lists.str[:3].str.join('; ') + ' (+' + (author_lists.str.len() - 3).astype(str) + ' more)'
+        authors = authors.where(author_lists.str.len() > 3, pubs['Authors'].astype(str))
+        hover_text[is_publication] = (
+            "<b>" + titles.astype(str) + "</b><br>"
+            + _hover_line(pubs.assign(Authors=authors), 'Authors')
+            + _hover_line(pubs, 'PubMed Central Link', label='Link')
+            + _hover_line(pubs, 'Resource Name', 60)
+            + _hover_line(pubs, 'Diseases Included', 60)
+        )
+
+    if is_dataset.any():
+        # Dataset hover info (original behavior)
+        datasets = frame[is_dataset]
+        hover_text[is_dataset] = (
+            "<b>" + names[is_dataset] + "</b><br>"
+            + _hover_line(datasets, 'Abbreviation', 80)
+            + _hover_line(datasets, 'Diseases Included', 80)
+            + _hover_line(datasets, 'Coarse Data Modality', 80)
+            + _hover_line(datasets, 'FAIR Compliance Notes', 80)
+        )
+
+    # Add connection count
+    connections = [f"Connections: {degrees[node]}" for node in nodes]
+    return (hover_text + connections).tolist()
+
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False, hash_funcs={nx.Graph: _graph_cache_key})
 def get_graph_statistics(G: nx.Graph) -> Dict[str, any]:
     """
     Calculate statistics for a knowledge graph.
@@ -505,8 +769,16 @@ def export_adjacency_matrix(G: nx.Graph) -> pd.DataFrame:
     if len(G.nodes()) == 0:
         return pd.DataFrame()
 
-    # Get adjacency matrix
-    adj_matrix = nx.to_pandas_adjacency(G)
+    # Get adjacency matrix without materializing a dense N x N array for
+    # sparse graphs (most knowledge graphs here)
+    nodes = list(G.nodes())
+    n_nodes = len(nodes)
+    matrix = weighted_adjacency(G, nodes)
+
+    if matrix.nnz / (n_nodes * n_nodes) < ADJACENCY_SPARSE_DENSITY:
+        adj_matrix = pd.DataFrame.sparse.from_spmatrix(matrix, index=nodes, columns=nodes)
+    else:
+        adj_matrix = pd.DataFrame(matrix.toarray(), index=nodes, columns=nodes)
 
     return adj_matrix
 
@@ -524,25 +796,22 @@ def get_edge_details(G: nx.Graph) -> pd.DataFrame:
     if len(G.edges()) == 0:
         return pd.DataFrame()
 
-    edge_data = []
-
-    for node1, node2, data in G.edges(data=True):
-        shared_features = data.get('shared_features', [])
+    # Build the columns directly rather than one dict per edge
+    edges = list(G.edges(data=True))
 
+    return pd.DataFrame({
+        "Node 1": [node1 for node1, _, _ in edges],
+        "Node 2": [node2 for _, node2, _ in edges],
+        "Weight": [data.get('weight', 1) for _, _, data in edges],
         # Format shared features
-        features_str = "; ".join([
-            f"{sf['feature']}: {', '.join(sf['shared_values'])}"
-            for sf in shared_features
-        ])
-
-        edge_data.append({
-            "Node 1": node1,
-            "Node 2": node2,
-            "Weight": data.get('weight', 1),
-            "Shared Features": features_str
-        })
-
-    return pd.DataFrame(edge_data)
+        "Shared Features": [
+            "; ".join([
+                f"{sf['feature']}: {', '.join(sf['shared_values'])}"
+                for sf in data.get('shared_features', [])
+            ])
+            for _, _, data in edges
+        ]
+    })
 
 
 def filter_graph_by_degree(G: nx.Graph, min_degree: int = 1) -> nx.Graph:
@@ -556,11 +825,19 @@ def filter_graph_by_degree(G: nx.Graph, min_degree: int = 1) -> nx.Graph:
     Returns:
         Filtered graph
     """
-    # Get nodes with sufficient degree
+    # Get nodes below the minimum degree
     degrees = dict(G.degree())
-    nodes_to_keep = [node for node, degree in degrees.items() if degree >= min_degree]
+    nodes_to_drop = [node for node, degree in degrees.items() if degree < min_degree]
+
+    if len(nodes_to_drop) < len(degrees) / 2:
+        # Light filtering: copying the graph and removing the few dropped nodes
+        # is cheaper than copying a filtered subgraph view
+        G_filtered = G.copy()
+        G_filtered.remove_nodes_from(nodes_to_drop)
+        return G_filtered
 
     # Create subgraph
+    nodes_to_keep = [node for node, degree in degrees.items() if degree >= min_degree]
     G_filtered = G.subgraph(nodes_to_keep).copy()
 
     return G_filtered
@@ -598,8 +875,20 @@ def get_central_nodes(G: nx.Graph, n: int = 10) -> List[Tuple[str, float]]:
     if len(G.nodes()) == 0:
         return []
 
-    # Calculate betweenness centrality
-    centrality = nx.betweenness_centrality(G)
+    # Calculate betweenness centrality; Brandes' algorithm is O(V * E), so large
+    # graphs use igraph's C implementation or sample BETWEENNESS_SAMPLE_SIZE sources
+    n_nodes = len(G)
+    if n_nodes > BETWEENNESS_SAMPLE_SIZE and igraph is not None:
+        nodes = list(G.nodes())
+        node_index = {node: i for i, node in enumerate(nodes)}
+        ig_graph = igraph.Graph(n=n_nodes, edges=[(node_index[u], node_index[v]) for u, v in G.edges()])
+        # Same normalization as nx.betweenness_centrality for undirected graphs
+        scale = 2 / ((n_nodes - 1) * (n_nodes - 2))
+        centrality = {node: value * scale for node, value in zip(nodes, ig_graph.betweenness(directed=False))}
+    elif n_nodes > BETWEENNESS_SAMPLE_SIZE:
+        centrality = nx.betweenness_centrality(G, k=BETWEENNESS_SAMPLE_SIZE, seed=42)
+    else:
+        centrality = nx.betweenness_centrality(G)
 
     # Sort and get top n
     top_central = sorted(centrality.items(), key=lambda x: x[1], reverse=True)[:n]
@@ -0,0 +1,368 @@
+"""
+Persistent response cache for deterministic LLM calls.
+Responses are stored on disk under a SHA-256 of the request, so an identical
+request is answered without an API call across reruns and sessions.
+Uses diskcache when it is installed; HAS_DISKCACHE is False and nothing is cached otherwise.
+
+A semantic layer (semantic_get/semantic_set) also answers analysis prompts that
+are near-duplicates of an earlier one, e.g. the same filtered table with one row
+toggled. Its entries also expire after LLM_CACHE_TTL and at most
+SEMANTIC_CACHE_MAX_ENTRIES are kept. It needs sentence-transformers and faiss;
+HAS_SEMANTIC_CACHE is False without them.
+"""
+
+import os
+import re
+import hashlib
+import json
+import logging
+import threading
+import time
+import functools
+import itertools
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import streamlit as st
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    faiss = None
+    SentenceTransformer = None
+
+from config import (
+    PROJECT_DIR,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_TEMPERATURE,
+    SEMANTIC_CACHE_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_MAX_ENTRIES
+)
+
+logger = logging.getLogger(__name__)
+
+HAS_DISKCACHE = diskcache is not None
+HAS_SEMANTIC_CACHE = faiss is not None and SentenceTransformer is not None
+
+LLM_CACHE_DIR = PROJECT_DIR / ".llm_cache"
+
+# Semantic cache entries, one JSON object per line with its prompt embedding
+SEMANTIC_CACHE_PATH = LLM_CACHE_DIR / "semantic.jsonl"
+
+# Opened on first use, so importing this module touches no files
+_cache = None
+
+
+def _get_cache():
+    """Open the on-disk cache, or return None without diskcache."""
+    global _cache
+    if _cache is None and HAS_DISKCACHE:
+        _cache = diskcache.Cache(str(LLM_CACHE_DIR))
+    return _cache
+
+
+def request_key(request: Dict) -> Optional[str]:
+    """
+    Key a messages.create request by the SHA-256 of its canonical JSON.
+
+    Args:
+        request: Keyword arguments of the request (model, messages, temperature, max_tokens, ...)
+
+    Returns:
+        Hex digest, or None if the request is sampled above LLM_CACHE_MAX_TEMPERATURE
+    """
+    # The API samples at temperature 1.0 when none is given
+    if request.get("temperature", 1.0) > LLM_CACHE_MAX_TEMPERATURE:
+        return None
+
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """
+    Look up a cached response.
+
+    Args:
+        key: Request key from request_key()
+
+    Returns:
+        Response text or None if not cached
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    return cache.get(key)
+
+
+def set(key: str, value: str) -> None:
+    """
+    Store a response for LLM_CACHE_TTL seconds.
+
+    Args:
+        key: Request key from request_key()
+        value: Response text
+    """
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(key, value, expire=LLM_CACHE_TTL)
+
+
+def cached_llm_call(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorate a func(client, **request) -> str API call with the response cache.
+
+    The cache is checked before the call and filled after it; the client is not
+    part of the key. Failed calls raise as before and are not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(client, **request) -> str:
+        key = request_key(request)
+        if key is not None:
+            cached = get(key)
+            if cached is not None:
+                return cached
+
+        text = func(client, **request)
+
+        if key is not None:
+            set(key, text)
+        return text
+
+    return wrapper
+
+
+# Prompts are embedded in chunks of this many characters and the chunk vectors
+# averaged: the embedding model only reads the first 256 word pieces of a text
+SEMANTIC_CHUNK_CHARS = 1000
+
+# Candidates checked per lookup; the nearest one may belong to another request type
+SEMANTIC_CANDIDATES = 5
+
+# Identifier-like tokens (gene symbols, study abbreviations, variant names such
+# as LRRK2, SNCA, PPMI or G2019S) that must match exactly for a semantic hit,
+# since prompts differing only in one of them embed almost identically
+_ENTITY_PATTERN = re.compile(r"\b(?=[A-Z0-9-]*[A-Z])[A-Z0-9][A-Z0-9-]*[A-Z0-9]\b")
+
+
+def _expired(entry: Dict) -> bool:
+    return time.time() - entry["created"] > LLM_CACHE_TTL
+
+
+class _SemanticStore:
+    """
+    Embedding model, FAISS inner-product index and the entries behind its rows.
+
+    Entries are kept in insertion (so creation) order and persisted to
+    SEMANTIC_CACHE_PATH with their embeddings: an insert appends one line, and
+    the index is rebuilt from the file on load. The file is only rewritten
+    when entries are dropped, i.e. expired ones on load or the oldest ones
+    once SEMANTIC_CACHE_MAX_ENTRIES is reached.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+        records = []
+        lines = 0
+        try:
+            with open(SEMANTIC_CACHE_PATH, encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # e.g. a line cut short by a crash mid-append
+                        continue
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache in {LLM_CACHE_DIR}: {e}")
+            records = []
+
+        live = [record for record in records if not _expired(record)][-SEMANTIC_CACHE_MAX_ENTRIES:]
+        vectors = np.array([record.pop("vector") for record in live], dtype=np.float32)
+        self._rebuild(live, vectors.reshape(len(live), self.dimension))
+        if len(live) != lines:
+            self.rewrite()
+
+    def _rebuild(self, entries: List[Dict], vectors: np.ndarray):
+        self.entries = entries
+        self.index = faiss.IndexFlatIP(self.dimension)
+        self.index.add(vectors)
+        self.prompt_hashes = {entry["prompt_hash"] for entry in entries}
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length embedding of the whole text, shape (1, dim)."""
+        chunks = [text[start:start + SEMANTIC_CHUNK_CHARS]
+                  for start in range(0, max(len(text), 1), SEMANTIC_CHUNK_CHARS)]
+        vector = self.model.encode(chunks, normalize_embeddings=True).mean(axis=0)
+        vector /= max(np.linalg.norm(vector), 1e-12)
+        return vector.astype(np.float32).reshape(1, -1)
+
+    def add(self, entry: Dict, vector: np.ndarray):
+        """
+        Add an entry and append it to the file, first dropping expired entries
+        and, at SEMANTIC_CACHE_MAX_ENTRIES, the oldest quarter, so the file is
+        rewritten once per that many inserts rather than on each.
+        """
+        if len(self.entries) >= SEMANTIC_CACHE_MAX_ENTRIES:
+            expired = sum(1 for _ in itertools.takewhile(_expired, self.entries))
+            start = max(expired, len(self.entries) - SEMANTIC_CACHE_MAX_ENTRIES * 3 // 4)
+            vectors = self.index.reconstruct_n(start, self.index.ntotal - start)
+            self._rebuild(self.entries[start:], vectors)
+            self.rewrite()
+
+        self.index.add(vector)
+        self.entries.append(entry)
+        self.prompt_hashes.add(entry["prompt_hash"])
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(SEMANTIC_CACHE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps({**entry, "vector": vector[0].tolist()}) + "\n")
+        except Exception as e:
+            logger.warning(f"Could not write semantic cache in {LLM_CACHE_DIR}: {e}")
+
+    def rewrite(self):
+        """Replace the file with the current entries atomically; failures are logged and otherwise ignored."""
+        tmp = SEMANTIC_CACHE_PATH.with_name(SEMANTIC_CACHE_PATH.name + ".tmp")
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                for entry, vector in zip(self.entries, vectors):
+                    f.write(json.dumps({**entry, "vector": vector.tolist()}) + "\n")
+            os.replace(tmp, SEMANTIC_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"Could not write semantic cache in {LLM_CACHE_DIR}: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def _get_semantic_store() -> Optional[_SemanticStore]:
+    """
+    Load the embedding model and the persisted index once per process.
+    Returns None (semantic caching off) if the model cannot be loaded.
+    """
+    try:
+        return _SemanticStore()
+    except Exception as e:
+        logger.warning(f"Semantic cache disabled, could not load {SEMANTIC_CACHE_MODEL}: {e}")
+        return None
+
+
+def _semantic_request_parts(request: Dict):
+    """
+    Split a request into its prompt text and a key for everything else.
+
+    Returns:
+        (prompt, params_key), or None if the request is not cacheable
+    """
+    if not HAS_SEMANTIC_CACHE or request_key(request) is None:
+        return None
+
+    params = {name: value for name, value in request.items() if name != "messages"}
+    prompt = request["messages"][-1]["content"]
+    return prompt, request_key(params)
+
+
+def _entities(prompt: str) -> List[str]:
+    # A set display, since this module's set() shadows the builtin
+    return sorted({*_ENTITY_PATTERN.findall(prompt)})
+
+
+def semantic_get(request: Dict) -> Optional[str]:
+    """
+    Look up the response to a near-duplicate of this request.
+
+    A stored response is reused when its prompt's embedding has cosine
+    similarity of at least SEMANTIC_CACHE_THRESHOLD, every other request
+    parameter (model, temperature, max_tokens, system prompt) is identical, and
+    both prompts name exactly the same identifier-like entities.
+
+    Args:
+        request: Keyword arguments of the messages.create request
+
+    Returns:
+        Response text or None if there is no near-duplicate
+    """
+    parts = _semantic_request_parts(request)
+    if parts is None:
+        return None
+    prompt, params_key = parts
+
+    store = _get_semantic_store()
+    if store is None:
+        return None
+    vector = store.embed(prompt)
+    entities = _entities(prompt)
+
+    with store.lock:
+        if store.index.ntotal == 0:
+            return None
+        similarities, positions = store.index.search(vector, min(SEMANTIC_CANDIDATES, store.index.ntotal))
+        for similarity, position in zip(similarities[0], positions[0]):
+            if similarity < SEMANTIC_CACHE_THRESHOLD:
+                break
+            entry = store.entries[position]
+            if _expired(entry):
+                continue
+            if entry["params_key"] == params_key and entry["entities"] == entities:
+                return entry["response"]
+
+    return None
+
+
+def semantic_set(request: Dict, response: str) -> None:
+    """
+    Add a request's prompt and response to the semantic cache.
+
+    Args:
+        request: Keyword arguments of the messages.create request
+        response: Response text
+    """
+    parts = _semantic_request_parts(request)
+    if parts is None:
+        return
+    prompt, params_key = parts
+
+    store = _get_semantic_store()
+    if store is None:
+        return
+    prompt_hash = request_key(request)
+
+    with store.lock:
+        if prompt_hash in store.prompt_hashes:
+            return
+        store.add({
+            "created": time.time(),
+            "prompt_hash": prompt_hash,
+            "params_key": params_key,
+            "entities": _entities(prompt),
+            "response": response,
+        }, store.embed(prompt))
+
+
+def clear_semantic_cache() -> None:
+    """
+    Drop the semantic cache, in memory and on disk.
+
+    Called by the pages' Clear Cache buttons, so analyses of refreshed data are
+    not answered with responses to near-duplicate prompts about the old data.
+    The exact-match cache is left alone: its keys change with the data.
+    """
+    _get_semantic_store.clear()
+    try:
+        os.remove(SEMANTIC_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove semantic cache in {LLM_CACHE_DIR}: {e}")
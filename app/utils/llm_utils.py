@@ -4,56 +4,375 @@ Handles Anthropic API calls with token limit checks.
 """
 
 import os
+import re
+import json
+import asyncio
+import contextlib
+import functools
+import numpy as np
 import pandas as pd
 import streamlit as st
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 import anthropic
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
 from config import (
     ANTHROPIC_MODEL,
     MAX_TOKENS_ANALYSIS,
     MAX_TOKENS_SCORING,
     MAX_INPUT_TOKENS,
     TEMPERATURE,
-    PROMPTS
+    DEEP_DIVE_SECTION_MAX_TOKENS,
+    DEEP_DIVE_SECTIONS,
+    SCORING_CONCURRENCY,
+    SCORING_REQUESTS_PER_MINUTE,
+    SCORING_BATCH_SIZE,
+    SCORING_CRITERIA,
+    SYSTEM_PROMPTS,
+    PROMPT_TEMPLATES
 )
+from utils import llm_cache
 
+# Batched scoring instructions per score type, formatted once at import
+_BATCH_SCORE_SYSTEM_PROMPTS = {
+    score_type: SYSTEM_PROMPTS["code_batch_score"].format(criterion=criterion, criterion_detail=criterion_detail)
+    for score_type, (criterion, criterion_detail) in SCORING_CRITERIA.items()
+}
 
-def get_anthropic_client() -> Optional[anthropic.Anthropic]:
+# Outermost JSON array in a batched scoring response
+_JSON_ARRAY_PATTERN = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def _is_transient_error(error: BaseException) -> bool:
     """
-    Initialize Anthropic client with API key from environment or Streamlit secrets.
+    Check whether an Anthropic API error is worth retrying.
+
+    Rate limits, overloaded/5xx responses and dropped connections usually
+    clear up on their own; other status errors (bad request, auth) do not.
+
+    Args:
+        error: Exception raised by the API call
 
     Returns:
-        Anthropic client or None if API key not found
+        True if the request should be retried
     """
-    api_key = None
+    if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code >= 500
+
+
+# Retry transient API errors with exponential backoff, re-raising the last one.
+# The clients are built with max_retries=0 so this is the only retry layer.
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient_error),
+    wait=wait_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
 
+
+def _get_api_key() -> Optional[str]:
+    """
+    Read the Anthropic API key from environment or Streamlit secrets.
+
+    Returns:
+        API key or None if not found
+    """
     # Try environment variable first
     if "ANTHROPIC_API_KEY" in os.environ:
-        api_key = os.environ["ANTHROPIC_API_KEY"]
+        return os.environ["ANTHROPIC_API_KEY"]
 
     # Try Streamlit secrets
-    elif hasattr(st, "secrets") and "ANTHROPIC_API_KEY" in st.secrets:
-        api_key = st.secrets["ANTHROPIC_API_KEY"]
+    if hasattr(st, "secrets") and "ANTHROPIC_API_KEY" in st.secrets:
+        return st.secrets["ANTHROPIC_API_KEY"]
+
+    return None
+
+
+@st.cache_resource(show_spinner=False)
+def _anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Build the Anthropic client for an API key, once per process.
+
+    Cached with st.cache_resource, so every call shares one client and its
+    HTTP connection pool (keep-alive connections, one TLS handshake). A
+    changed key gets a new client. Construction errors propagate and are
+    not cached, so a failed key is retried on the next call.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Anthropic client
+    """
+    return anthropic.Anthropic(api_key=api_key, max_retries=0)
+
+
+def get_anthropic_client() -> Optional[anthropic.Anthropic]:
+    """
+    Get the shared Anthropic client with API key from environment or Streamlit secrets.
+
+    Returns:
+        Anthropic client or None if API key not found or the client could not be created
+    """
+    api_key = _get_api_key()
+    if not api_key:
+        return None
+
+    try:
+        return _anthropic_client(api_key)
+    except Exception as e:
+        st.error(f"Error initializing Anthropic client: {e}")
+        return None
+
+
+def get_async_anthropic_client() -> Optional[anthropic.AsyncAnthropic]:
+    """
+    Initialize async Anthropic client with API key from environment or Streamlit secrets.
+
+    The client is bound to the event loop it is first used in, so callers
+    create one per asyncio.run() and close it when done.
 
+    Returns:
+        AsyncAnthropic client or None if API key not found
+    """
+    api_key = _get_api_key()
     if not api_key:
         return None
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
-        return client
+        return anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
     except Exception as e:
         st.error(f"Error initializing Anthropic client: {e}")
         return None
 
 
+def _system_prompt(text: str) -> List[Dict]:
+    """
+    System prompt block marked for Anthropic prompt caching.
+
+    The static instructions go first and are cached, so repeated requests of
+    the same kind only pay full price for the data in the user message.
+
+    Args:
+        text: Static instructions, from SYSTEM_PROMPTS
+
+    Returns:
+        Value for the system parameter of messages.create
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+@llm_cache.cached_llm_call
+@_retry_transient
+def _create_message(client: anthropic.Anthropic, **request) -> str:
+    """
+    Send one messages.create request and return the response text.
+
+    Responses are served from and stored in the on-disk llm_cache, keyed by
+    the request (model, prompt, temperature, max_tokens). Transient API
+    errors are retried with exponential backoff.
+
+    Args:
+        client: Anthropic client
+        **request: Keyword arguments for client.messages.create
+
+    Returns:
+        Response text
+    """
+    response = client.messages.create(**request)
+    return response.content[0].text
+
+
+@llm_cache.cached_llm_call
+@_retry_transient
+def _stream_message(client: anthropic.Anthropic, **request) -> str:
+    """
+    Stream one messages request, showing the text as it is generated.
+
+    The text is written into a temporary placeholder, which is cleared once
+    the response is complete so the page renders the returned text as before.
+    Shares llm_cache entries with _create_message; cached responses are
+    returned without being shown.
+
+    Args:
+        client: Anthropic client
+        **request: Keyword arguments for client.messages.stream
+
+    Returns:
+        Response text
+    """
+    placeholder = st.empty()
+    try:
+        with client.messages.stream(**request) as stream:
+            text = placeholder.write_stream(stream.text_stream)
+    finally:
+        placeholder.empty()
+    return text
+
+
+@_retry_transient
+async def _messages_create_async(client: anthropic.AsyncAnthropic, **request) -> str:
+    """
+    Send one async messages.create request, retrying transient API errors.
+
+    Args:
+        client: AsyncAnthropic client
+        **request: Keyword arguments for client.messages.create
+
+    Returns:
+        Response text
+    """
+    response = await client.messages.create(**request)
+    return response.content[0].text
+
+
+async def _create_message_async(client: anthropic.AsyncAnthropic, **request) -> str:
+    """
+    Async counterpart of _create_message, sharing its llm_cache entries.
+
+    Args:
+        client: AsyncAnthropic client
+        **request: Keyword arguments for client.messages.create
+
+    Returns:
+        Response text
+    """
+    key = llm_cache.request_key(request)
+    if key is not None:
+        cached = llm_cache.get(key)
+        if cached is not None:
+            return cached
+
+    text = await _messages_create_async(client, **request)
+
+    if key is not None:
+        llm_cache.set(key, text)
+    return text
+
+
+def _analysis_request(system: str, prompt: str, max_tokens: int) -> Dict:
+    """messages.create keyword arguments for one analysis request."""
+    return dict(
+        model=ANTHROPIC_MODEL,
+        max_tokens=max_tokens,
+        temperature=TEMPERATURE,
+        system=_system_prompt(system),
+        messages=[
+            {"role": "user", "content": prompt}
+        ]
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _analyze_impl(system: str, prompt: str, max_tokens: int = MAX_TOKENS_ANALYSIS, _text: Optional[str] = None) -> str:
+    """
+    Look up one analysis response, memoized on the prompt for the session.
+
+    Streamlit reruns the page on every widget change; an analysis whose
+    prompt is unchanged is answered here without another API call. Only the
+    text is cached and nothing is drawn, so streaming is left to the caller
+    (_run_analysis): a response found in neither llm_cache nor its semantic
+    layer raises LookupError, which is not cached, and the streamed text is
+    then stored by calling again with _text (not part of the cache key).
+
+    Args:
+        system: Static analysis instructions (SYSTEM_PROMPTS entry)
+        prompt: Formatted data prompt
+        max_tokens: Maximum tokens in the response
+        _text: Response text to store for this prompt
+
+    Returns:
+        Response text
+    """
+    if _text is not None:
+        return _text
+
+    request = _analysis_request(system, prompt, max_tokens)
+    key = llm_cache.request_key(request)
+    text = llm_cache.get(key) if key is not None else None
+    if text is None:
+        # Analysis prompts built from nearly the same filtered table (e.g.
+        # one row toggled) reuse the response to the earlier prompt
+        text = llm_cache.semantic_get(request)
+    if text is None:
+        raise LookupError("analysis response not cached")
+    return text
+
+
+def _run_analysis(system: str, prompt: str, max_tokens: int = MAX_TOKENS_ANALYSIS) -> str:
+    """
+    Get one analysis response, streaming it onto the page if it is not cached.
+
+    Args:
+        system: Static analysis instructions (SYSTEM_PROMPTS entry)
+        prompt: Formatted data prompt
+        max_tokens: Maximum tokens in the response
+
+    Returns:
+        Response text
+    """
+    try:
+        return _analyze_impl(system, prompt, max_tokens)
+    except LookupError:
+        pass
+
+    request = _analysis_request(system, prompt, max_tokens)
+    text = _stream_message(get_anthropic_client(), **request)
+    llm_cache.semantic_set(request, text)
+    return _analyze_impl(system, prompt, max_tokens, _text=text)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Load the BPE encoding used to count prompt tokens.
+
+    Claude's tokenizer is not public; cl100k_base counts within a few percent
+    of it on English prose, code and JSON, unlike a fixed characters-per-token
+    ratio. Returns None (4 characters per token) without tiktoken or if the
+    encoding cannot be loaded.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in text.
+    Uses tiktoken's cl100k_base encoding, or 4 characters per token without it.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Number of tokens
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+
+    return len(encoding.encode(text, disallowed_special=()))
+
+
 def check_token_limit(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> bool:
     """
     Check if text is within token limits.
-    Uses rough estimate of 4 characters per token.
 
     Args:
         text: Input text
@@ -62,9 +381,7 @@ def check_token_limit(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> bool:
     Returns:
         True if within limits, False otherwise
     """
-    estimated_tokens = len(text) // 4
-
-    return estimated_tokens <= max_tokens
+    return count_tokens(text) <= max_tokens
 
 
 def truncate_text(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
@@ -78,11 +395,62 @@ def truncate_text(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
     Returns:
         Truncated text
     """
-    max_chars = max_tokens * 4
-    if len(text) <= max_chars:
+    encoding = _get_encoding()
+    if encoding is None:
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text
+
+        return text[:max_chars] + "..."
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
         return text
 
-    return text[:max_chars] + "..."
+    return encoding.decode(tokens[:max_tokens]) + "..."
+
+
+def _dataframe_cache_key(df: pd.DataFrame) -> Tuple[int, Tuple[int, int]]:
+    """Cache key for a loaded catalog frame: its identity and shape (it is never modified in place)."""
+    return id(df), df.shape
+
+
+def topk_multivalue(values: pd.Series, sep: Optional[str] = None, k: int = 5) -> List[str]:
+    """
+    Get the k most frequent values of a column, splitting multi-value cells on sep.
+
+    Args:
+        values: Column to count
+        sep: Delimiter of multi-value cells, or None to count whole values
+        k: Number of values to return
+
+    Returns:
+        Most frequent values, most frequent first
+    """
+    if sep is not None:
+        values = values.str.split(sep).explode().str.strip()
+    return values.value_counts().head(k).index.tolist()
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs={pd.DataFrame: _dataframe_cache_key})
+def _top_values(full_df: pd.DataFrame, column: str, sep: Optional[str] = None, k: int = 5) -> List[str]:
+    """
+    Get the k most frequent values of a full-catalog column (see topk_multivalue).
+
+    Cached per frame, so the comparison context of every analysis reuses one
+    split/explode/value_counts pass over the unchanged full catalog instead of
+    repeating it on each call.
+
+    Args:
+        full_df: Full catalog DataFrame
+        column: Column to count
+        sep: Delimiter of multi-value cells, or None to count whole values
+        k: Number of values to return
+
+    Returns:
+        Most frequent values, most frequent first
+    """
+    return topk_multivalue(full_df[column], sep, k)
 
 
 def analyze_datasets(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = None) -> Optional[str]:
@@ -108,9 +476,9 @@ def analyze_datasets(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = None) -
     if full_df is not None and len(df) < len(full_df):
         comparison_info = f"\n\nComparative Context:\n"
         comparison_info += f"- Analyzing {len(df)} of {len(full_df)} total datasets ({len(df)/len(full_df)*100:.1f}%)\n"
-        comparison_info += f"- Full catalog diseases: {', '.join(full_df['Diseases Included'].str.split(';').explode().str.strip().value_counts().head(5).index.tolist())}\n"
+        comparison_info += f"- Full catalog diseases: {', '.join(_top_values(full_df, 'Diseases Included', ';'))}\n"
         if 'Coarse Data Types' in full_df.columns:
-            comparison_info += f"- Full catalog coarse data types: {', '.join(full_df['Coarse Data Types'].str.split(',').explode().str.strip().value_counts().head(5).index.tolist())}\n"
+            comparison_info += f"- Full catalog coarse data types: {', '.join(_top_values(full_df, 'Coarse Data Types', ','))}\n"
 
     # Check token limits
     combined_info = dataset_info + comparison_info
@@ -119,20 +487,11 @@ def analyze_datasets(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = None) -
         combined_info = truncate_text(combined_info)
 
     # Format prompt with comparison context
-    prompt = PROMPTS["dataset_analysis"].format(dataset_info=combined_info)
+    prompt = PROMPT_TEMPLATES["dataset_analysis"](dataset_info=combined_info)
 
     try:
         with st.spinner("Analyzing datasets with AI..."):
-            response = client.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=MAX_TOKENS_ANALYSIS,
-                temperature=TEMPERATURE,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            return response.content[0].text
+            return _run_analysis(SYSTEM_PROMPTS["dataset_analysis"], prompt)
 
     except Exception as e:
         st.error(f"Error calling Anthropic API: {e}")
@@ -165,12 +524,12 @@ def analyze_publications(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = Non
 
         # Top studies comparison
         if 'Resource Name' in full_df.columns:
-            top_studies_full = full_df['Resource Name'].value_counts().head(5).index.tolist()
+            top_studies_full = _top_values(full_df, 'Resource Name')
             comparison_info += f"- Full catalog top studies: {', '.join(top_studies_full)}\n"
 
         # Keyword comparison
         if 'Keywords' in full_df.columns and 'Keywords' in df.columns:
-            full_keywords = full_df['Keywords'].str.split(';').explode().str.strip().value_counts().head(5).index.tolist()
+            full_keywords = _top_values(full_df, 'Keywords', ';')
             comparison_info += f"- Full catalog top keywords: {', '.join(full_keywords)}\n"
 
     # Check token limits
@@ -180,20 +539,11 @@ def analyze_publications(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = Non
         combined_info = truncate_text(combined_info)
 
     # Format prompt with comparison context
-    prompt = PROMPTS["publication_analysis"].format(publication_info=combined_info)
+    prompt = PROMPT_TEMPLATES["publication_analysis"](publication_info=combined_info)
 
     try:
         with st.spinner("Analyzing publications with AI..."):
-            response = client.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=MAX_TOKENS_ANALYSIS,
-                temperature=TEMPERATURE,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            return response.content[0].text
+            return _run_analysis(SYSTEM_PROMPTS["publication_analysis"], prompt)
 
     except Exception as e:
         st.error(f"Error calling Anthropic API: {e}")
@@ -236,16 +586,14 @@ def summarize_knowledge_graph(
     # Analyze connection drivers from edge details
     connection_drivers = "Shared diseases, coarse data types, granular data types, and FAIR compliance characteristics"
     if edge_details is not None and not edge_details.empty:
-        # Extract most common shared features
-        feature_counts = {}
-        for features_str in edge_details['Shared Features'].dropna():
-            for feature_pair in features_str.split(';'):
-                if ':' in feature_pair:
-                    feature_type = feature_pair.split(':')[0].strip()
-                    feature_counts[feature_type] = feature_counts.get(feature_type, 0) + 1
-
-        if feature_counts:
-            top_drivers = sorted(feature_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Extract most common shared features: one "feature: values" pair per
+        # ';'-separated entry, counted by feature name in a single column pass
+        feature_pairs = edge_details['Shared Features'].dropna().str.split(';').explode()
+        feature_pairs = feature_pairs[feature_pairs.str.contains(':', regex=False)]
+        feature_counts = feature_pairs.str.partition(':')[0].str.strip().value_counts()
+
+        if not feature_counts.empty:
+            top_drivers = feature_counts.head(3).items()
             connection_drivers = ", ".join([f"{driver} ({count} connections)" for driver, count in top_drivers])
 
     # Add comparative context
@@ -254,7 +602,7 @@ def summarize_knowledge_graph(
         comparison_context = f"\n\nComparative Context:\n- Graph shows {num_nodes} of {len(full_df)} total datasets\n- Connection density: {graph_stats.get('density', 0):.2%}"
 
     # Format prompt
-    prompt = PROMPTS["knowledge_graph_summary"].format(
+    prompt = PROMPT_TEMPLATES["knowledge_graph_summary"](
         num_nodes=num_nodes,
         num_edges=num_edges,
         edge_types=connection_drivers,
@@ -263,92 +611,318 @@ def summarize_knowledge_graph(
 
     try:
         with st.spinner("Generating graph summary..."):
-            response = client.messages.create(
+            return _stream_message(
+                client,
                 model=ANTHROPIC_MODEL,
                 max_tokens=MAX_TOKENS_ANALYSIS,
                 temperature=TEMPERATURE,
+                system=_system_prompt(SYSTEM_PROMPTS["knowledge_graph_summary"]),
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
 
-            return response.content[0].text
-
     except Exception as e:
         st.error(f"Error calling Anthropic API: {e}")
         return None
 
 
-def score_code_repository(row: pd.Series, score_type: str) -> str:
+def _scoring_fields(repo_name: str, languages: str, summary: str) -> Tuple[str, str, str]:
     """
-    Use LLM to score a code repository.
+    Get the name, languages and (shortened) summary used to score a repository.
 
     Args:
-        row: DataFrame row with repository information
-        score_type: Type of score (cleanliness, completeness, runnable)
+        repo_name: Repository link
+        languages: Repository languages
+        summary: Code summary
 
     Returns:
-        Score (1-10) or "N/A"
+        (repo_name, languages, summary)
     """
-    client = get_anthropic_client()
-    if not client:
-        return "N/A"
-
-    # Get repository information
-    repo_name = row.get('Repository Link', 'Unknown')
-    languages = row.get('Languages', 'Unknown')
-    summary = row.get('Code Summary', 'No summary available')
-
     # Limit summary length
     if len(summary) > 1000:
         summary = summary[:1000] + "..."
 
+    return repo_name, languages, summary
+
+
+def _repository_fields(row: pd.Series) -> Tuple[str, str, str]:
+    """
+    Get the fields used to score the repository in a DataFrame row (see _scoring_fields).
+
+    Args:
+        row: DataFrame row with repository information
+
+    Returns:
+        (repo_name, languages, summary)
+    """
+    return _scoring_fields(
+        row.get('Repository Link', 'Unknown'),
+        row.get('Languages', 'Unknown'),
+        row.get('Code Summary', 'No summary available')
+    )
+
+
+def _scoring_prompt(row: pd.Series, score_type: str) -> Optional[Tuple[str, str]]:
+    """
+    Build the scoring prompt for one repository.
+
+    Args:
+        row: DataFrame row with repository information
+        score_type: Type of score (cleanliness, completeness, runnable)
+
+    Returns:
+        (system prompt, user prompt), or None for an unknown score type
+    """
     # Select appropriate prompt
     if score_type == "cleanliness":
-        prompt_template = PROMPTS["code_cleanliness_score"]
+        prompt_key = "code_cleanliness_score"
     elif score_type == "completeness":
-        prompt_template = PROMPTS["code_completeness_score"]
+        prompt_key = "code_completeness_score"
     elif score_type == "runnable":
-        prompt_template = PROMPTS["code_runnable_score"]
+        prompt_key = "code_runnable_score"
     else:
-        return "N/A"
+        return None
 
-    prompt = prompt_template.format(
+    repo_name, languages, summary = _repository_fields(row)
+
+    prompt = PROMPT_TEMPLATES[prompt_key](
         repo_name=repo_name,
         languages=languages,
         summary=summary
     )
+    return SYSTEM_PROMPTS[prompt_key], prompt
+
 
+def _batch_scoring_prompt(rows: List[Tuple[str, str, str]], score_type: str) -> Tuple[str, str]:
+    """
+    Build one prompt asking for the scores of several repositories.
+
+    Args:
+        rows: (repository link, languages, code summary) per repository
+        score_type: Type of score, a key of SCORING_CRITERIA
+
+    Returns:
+        (system prompt, user prompt)
+    """
+    repositories = []
+    for number, row in enumerate(rows, start=1):
+        repo_name, languages, summary = _scoring_fields(*row)
+        repositories.append(
+            f"[REPO {number}]\nRepository: {repo_name}\nLanguages: {languages}\nSummary: {summary}"
+        )
+
+    prompt = PROMPT_TEMPLATES["code_batch_score"](
+        count=len(rows),
+        repositories="\n\n".join(repositories)
+    )
+    return _BATCH_SCORE_SYSTEM_PROMPTS[score_type], prompt
+
+
+def _parse_score(score_text: str) -> str:
+    """
+    Extract a 1-10 score from a scoring response.
+
+    Args:
+        score_text: Response text
+
+    Returns:
+        Score (1-10) or "N/A"
+    """
     try:
-        response = client.messages.create(
+        score = int(score_text.strip())
+        if 1 <= score <= 10:
+            return str(score)
+        else:
+            return "N/A"
+    except ValueError:
+        return "N/A"
+
+
+def _parse_batch_scores(score_text: str, count: int) -> List[str]:
+    """
+    Extract the 1-10 scores from a batched scoring response.
+
+    Args:
+        score_text: Response text, expected to hold a JSON array
+        count: Number of repositories in the batch
+
+    Returns:
+        Score (1-10) or "N/A" per repository; all "N/A" if the array is
+        missing or does not have one entry per repository
+    """
+    # Tolerate a code fence or a sentence around the array
+    match = _JSON_ARRAY_PATTERN.search(score_text)
+    try:
+        scores = json.loads(match.group(0)) if match else None
+    except ValueError:
+        scores = None
+
+    if not isinstance(scores, list) or len(scores) != count:
+        return ["N/A"] * count
+
+    return [
+        str(score) if isinstance(score, int) and not isinstance(score, bool) and 1 <= score <= 10 else "N/A"
+        for score in scores
+    ]
+
+
+def score_code_repository(row: pd.Series, score_type: str) -> str:
+    """
+    Use LLM to score a code repository.
+
+    Args:
+        row: DataFrame row with repository information
+        score_type: Type of score (cleanliness, completeness, runnable)
+
+    Returns:
+        Score (1-10) or "N/A"
+    """
+    client = get_anthropic_client()
+    if not client:
+        return "N/A"
+
+    prompts = _scoring_prompt(row, score_type)
+    if prompts is None:
+        return "N/A"
+    system, prompt = prompts
+
+    try:
+        score_text = _create_message(
+            client,
             model=ANTHROPIC_MODEL,
             max_tokens=MAX_TOKENS_SCORING,
             temperature=0.3,  # Lower temperature for scoring
+            system=_system_prompt(system),
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
 
-        score_text = response.content[0].text.strip()
-
-        # Extract numeric score
-        try:
-            score = int(score_text)
-            if 1 <= score <= 10:
-                return str(score)
-            else:
-                return "N/A"
-        except ValueError:
-            return "N/A"
+        return _parse_score(score_text)
 
     except Exception as e:
         return "N/A"
 
 
+async def _score_batches_async(
+    prompts: List[Tuple[str, str]],
+    sizes: List[int],
+    on_scored: Callable[[int], None]
+) -> List[List[str]]:
+    """
+    Send batched scoring prompts concurrently with one AsyncAnthropic client.
+
+    At most SCORING_CONCURRENCY requests are in flight at once and, when
+    aiolimiter is installed, at most SCORING_REQUESTS_PER_MINUTE start per
+    minute, so wall time is bounded by the rate limit instead of the sum of
+    round trips.
+
+    Args:
+        prompts: Batched (system prompt, user prompt) per batch
+        sizes: Number of repositories in each batch
+        on_scored: Called with the number of scored repositories after each batch
+
+    Returns:
+        Score (1-10) or "N/A" per repository, grouped by batch in prompt order
+    """
+    scores = [["N/A"] * size for size in sizes]
+
+    client = get_async_anthropic_client()
+    if not client:
+        return scores
+
+    semaphore = asyncio.Semaphore(SCORING_CONCURRENCY)
+    limiter = AsyncLimiter(SCORING_REQUESTS_PER_MINUTE, 60) if AsyncLimiter is not None else contextlib.nullcontext()
+
+    @_retry_transient
+    async def create_throttled(request: Dict) -> str:
+        # Every attempt, retries included, takes a concurrency slot and a
+        # rate-limit token; both are released while backing off
+        async with semaphore, limiter:
+            response = await client.messages.create(**request)
+        return response.content[0].text
+
+    async def score_batch(position: int, prompts: Tuple[str, str]):
+        system, prompt = prompts
+        request = dict(
+            model=ANTHROPIC_MODEL,
+            max_tokens=MAX_TOKENS_SCORING,
+            temperature=0.3,  # Lower temperature for scoring
+            system=_system_prompt(system),
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+
+        key = llm_cache.request_key(request)
+        score_text = llm_cache.get(key) if key is not None else None
+
+        if score_text is None:
+            try:
+                score_text = await create_throttled(request)
+            except Exception:
+                return position, scores[position]
+
+            if key is not None:
+                llm_cache.set(key, score_text)
+
+        return position, _parse_batch_scores(score_text, sizes[position])
+
+    async with client:
+        scored = 0
+        tasks = [score_batch(position, batch_prompts) for position, batch_prompts in enumerate(prompts)]
+        for task in asyncio.as_completed(tasks):
+            position, batch_scores = await task
+            scores[position] = batch_scores
+            scored += sizes[position]
+            on_scored(scored)
+
+    return scores
+
+
+async def _deep_dive_sections_async(prompt: str) -> List[str]:
+    """
+    Write sections 1-3 of the code deep dive with concurrent requests.
+
+    Each request sends the same repository summary, marked for prompt
+    caching, followed by the headings of one DEEP_DIVE_SECTIONS entry.
+
+    Args:
+        prompt: Repository summary prompt shared by all sections
+
+    Returns:
+        Section texts, in DEEP_DIVE_SECTIONS order
+    """
+    client = get_async_anthropic_client()
+    if not client:
+        raise RuntimeError("Anthropic client could not be created")
+
+    async with client:
+        return await asyncio.gather(*[
+            _create_message_async(
+                client,
+                model=ANTHROPIC_MODEL,
+                max_tokens=DEEP_DIVE_SECTION_MAX_TOKENS,
+                temperature=0.7,
+                system=_system_prompt(SYSTEM_PROMPTS["code_deep_dive"]),
+                messages=[{"role": "user", "content": [
+                    {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": section},
+                ]}]
+            )
+            for section in DEEP_DIVE_SECTIONS.values()
+        ])
+
+
 def deep_dive_code_analysis(df: pd.DataFrame) -> Optional[str]:
     """
     Perform comprehensive code quality analysis with detailed summaries.
 
+    The cleanliness, completeness and usability sections are independent, so
+    they are written by concurrent requests; a final request summarizes them
+    into scores and recommendations.
+
     Args:
         df: DataFrame with repository information
 
@@ -363,50 +937,25 @@ def deep_dive_code_analysis(df: pd.DataFrame) -> Optional[str]:
     # Prepare repository summary
     summary = prepare_repository_summary(df, max_items=20)
 
-    prompt = f"""Analyze these {len(df)} code repositories for quality and best practices.
-
-{summary}
-
-Provide a comprehensive analysis covering:
-
-## 1. Code Cleanliness Assessment
-- Overall code organization and structure patterns
-- Style consistency across repositories
-- Readability and maintainability trends
-- Common issues or anti-patterns identified
-- Best practices observed
-
-## 2. Documentation & Completeness
-- Documentation quality and coverage
-- README comprehensiveness
-- Dependency specification practices
-- Test coverage and examples
-- Common gaps in completeness
-
-## 3. Usability & Runnability
-- Setup and installation clarity
-- Configuration requirements
-- Ease of getting started
-- Reproducibility considerations
-- Barriers to adoption
-
-## 4. Summary Scores & Recommendations
-- Provide average scores (1-10) for each dimension
-- Highlight exemplary repositories
-- Key recommendations for improvement
-- Priorities for researchers using these tools
-
-Be specific with repository names and quantify findings. Use exact counts and percentages."""
+    prompt = PROMPT_TEMPLATES["code_deep_dive"](count=len(df), summary=summary)
 
     try:
-        response = client.messages.create(
+        sections = asyncio.run(_deep_dive_sections_async(prompt))
+
+        synthesis_prompt = PROMPT_TEMPLATES["code_deep_dive_synthesis"](
+            count=len(df),
+            sections="\n\n".join(truncate_text(section, DEEP_DIVE_SECTION_MAX_TOKENS) for section in sections)
+        )
+        synthesis = _stream_message(
+            client,
             model=ANTHROPIC_MODEL,
-            max_tokens=MAX_TOKENS_ANALYSIS,
+            max_tokens=DEEP_DIVE_SECTION_MAX_TOKENS,
             temperature=0.7,
-            messages=[{"role": "user", "content": prompt}]
+            system=_system_prompt(SYSTEM_PROMPTS["code_deep_dive_synthesis"]),
+            messages=[{"role": "user", "content": synthesis_prompt}]
         )
 
-        return response.content[0].text
+        return "\n\n".join([*sections, synthesis])
 
     except Exception as e:
         st.error(f"Analysis failed: {str(e)}")
@@ -431,20 +980,30 @@ def batch_score_repositories(df: pd.DataFrame, score_type: str) -> pd.DataFrame:
         st.info(f"{score_column} already exists. Skipping scoring.")
         return df
 
-    # Add new column
-    df[score_column] = "N/A"
+    if score_type not in SCORING_CRITERIA:
+        df[score_column] = "N/A"
+        return df
 
-    # Score each repository
+    # One request per SCORING_BATCH_SIZE repositories
+    # Read the three scored columns once instead of building a Series per row
+    rows = list(zip(
+        _column(df, 'Repository Link', 'Unknown').tolist(),
+        _column(df, 'Languages', 'Unknown').tolist(),
+        _column(df, 'Code Summary', 'No summary available').tolist()
+    ))
+    batches = [rows[start:start + SCORING_BATCH_SIZE] for start in range(0, len(rows), SCORING_BATCH_SIZE)]
+    prompts = [_batch_scoring_prompt(batch, score_type) for batch in batches]
+
+    # Score all batches concurrently, updating progress as each finishes
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    for i, (idx, row) in enumerate(df.iterrows()):
-        status_text.text(f"Scoring repository {i + 1} of {len(df)}...")
-
-        score = score_code_repository(row, score_type)
-        df.at[idx, score_column] = score
+    def on_scored(done: int):
+        status_text.text(f"Scored {done} of {len(df)} repositories...")
+        progress_bar.progress(min(done / len(df), 1.0))
 
-        progress_bar.progress(min((i + 1) / len(df), 1.0))
+    batch_scores = asyncio.run(_score_batches_async(prompts, [len(batch) for batch in batches], on_scored))
+    df[score_column] = [score for scores in batch_scores for score in scores]
 
     progress_bar.empty()
     status_text.empty()
@@ -452,6 +1011,38 @@ def batch_score_repositories(df: pd.DataFrame, score_type: str) -> pd.DataFrame:
     return df
 
 
+def _column(df: pd.DataFrame, column: str, default: str) -> pd.Series:
+    """
+    Get a column for summary building, or default for every row if it is missing.
+
+    Args:
+        df: DataFrame being summarized
+        column: Column name
+        default: Value used when the column does not exist
+
+    Returns:
+        Series aligned with df
+    """
+    if column in df.columns:
+        return df[column]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _shorten(values: pd.Series, max_chars: int) -> List[str]:
+    """
+    Cut each value to max_chars characters plus "..." if it is longer.
+
+    Args:
+        values: Column values, converted with str()
+        max_chars: Maximum characters kept
+
+    Returns:
+        Shortened values as a list
+    """
+    text = values.astype(str)
+    return np.where(text.str.len() > max_chars, text.str[:max_chars] + "...", text).tolist()
+
+
 def prepare_dataset_summary(df: pd.DataFrame, max_items: int = 50) -> str:
     """
     Prepare a concise summary of datasets for LLM analysis.
@@ -466,24 +1057,21 @@ def prepare_dataset_summary(df: pd.DataFrame, max_items: int = 50) -> str:
     # Limit to max_items
     df_subset = df.head(max_items)
 
-    summary_parts = []
-
-    for idx, row in df_subset.iterrows():
-        name = row.get('Resource Name', 'Unknown')
-        abbrev = row.get('Abbreviation', '')
-        diseases = row.get('Diseases Included', '')
-        modalities = row.get('Coarse Data Modality', '')
-        sample_size = row.get('Sample Size', '')
-
-        summary = f"{name}"
-        if abbrev:
-            summary += f" ({abbrev})"
-        summary += f"\n  Diseases: {diseases}"
-        summary += f"\n  Modalities: {modalities}"
-        if sample_size:
-            summary += f"\n  Sample Size: {sample_size}"
-
-        summary_parts.append(summary)
+    # Read whole columns once instead of building a Series per row
+    summary_parts = [
+        f"{name}"
+        + (f" ({abbrev})" if abbrev else "")
+        + f"\n  Diseases: {diseases}"
+        + f"\n  Modalities: {modalities}"
+        + (f"\n  Sample Size: {sample_size}" if sample_size else "")
+        for name, abbrev, diseases, modalities, sample_size in zip(
+            _column(df_subset, 'Resource Name', 'Unknown').tolist(),
+            _column(df_subset, 'Abbreviation', '').tolist(),
+            _column(df_subset, 'Diseases Included', '').tolist(),
+            _column(df_subset, 'Coarse Data Modality', '').tolist(),
+            _column(df_subset, 'Sample Size', '').tolist()
+        )
+    ]
 
     # Add count if truncated
     if len(df) > max_items:
@@ -506,25 +1094,28 @@ def prepare_publication_summary(df: pd.DataFrame, max_items: int = 50) -> str:
     # Limit to max_items
     df_subset = df.head(max_items)
 
-    summary_parts = []
+    # Show first 3 authors: split off at most 4 pieces, so long author lists
+    # are not split in full, and the 4th piece only marks "et al."
+    authors = _column(df_subset, 'Authors', '')
+    author_splits = authors.astype(str).str.split(';', n=3)
+    first_authors = author_splits.str[:3].str.join('; ').tolist()
+    et_al = np.where(author_splits.str.len() > 3, " et al.", "").tolist()
 
-    for idx, row in df_subset.iterrows():
-        title = row.get('Title', 'Unknown')
-        authors = row.get('Authors', '')
-        keywords = row.get('Keywords', '')
-        abstract = row.get('Abstract', '')
-
-        # Limit abstract length
-        if abstract and len(abstract) > 200:
-            abstract = abstract[:200] + "..."
+    # Limit abstract length
+    abstracts = _shorten(_column(df_subset, 'Abstract', ''), 200)
 
+    summary_parts = []
+    for title, has_authors, author_list, more_authors, keywords, abstract in zip(
+        _column(df_subset, 'Title', 'Unknown').tolist(),
+        authors.tolist(),
+        first_authors,
+        et_al,
+        _column(df_subset, 'Keywords', '').tolist(),
+        abstracts
+    ):
         summary = f"Title: {title}"
-        if authors:
-            # Show first 3 authors
-            author_list = authors.split(';')[:3]
-            summary += f"\n  Authors: {'; '.join(author_list)}"
-            if len(authors.split(';')) > 3:
-                summary += " et al."
+        if has_authors:
+            summary += f"\n  Authors: {author_list}{more_authors}"
         if keywords:
             summary += f"\n  Keywords: {keywords}"
         if abstract:
@@ -565,12 +1156,12 @@ def analyze_repositories(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = Non
 
         # Top studies comparison
         if 'Resource Name' in full_df.columns:
-            top_studies_full = full_df['Resource Name'].value_counts().head(5).index.tolist()
+            top_studies_full = _top_values(full_df, 'Resource Name')
             comparison_info += f"- Full catalog top studies: {', '.join(top_studies_full)}\n"
 
         # Language comparison
         if 'Languages' in full_df.columns and 'Languages' in df.columns:
-            full_languages = full_df['Languages'].str.split(',').explode().str.strip().value_counts().head(5).index.tolist()
+            full_languages = _top_values(full_df, 'Languages', ',')
             comparison_info += f"- Full catalog top languages: {', '.join(full_languages)}\n"
 
     # Check token limits
@@ -580,20 +1171,11 @@ def analyze_repositories(df: pd.DataFrame, full_df: Optional[pd.DataFrame] = Non
         combined_info = truncate_text(combined_info)
 
     # Format prompt with comparison context
-    prompt = PROMPTS["repository_analysis"].format(repository_info=combined_info)
+    prompt = PROMPT_TEMPLATES["repository_analysis"](repository_info=combined_info)
 
     try:
         with st.spinner("Analyzing repositories with AI..."):
-            response = client.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=MAX_TOKENS_ANALYSIS,
-                temperature=TEMPERATURE,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            return response.content[0].text
+            return _run_analysis(SYSTEM_PROMPTS["repository_analysis"], prompt)
 
     except Exception as e:
         st.error(f"Error calling Anthropic API: {e}")
@@ -614,33 +1196,25 @@ def prepare_repository_summary(df: pd.DataFrame, max_items: int = 50) -> str:
     # Limit to max_items
     df_subset = df.head(max_items)
 
-    summary_parts = []
-
-    for idx, row in df_subset.iterrows():
-        repo_link = row.get('Repository Link', 'Unknown')
-        study = row.get('Resource Name', 'Unknown Study')
-        languages = row.get('Languages', '')
-        data_types = row.get('Data Types', '')
-        tooling = row.get('Tooling', '')
-        biomedical = row.get('Biomedical Relevance', '')
-        fair_score = row.get('FAIR Score', '')
-
-        # Extract repo name from link
-        repo_name = repo_link.split('/')[-1] if '/' in repo_link else repo_link
-
-        summary = f"{repo_name} ({study})"
-        if languages:
-            summary += f"\n  Languages: {languages}"
-        if data_types:
-            summary += f"\n  Data Types: {data_types}"
-        if tooling:
-            summary += f"\n  Tooling: {tooling}"
-        if biomedical:
-            summary += f"\n  Biomedical Relevance: {biomedical}"
-        if fair_score:
-            summary += f"\n  FAIR Score: {fair_score}/10"
-
-        summary_parts.append(summary)
+    # Read whole columns once instead of building a Series per row
+    summary_parts = [
+        # Repo name is the last part of the link
+        f"{repo_link.rsplit('/', 1)[-1]} ({study})"
+        + (f"\n  Languages: {languages}" if languages else "")
+        + (f"\n  Data Types: {data_types}" if data_types else "")
+        + (f"\n  Tooling: {tooling}" if tooling else "")
+        + (f"\n  Biomedical Relevance: {biomedical}" if biomedical else "")
+        + (f"\n  FAIR Score: {fair_score}/10" if fair_score else "")
+        for repo_link, study, languages, data_types, tooling, biomedical, fair_score in zip(
+            _column(df_subset, 'Repository Link', 'Unknown').tolist(),
+            _column(df_subset, 'Resource Name', 'Unknown Study').tolist(),
+            _column(df_subset, 'Languages', '').tolist(),
+            _column(df_subset, 'Data Types', '').tolist(),
+            _column(df_subset, 'Tooling', '').tolist(),
+            _column(df_subset, 'Biomedical Relevance', '').tolist(),
+            _column(df_subset, 'FAIR Score', '').tolist()
+        )
+    ]
 
     # Add count if truncated
     if len(df) > max_items:
@@ -676,16 +1250,16 @@ def analyze_cellular_models(df: pd.DataFrame, full_df: Optional[pd.DataFrame] =
 
         # Gene distribution comparison
         if 'Gene' in df.columns and 'Gene' in full_df.columns:
-            subset_genes = df['Gene'].value_counts().head(5).index.tolist()
-            full_genes = full_df['Gene'].value_counts().head(5).index.tolist()
+            subset_genes = topk_multivalue(df['Gene'])
+            full_genes = _top_values(full_df, 'Gene')
             comparison_info += f"- Subset top genes: {', '.join(subset_genes)}\n"
             comparison_info += f"- Full catalog top genes: {', '.join(full_genes)}\n"
 
         # Condition distribution comparison
         if 'Condition' in df.columns and 'Condition' in full_df.columns:
-            subset_conditions = [c for c in df['Condition'].value_counts().head(5).index.tolist()
+            subset_conditions = [c for c in topk_multivalue(df['Condition'])
                                 if c and str(c).strip() and str(c) != "0"]
-            full_conditions = [c for c in full_df['Condition'].value_counts().head(5).index.tolist()
+            full_conditions = [c for c in _top_values(full_df, 'Condition')
                               if c and str(c).strip() and str(c) != "0"]
             if subset_conditions:
                 comparison_info += f"- Subset top conditions: {', '.join(subset_conditions)}\n"
@@ -699,23 +1273,14 @@ def analyze_cellular_models(df: pd.DataFrame, full_df: Optional[pd.DataFrame] =
         combined_info = truncate_text(combined_info)
 
     # Format prompt with comparison context
-    prompt = PROMPTS["cellular_models_analysis"].format(
+    prompt = PROMPT_TEMPLATES["cellular_models_analysis"](
         summary=combined_info,
         comparison=comparison_info
     )
 
     try:
         with st.spinner("Analyzing cellular models with AI..."):
-            response = client.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=MAX_TOKENS_ANALYSIS,
-                temperature=TEMPERATURE,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            return response.content[0].text
+            return _run_analysis(SYSTEM_PROMPTS["cellular_models_analysis"], prompt)
 
     except Exception as e:
         st.error(f"Error calling Anthropic API: {e}")
@@ -736,33 +1301,30 @@ def prepare_cellular_models_summary(df: pd.DataFrame, max_items: int = 30) -> st
     # Limit to max_items
     df_subset = df.head(max_items)
 
-    summary_parts = []
-
-    for idx, row in df_subset.iterrows():
-        product_code = row.get('Product Code', 'Unknown')
-        gene = row.get('Gene', 'N/A')
-        variant = row.get('Gene Variant', 'N/A')
-        condition = row.get('Condition', 'N/A')
-        about_gene = row.get('About this gene', '')
-        about_variant = row.get('About this variant', '')
+    # Truncate About sections for summary
+    about_genes = _shorten(_column(df_subset, 'About this gene', ''), 200)
+    about_variants = _shorten(_column(df_subset, 'About this variant', ''), 200)
 
+    summary_parts = []
+    for product_code, gene, variant, condition, about_gene, about_variant in zip(
+        _column(df_subset, 'Product Code', 'Unknown').tolist(),
+        _column(df_subset, 'Gene', 'N/A').tolist(),
+        _column(df_subset, 'Gene Variant', 'N/A').tolist(),
+        _column(df_subset, 'Condition', 'N/A').tolist(),
+        about_genes,
+        about_variants
+    ):
         # Format condition display
         if condition == "0" or not condition or str(condition).strip() == "":
             condition_display = "Control/Wildtype"
         else:
             condition_display = condition
 
-        # Truncate About sections for summary
-        if about_gene and len(str(about_gene)) > 200:
-            about_gene = str(about_gene)[:200] + "..."
-        if about_variant and len(str(about_variant)) > 200:
-            about_variant = str(about_variant)[:200] + "..."
-
         summary = f"{product_code} - {gene} {variant}"
         summary += f"\n  Condition: {condition_display}"
-        if about_gene and str(about_gene).strip():
+        if about_gene.strip():
             summary += f"\n  About gene: {about_gene}"
-        if about_variant and str(about_variant).strip():
+        if about_variant.strip():
             summary += f"\n  About variant: {about_variant}"
 
         summary_parts.append(summary)
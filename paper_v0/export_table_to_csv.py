@@ -2,209 +2,230 @@
 Export main statistics table to wide-format CSV for Google Sheets/Excel.
 """
 
-import pandas as pd
-import numpy as np
-from collections import Counter
-import re
+import contextlib
+import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+import hashlib
+import pickle
 from pathlib import Path
-import sys
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Paths
+TABLES_DIR = Path(__file__).parent.parent / "tables"
+OUTPUT_DIR = Path(__file__).parent / "v0.3"
+CACHE_DIR = OUTPUT_DIR / ".cache"
 
-# Import from generate_main_table
-from generate_main_table import (
-    analyze_datasets, analyze_publications,
-    analyze_code_repos, analyze_cell_models
-)
+# Source tables read by the analyze_* functions
+SOURCE_PATTERNS = [
+    (TABLES_DIR, "dataset-inventory-*.tab"),
+    (TABLES_DIR, "pubmed_central_*.tsv"),
+    (TABLES_DIR, "gits_*.tsv"),
+    (TABLES_DIR, "iNDI_inventory_*.tsv"),
+    (TABLES_DIR.parent / "scrapers", "fair_compliance_log_*.tsv"),
+]
 
-OUTPUT_DIR = Path(__file__).parent / "v0.3"
+
+def source_fingerprint():
+    """Modification times of the source tables and of generate_main_table.py."""
+    paths = [path for directory, pattern in SOURCE_PATTERNS for path in directory.glob(pattern)]
+    paths.append(Path(__file__).parent / "generate_main_table.py")
+    return sorted((str(path), path.stat().st_mtime_ns) for path in paths)
+
+
+def cached(fn, **kwargs):
+    """Call fn(**kwargs), reusing its pickled result while the sources are unchanged.
+
+    Empty results (an analysis that found or could read no source table) are
+    returned but not stored, so a failed run is not replayed later.
+    """
+    fingerprint = repr((sorted(kwargs.items()), source_fingerprint()))
+    key = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+    cache_file = CACHE_DIR / f"{fn.__name__}_{key}.pkl"
+
+    if cache_file.exists():
+        print(f"Loading cached {fn.__name__} from: {cache_file}")
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+
+    result = fn(**kwargs)
+    if not result:
+        return result
+
+    # Drop results computed from older versions of the sources
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in CACHE_DIR.glob(f"{fn.__name__}_*.pkl"):
+        stale.unlink()
+    with open(cache_file, 'wb') as f:
+        pickle.dump(result, f)
+    return result
+
+
+def run_analysis(fn, kwargs):
+    """Run cached(fn, **kwargs) in a worker, returning (result, captured output).
+
+    The workers run at the same time, so their progress messages are captured
+    and printed by the parent in analysis order instead of interleaving.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = cached(fn, **kwargs)
+    return result, output.getvalue()
+
+
+# (row label, stats key suffix) for the summary statistics rows
+SAMPLE_SIZE_STATS = [('Mean', 'mean'), ('Median', 'median'), ('Min', 'min'), ('Max', 'max'), ('Std Dev', 'std')]
+COMPLETENESS_STATS = [('Mean', 'mean'), ('Median', 'median'), ('Std Dev', 'std')]
+
+# Percentage cell format, e.g. 12.3%
+PCT_FORMAT = '{:.1f}%'.format
+
+
+def pct_strings(values):
+    """Format a section's percentages in one pass."""
+    return list(map(PCT_FORMAT, values))
+
+
+def count_rows(items):
+    """Rows for (name, count) pairs."""
+    return [[name, '', count, ''] for name, count in items]
+
+
+def count_pct_rows(items):
+    """Rows for (name, count, percentage) triples."""
+    items = list(items)
+    pcts = pct_strings(pct for _, _, pct in items)
+    return [[name, '', count, pct] for (name, count, _), pct in zip(items, pcts)]
+
+
+def share_rows(items, total):
+    """Rows for (name, count) pairs with each count as a percentage of total."""
+    pcts = pct_strings((count / total * 100) if total > 0 else 0 for _, count in items)
+    return [[name, '', count, pct] for (name, count), pct in zip(items, pcts)]
+
+
+def stat_rows(stats, prefix, fmt, names):
+    """Rows for the summary statistics stored as stats[f"{prefix}_{suffix}"]."""
+    return [[label, fmt.format(stats[f"{prefix}_{suffix}"]), '', ''] for label, suffix in names]
+
+
+def fair_completeness_rows(stats):
+    """Rows for the FAIR component completeness, highest first."""
+    components = sorted(stats['fair_completeness'].items(), key=itemgetter(1), reverse=True)
+    pcts = pct_strings(pct for _, pct in components)
+    return [[component, '', '', pct] for (component, _), pct in zip(components, pcts)]
+
+
+def completeness_rows(stats):
+    """Rows for the publication completeness statistics and distribution."""
+    rows = stat_rows(stats, 'completeness', '{:.1f}%', COMPLETENESS_STATS)
+    if 'completeness_dist' in stats:
+        rows.append(['Distribution', '', '', ''])
+        rows.extend(count_rows(stats['completeness_dist'].items()))
+    return rows
 
 
 def create_wide_csv():
     """Create wide-format CSV with statistics."""
 
     print("Generating statistics...")
-    datasets_stats = analyze_datasets()
-    pubs_stats = analyze_publications()
-    code_stats = analyze_code_repos(git_scrape_output_path='../tables/gits_to_reannotate_completed_20260209_224209.tsv')
-    cell_stats = analyze_cell_models()
-
-    # Create list to hold all rows
+    # Imported here so the pandas/numpy analysis stack only loads for an export
+    from generate_main_table import (
+        analyze_datasets, analyze_publications,
+        analyze_code_repos, analyze_cell_models
+    )
+
+    # Each analysis reads its own tables, so they run in separate processes
+    analyses = [
+        (analyze_datasets, {}),
+        (analyze_publications, {}),
+        (analyze_code_repos, {'git_scrape_output_path': str(TABLES_DIR / 'gits_to_reannotate_completed_20260209_224209.tsv')}),
+        (analyze_cell_models, {}),
+    ]
+    with ProcessPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = [executor.submit(run_analysis, fn, kwargs) for fn, kwargs in analyses]
+        results = []
+        for future in futures:
+            result, output = future.result()
+            print(output, end='')
+            results.append(result)
+    datasets_stats, pubs_stats, code_stats, cell_stats = results
+
+    # (title, column label, stats, key the section's rows need, row emitter)
+    sections = [
+        ('DATASETS', '', datasets_stats, None,
+         lambda s: [['Total Datasets', s.get('n_datasets', ''), '', '']]),
+        ('Coarse Data Types', '', datasets_stats, 'coarse_data_types',
+         lambda s: share_rows(s['coarse_data_types'], sum(count for _, count in s['coarse_data_types']))),
+        ('Sample Size Statistics', '', datasets_stats, 'sample_size_mean',
+         lambda s: stat_rows(s, 'sample_size', '{:.0f}', SAMPLE_SIZE_STATS)),
+        ('FAIR Compliance Levels', '', datasets_stats, 'fair_levels',
+         lambda s: count_pct_rows((level, count, s['fair_levels_pct'][level]) for level, count in s['fair_levels'].items())),
+
+        ('PUBLICATIONS', '', pubs_stats, None, lambda s: []),
+        ('Five Most Prolific Studies', '', pubs_stats, 'top_studies',
+         lambda s: count_rows(s['top_studies'].items())),
+        ('Five Most Occurring Authors', '', pubs_stats, 'top_authors',
+         lambda s: count_rows(s['top_authors'])),
+        ('Five Most Occurring Affiliations', '', pubs_stats, 'top_affiliations',
+         lambda s: count_rows(s['top_affiliations'])),
+        ('Top 10 Keywords', '', pubs_stats, 'top_keywords',
+         lambda s: count_pct_rows(s['top_keywords'])),
+        ('Data Completeness Distribution from PubMed API', '', pubs_stats, 'completeness_mean',
+         completeness_rows),
+
+        ('CODE REPOSITORIES', '', code_stats, None,
+         lambda s: [['Total Repositories', s.get('n_repositories', ''), '', '']]),
+        ('Top Programming Languages', '', code_stats, 'top_languages',
+         lambda s: share_rows(s['top_languages'], s.get('n_repositories', 1))),
+        ('Top 10 Keywords from Tooling', '% Repositories', code_stats, 'top_tooling',
+         lambda s: count_pct_rows(s['top_tooling'])),
+        ('Top 10 Keywords from Data Types', '% Repositories', code_stats, 'top_data_types',
+         lambda s: count_pct_rows(s['top_data_types'])),
+        ('Top 10 Keywords from Code Summary', '% Repositories', code_stats, 'top_code_summary',
+         lambda s: count_pct_rows(s['top_code_summary'])),
+        ('FAIR Component Completeness', '% with component', code_stats, 'fair_completeness',
+         fair_completeness_rows),
+        ('Mean FAIR Score by Language (0-10 scale)', '', code_stats, 'fair_by_language',
+         lambda s: [[lang, f"{data['mean_score']:.2f}/10", f"n={data['count']}", '']
+                    for lang, data in s['fair_by_language'].items()]),
+
+        ('HUMAN CELLULAR MODELS', '', cell_stats, None,
+         lambda s: [['Total Cell Models', s.get('n_cell_models', ''), '', '']]),
+        ('Cell Models per Condition (Top 10)', '', cell_stats, 'conditions',
+         lambda s: count_pct_rows((condition, count, s['conditions_pct'][condition])
+                                  for condition, count in s['conditions'].items())),
+        ('Most Common Genes', '', cell_stats, 'top_genes',
+         lambda s: count_rows(s['top_genes'])),
+        ('Top Themes from Gene Descriptions', '% Cell Models', cell_stats, 'top_gene_themes',
+         lambda s: count_pct_rows(s['top_gene_themes'])),
+        ('Top Themes from Variant Descriptions', '% Cell Models', cell_stats, 'top_variant_themes',
+         lambda s: count_pct_rows(s['top_variant_themes'])),
+    ]
+
+    # Each section is its title row, its rows and a blank separator
     rows = []
-
-    # DATASETS SECTION
-    rows.append(['DATASETS', '', '', ''])
-    rows.append(['Total Datasets', datasets_stats.get('n_datasets', ''), '', ''])
-    rows.append(['', '', '', ''])
-
-    # Coarse data types
-    rows.append(['Coarse Data Types', '', '', ''])
-    if 'coarse_data_types' in datasets_stats:
-        total_types = sum(count for _, count in datasets_stats['coarse_data_types'])
-        for dtype, count in datasets_stats['coarse_data_types']:
-            pct = (count / total_types * 100) if total_types > 0 else 0
-            rows.append([dtype, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Sample size statistics
-    rows.append(['Sample Size Statistics', '', '', ''])
-    if 'sample_size_mean' in datasets_stats:
-        rows.append(['Mean', f"{datasets_stats['sample_size_mean']:.0f}", '', ''])
-        rows.append(['Median', f"{datasets_stats['sample_size_median']:.0f}", '', ''])
-        rows.append(['Min', f"{datasets_stats['sample_size_min']:.0f}", '', ''])
-        rows.append(['Max', f"{datasets_stats['sample_size_max']:.0f}", '', ''])
-        rows.append(['Std Dev', f"{datasets_stats['sample_size_std']:.0f}", '', ''])
-    rows.append(['', '', '', ''])
-
-    # FAIR compliance
-    rows.append(['FAIR Compliance Levels', '', '', ''])
-    if 'fair_levels' in datasets_stats:
-        for level, count in datasets_stats['fair_levels'].items():
-            pct = datasets_stats['fair_levels_pct'][level]
-            rows.append([level, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # PUBLICATIONS SECTION
-    rows.append(['PUBLICATIONS', '', '', ''])
-    rows.append(['', '', '', ''])
-
-    # Top studies
-    rows.append(['Five Most Prolific Studies', '', '', ''])
-    if 'top_studies' in pubs_stats:
-        for study, count in pubs_stats['top_studies'].items():
-            rows.append([study, '', count, ''])
-    rows.append(['', '', '', ''])
-
-    # Top authors
-    rows.append(['Five Most Occurring Authors', '', '', ''])
-    if 'top_authors' in pubs_stats:
-        for author, count in pubs_stats['top_authors']:
-            rows.append([author, '', count, ''])
-    rows.append(['', '', '', ''])
-
-    # Top affiliations
-    rows.append(['Five Most Occurring Affiliations', '', '', ''])
-    if 'top_affiliations' in pubs_stats:
-        for aff, count in pubs_stats['top_affiliations']:
-            rows.append([aff, '', count, ''])
-    rows.append(['', '', '', ''])
-
-    # Top keywords
-    rows.append(['Top 10 Keywords', '', '', ''])
-    if 'top_keywords' in pubs_stats:
-        for word, count, pct in pubs_stats['top_keywords']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Data completeness
-    rows.append(['Data Completeness Distribution from PubMed API', '', '', ''])
-    if 'completeness_mean' in pubs_stats:
-        rows.append(['Mean', f"{pubs_stats['completeness_mean']:.1f}%", '', ''])
-        rows.append(['Median', f"{pubs_stats['completeness_median']:.1f}%", '', ''])
-        rows.append(['Std Dev', f"{pubs_stats['completeness_std']:.1f}%", '', ''])
-        if 'completeness_dist' in pubs_stats:
-            rows.append(['Distribution', '', '', ''])
-            for range_label, count in pubs_stats['completeness_dist'].items():
-                rows.append([range_label, '', count, ''])
-    rows.append(['', '', '', ''])
-
-    # CODE REPOSITORIES SECTION
-    rows.append(['CODE REPOSITORIES', '', '', ''])
-    rows.append(['Total Repositories', code_stats.get('n_repositories', ''), '', ''])
-    rows.append(['', '', '', ''])
-
-    # Top languages
-    rows.append(['Top Programming Languages', '', '', ''])
-    if 'top_languages' in code_stats:
-        total_repos = code_stats.get('n_repositories', 1)
-        for lang, count in code_stats['top_languages']:
-            pct = (count / total_repos * 100) if total_repos > 0 else 0
-            rows.append([lang, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Top tooling keywords
-    rows.append(['Top 10 Keywords from Tooling', '', '% Repositories', ''])
-    if 'top_tooling' in code_stats:
-        for word, count, pct in code_stats['top_tooling']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Top data types keywords
-    rows.append(['Top 10 Keywords from Data Types', '', '% Repositories', ''])
-    if 'top_data_types' in code_stats:
-        for word, count, pct in code_stats['top_data_types']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Top code summary keywords
-    rows.append(['Top 10 Keywords from Code Summary', '', '% Repositories', ''])
-    if 'top_code_summary' in code_stats:
-        for word, count, pct in code_stats['top_code_summary']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # FAIR completeness
-    rows.append(['FAIR Component Completeness', '', '% with component', ''])
-    if 'fair_completeness' in code_stats:
-        for component, pct in sorted(code_stats['fair_completeness'].items(), key=lambda x: x[1], reverse=True):
-            rows.append([component, '', '', f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # FAIR Score by Language
-    rows.append(['Mean FAIR Score by Language (0-10 scale)', '', '', ''])
-    if 'fair_by_language' in code_stats:
-        for lang, data in code_stats['fair_by_language'].items():
-            rows.append([lang, f"{data['mean_score']:.2f}/10", f"n={data['count']}", ''])
-    rows.append(['', '', '', ''])
-
-    # HUMAN CELLULAR MODELS SECTION
-    rows.append(['HUMAN CELLULAR MODELS', '', '', ''])
-    rows.append(['Total Cell Models', cell_stats.get('n_cell_models', ''), '', ''])
-    rows.append(['', '', '', ''])
-
-    # Cell models per condition
-    rows.append(['Cell Models per Condition (Top 10)', '', '', ''])
-    if 'conditions' in cell_stats:
-        for condition, count in cell_stats['conditions'].items():
-            pct = cell_stats['conditions_pct'][condition]
-            rows.append([condition, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Most common genes
-    rows.append(['Most Common Genes', '', '', ''])
-    if 'top_genes' in cell_stats:
-        for gene, count in cell_stats['top_genes']:
-            rows.append([gene, '', count, ''])
-    rows.append(['', '', '', ''])
-
-    # Top gene themes
-    rows.append(['Top Themes from Gene Descriptions', '', '% Cell Models', ''])
-    if 'top_gene_themes' in cell_stats:
-        for word, count, pct in cell_stats['top_gene_themes']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-    rows.append(['', '', '', ''])
-
-    # Top variant themes
-    rows.append(['Top Themes from Variant Descriptions', '', '% Cell Models', ''])
-    if 'top_variant_themes' in cell_stats:
-        for word, count, pct in cell_stats['top_variant_themes']:
-            rows.append([word, '', count, f"{pct:.1f}%"])
-
-    # Create DataFrame and save
-    df = pd.DataFrame(rows)
-
-    # Save to CSV
+    for title, label, stats, key, emit in sections:
+        rows.append([title, '', label, ''])
+        if key is None or key in stats:
+            rows.extend(emit(stats))
+        rows.append(['', '', '', ''])
+    rows.pop()  # No separator after the last section
+
+    # Save to CSV, and in the same pass to TSV for easier pasting
     output_file = OUTPUT_DIR / "main_statistics_table.csv"
-    df.to_csv(output_file, index=False, header=False)
-    print(f"\nCSV saved to: {output_file}")
-
-    # Also save as TSV for easier pasting
     output_tsv = OUTPUT_DIR / "main_statistics_table.tsv"
-    df.to_csv(output_tsv, sep='\t', index=False, header=False)
+    with open(output_file, 'w', newline='', encoding='utf-8') as f_csv, \
+            open(output_tsv, 'w', newline='', encoding='utf-8') as f_tsv:
+        w_csv = csv.writer(f_csv, lineterminator='\n')
+        w_tsv = csv.writer(f_tsv, delimiter='\t', lineterminator='\n')
+        for row in rows:
+            w_csv.writerow(row)
+            w_tsv.writerow(row)
+    print(f"\nCSV saved to: {output_file}")
     print(f"TSV saved to: {output_tsv}")
 
-    return df
+    return rows
 
 
 def main():
@@ -214,7 +235,7 @@ def main():
     print("="*70)
     print()
 
-    df = create_wide_csv()
+    create_wide_csv()
 
     print()
     print(f"Export complete! Files can be imported into Google Sheets or Excel.")
@@ -7,9 +7,8 @@ Three panels:
 3. User Story 2 - Program Officer
 """
 
-def generate_workflow_panel():
-    """Panel A: CARD Catalog Development Workflow"""
-    workflow = """
+# Panels are static text, built once at import
+WORKFLOW_PANEL = """
 ╔═══════════════════════════════════════════════════════════════════════════════╗
 ║                    PANEL A: CARD CATALOG DEVELOPMENT WORKFLOW                 ║
 ╚═══════════════════════════════════════════════════════════════════════════════╝
@@ -52,12 +51,8 @@ def generate_workflow_panel():
         │  Researchers  •  Program Officers  •  Funders  •  PIs   │
         └─────────────────────────────────────────────────────────┘
 """
-    return workflow
 
-
-def generate_researcher_story():
-    """Panel B: User Story 1 - Biomedical Researcher"""
-    story = """
+RESEARCHER_STORY = """
 ╔═══════════════════════════════════════════════════════════════════════════════╗
 ║            PANEL B: USER STORY 1 - BIOMEDICAL RESEARCHER WORKFLOW             ║
 ║              Dr. Sarah Chen: From Hypothesis to Publication                   ║
@@ -131,12 +126,8 @@ RESEARCH QUESTION: Role of microglial dysfunction in early-stage Alzheimer's?
     │    literature review, identified research gap, and validation plan  │
     └─────────────────────────────────────────────────────────────────────┘
 """
-    return story
-
 
-def generate_program_officer_story():
-    """Panel C: User Story 2 - Program Officer"""
-    story = """
+PROGRAM_OFFICER_STORY = """
 ╔═══════════════════════════════════════════════════════════════════════════════╗
 ║          PANEL C: USER STORY 2 - PROGRAM OFFICER WORKFLOW                     ║
 ║         Dr. Michael Torres: Portfolio Analysis & Strategic Planning           ║
@@ -216,7 +207,21 @@ GOAL: Assess portfolio gaps and identify strategic investment opportunities
     │    • Cell line resource gaps for infrastructure planning            │
     └─────────────────────────────────────────────────────────────────────┘
 """
-    return story
+
+
+def generate_workflow_panel():
+    """Panel A: CARD Catalog Development Workflow"""
+    return WORKFLOW_PANEL
+
+
+def generate_researcher_story():
+    """Panel B: User Story 1 - Biomedical Researcher"""
+    return RESEARCHER_STORY
+
+
+def generate_program_officer_story():
+    """Panel C: User Story 2 - Program Officer"""
+    return PROGRAM_OFFICER_STORY
 
 
 def main():
@@ -228,28 +233,18 @@ def main():
     panel_b = generate_researcher_story()
     panel_c = generate_program_officer_story()
 
-    # Combine into single figure
-    figure1 = f"""
-{'='*80}
-FIGURE 1: CARD CATALOG WORKFLOW AND USER STORIES
-{'='*80}
-
-{panel_a}
-
-{panel_b}
-
-{panel_c}
-
-{'='*80}
-"""
+    # Figure parts in order, written out without building the combined string
+    header = f"\n{'='*80}\nFIGURE 1: CARD CATALOG WORKFLOW AND USER STORIES\n{'='*80}\n\n"
+    footer = f"\n\n{'='*80}\n"
+    parts = [header, panel_a, "\n\n", panel_b, "\n\n", panel_c, footer]
 
-    # Save to file
+    # Save to file as UTF-8 bytes with '\n' line endings on every platform
     output_file = "paper_v0/figure1_workflow_userstories.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(figure1)
+    with open(output_file, 'wb') as f:
+        f.writelines(part.encode('utf-8') for part in parts)
 
     print(f"Figure 1 saved to: {output_file}\n")
-    print(figure1)
+    print(*parts, sep='')
 
 
 if __name__ == "__main__":
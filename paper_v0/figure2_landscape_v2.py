@@ -12,8 +12,6 @@ from matplotlib.gridspec import GridSpec
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import re
-from collections import Counter, defaultdict
 from scipy.stats import gaussian_kde
 
 # Paths
@@ -22,38 +20,13 @@ SCRAPERS_DIR = Path(__file__).parent.parent / "scrapers"
 OUTPUT_DIR = Path(__file__).parent / "v0.3"
 
 
-def load_latest_file(pattern, directory=TABLES_DIR):
-    """Load the most recent file matching pattern."""
+def load_latest_file(pattern, directory=TABLES_DIR, usecols=None, dtype=None):
+    """Load the most recent file matching pattern, optionally only usecols read as dtype."""
     files = list(directory.glob(pattern))
     if not files:
         raise FileNotFoundError(f"No files found matching {pattern}")
     latest = max(files, key=lambda p: p.stat().st_mtime)
-    return pd.read_csv(latest, sep='\t', low_memory=False)
-
-
-def extract_coarse_types(data_modalities_str):
-    """Extract coarse data types from Coarse Data Modality string."""
-    if pd.isna(data_modalities_str) or not str(data_modalities_str).strip():
-        return []
-
-    modality_str = str(data_modalities_str).strip()
-    types = [t.strip() for t in modality_str.split(',')]
-    return types
-
-def get_fair_level(fair_note):
-    """Get FAIR level from compliance note."""
-    if pd.isna(fair_note):
-        return 'Unknown'
-
-    note_lower = str(fair_note).lower()
-    if 'excellent' in note_lower:
-        return 'Excellent'
-    elif 'strong' in note_lower:
-        return 'Strong'
-    elif 'good' in note_lower:
-        return 'Good'
-    else:
-        return 'Unknown'
+    return pd.read_csv(latest, sep='\t', usecols=usecols, dtype=dtype, low_memory=False)
 
 
 def create_figure():
@@ -61,24 +34,23 @@ def create_figure():
 
     # Load data
     print("Loading data...")
-    datasets_df = load_latest_file("dataset-inventory-*.tab")
+    # Only the columns the panels use, read as text (missing cells stay NaN)
+    datasets_df = load_latest_file(
+        "dataset-inventory-*.tab",
+        usecols=['Resource Name', 'Coarse Data Modality', 'FAIR Compliance Notes', 'Sample Size'],
+        dtype=str
+    )
 
     # Load code repos
-    code_df = load_latest_file("gits_to_reannotate_completed_*.tsv")
+    code_df = load_latest_file("gits_to_reannotate_completed_*.tsv",
+                               usecols=['Repository Link', 'Languages'], dtype=str)
 
     # Load FAIR compliance log (single authoritative file)
     fair_file = max(SCRAPERS_DIR.glob("fair_compliance_log_*.tsv"), key=lambda p: p.stat().st_mtime)
     print(f"Loading FAIR compliance log: {fair_file.name}")
-    fair_df = pd.read_csv(fair_file, sep='\t', low_memory=False)
+    fair_df = pd.read_csv(fair_file, sep='\t', usecols=['Repository', 'Issue Type'], dtype=str, low_memory=False)
     print(f"  {len(fair_df)} rows, {fair_df['Repository'].nunique()} unique repos")
-    fair_issues_by_repo = {}
-    for _, row in fair_df.iterrows():
-        repo = row.get('Repository', '')
-        issue_type = row.get('Issue Type', '')
-        if repo and issue_type:
-            if repo not in fair_issues_by_repo:
-                fair_issues_by_repo[repo] = set()
-            fair_issues_by_repo[repo].add(issue_type)
+    fair_issues_by_repo = fair_df.dropna(subset=['Repository']).groupby('Repository')['Issue Type'].agg(set).to_dict()
     print(f"Total unique repos with FAIR data: {len(fair_issues_by_repo)}")
 
     # Create figure - panel C as wide as A and B combined
@@ -86,32 +58,49 @@ def create_figure():
     gs = GridSpec(1, 3, figure=fig, left=0.05, right=0.98, top=0.85, bottom=0.10,
                   wspace=0.5, width_ratios=[1, 1, 2])
 
+    # Per-dataset fields used by Panels A and C: first number in Sample Size
+    # (NaN if none), FAIR level from the first of excellent/strong/good in the
+    # notes (else Unknown), and one row per comma-separated coarse data type
+    sample_sizes = pd.to_numeric(
+        datasets_df['Sample Size'].astype(str).str.extract(r'([\d,]+)', expand=False)
+        .str.replace(',', '', regex=False),
+        errors='coerce'
+    )
+    modalities = datasets_df['Coarse Data Modality'].fillna('').astype(str).str.strip()
+    notes = datasets_df['FAIR Compliance Notes'].fillna('').astype(str).str.lower()
+    fair_levels_by_dataset = np.select(
+        [notes.str.contains(word, regex=False) for word in ('excellent', 'strong', 'good')],
+        ['Excellent', 'Strong', 'Good'],
+        default='Unknown'
+    )
+    dataset_types = pd.DataFrame({
+        'dtype': modalities.str.split(','),
+        'fair_level': fair_levels_by_dataset,
+        'sample_size': sample_sizes,
+        'name': datasets_df['Resource Name'],
+    })[modalities != ''].explode('dtype')
+    dataset_types['dtype'] = dataset_types['dtype'].str.strip()
+
     # ==================== PANEL A: Coarse Data Types by FAIR ====================
     print("Generating Panel A: Coarse Data Types by FAIR Compliance...")
     ax1 = fig.add_subplot(gs[0, 0])
 
     # Count data types with FAIR levels
-    datatype_fair_counts = defaultdict(lambda: {'Excellent': 0, 'Strong': 0, 'Good': 0})
+    datatype_fair_counts = pd.crosstab(dataset_types['dtype'], dataset_types['fair_level'])
 
-    for _, row in datasets_df.iterrows():
-        coarse_types = extract_coarse_types(row.get('Coarse Data Modality', ''))
-        fair_level = get_fair_level(row.get('FAIR Compliance Notes', ''))
-
-        for dtype in coarse_types:
-            datatype_fair_counts[dtype][fair_level] += 1
-
-    # Sort by total count
-    datatype_totals = {dt: sum(counts.values()) for dt, counts in datatype_fair_counts.items()}
-    sorted_datatypes = sorted(datatype_totals.keys(), key=lambda x: datatype_totals[x], reverse=True)
+    # Sort by total count, ties in first-seen order
+    datatype_totals = dataset_types.groupby('dtype', sort=False).size().sort_values(ascending=False, kind='stable')
+    sorted_datatypes = datatype_totals.index.tolist()
 
     # Prepare stacked bar data - matching app table colors
     fair_levels = ['Excellent', 'Strong', 'Good']
     fair_colors = {'Excellent': '#006400', 'Strong': '#228B22', 'Good': '#90EE90'}
 
     # Create stacked bars
+    fair_counts = datatype_fair_counts.reindex(index=sorted_datatypes, columns=fair_levels, fill_value=0)
     bottoms = np.zeros(len(sorted_datatypes))
     for fair_level in fair_levels:
-        counts = [datatype_fair_counts[dt][fair_level] for dt in sorted_datatypes]
+        counts = fair_counts[fair_level].to_numpy()
         ax1.barh(range(len(sorted_datatypes)), counts, left=bottoms,
                 label=fair_level, color=fair_colors[fair_level],
                 edgecolor='black', linewidth=0.5)
@@ -126,7 +115,7 @@ def create_figure():
     ax1.grid(axis='x', alpha=0.3)
 
     # Add total counts at end of bars
-    max_total = max(datatype_totals.values())
+    max_total = datatype_totals.max()
     ax1.set_xlim(0, max_total * 1.12)
     for i, dtype in enumerate(sorted_datatypes):
         total = datatype_totals[dtype]
@@ -136,53 +125,42 @@ def create_figure():
     print("Generating Panel B: Code Languages with FAIR Issues...")
     ax2 = fig.add_subplot(gs[0, 1])
 
-    # Get top languages
-    all_languages = []
-    for langs in code_df['Languages'].dropna():
-        # Handle both semicolon and comma separators
-        lang_str = str(langs).replace(',', ';')
-        lang_list = [l.strip() for l in lang_str.split(';')]
-        all_languages.extend(lang_list)
+    # One row per (repository, language) pair, handling both semicolon and comma separators
+    repo_langs = code_df[['Repository Link', 'Languages']].dropna(subset=['Languages'])
+    repo_langs = repo_langs.assign(
+        Languages=repo_langs['Languages'].astype(str).str.replace(',', ';', regex=False).str.split(';')
+    ).explode('Languages')
+    repo_langs['Languages'] = repo_langs['Languages'].str.strip()
 
-    top_languages = [lang for lang, _ in Counter(all_languages).most_common(8)]
+    # Get top languages, ties in first-seen order
+    language_counts = repo_langs.groupby('Languages', sort=False).size()
+    top_languages = language_counts.sort_values(ascending=False, kind='stable').index[:8].tolist()
 
     # Count FAIR issues per language (using actual issue type names from logs)
     issue_types = ['No README', 'No Dependencies', 'No Version Info',
                    'No Container', 'No Environment Spec']
 
-    # Matrix: languages × issue types
-    lang_issue_matrix = np.zeros((len(top_languages), len(issue_types)))
-    lang_total_repos = {lang: 0 for lang in top_languages}
+    # Keep top-language pairs, skipping repos not assessed by FAIR scraper
+    repo_langs = repo_langs[
+        repo_langs['Languages'].isin(top_languages)
+        & repo_langs['Repository Link'].isin(list(fair_issues_by_repo))
+    ]
 
-    for _, row in code_df.iterrows():
-        repo_link = row.get('Repository Link', '')
-        # Handle both semicolon and comma separators
-        lang_str = str(row.get('Languages', '')).replace(',', ';')
-        langs = lang_str.split(';')
-        langs = [l.strip() for l in langs if l.strip() in top_languages]
-
-        if not langs:
-            continue
+    # Repository × issue type flags, one row per assessed repo
+    issue_flags = pd.DataFrame(
+        [[issue_type in issues for issue_type in issue_types] for issues in fair_issues_by_repo.values()],
+        index=list(fair_issues_by_repo), columns=issue_types
+    )
 
-        # Skip repos not assessed by FAIR scraper
-        if repo_link not in fair_issues_by_repo:
-            continue
-
-        # Get issues for this repo
-        repo_issues = fair_issues_by_repo.get(repo_link, set())
-
-        for lang in langs:
-            lang_idx = top_languages.index(lang)
-            lang_total_repos[lang] += 1
-
-            for issue_idx, issue_type in enumerate(issue_types):
-                if issue_type in repo_issues:
-                    lang_issue_matrix[lang_idx, issue_idx] += 1
+    # Matrix: languages × issue types
+    pair_flags = pd.DataFrame(issue_flags.loc[repo_langs['Repository Link']].to_numpy(), columns=issue_types)
+    lang_issue_counts = pair_flags.groupby(repo_langs['Languages'].to_numpy()).sum()
+    lang_issue_matrix = lang_issue_counts.reindex(top_languages, fill_value=0).to_numpy(dtype=float)
+    lang_total_repos = repo_langs['Languages'].value_counts().reindex(top_languages, fill_value=0)
 
     # Convert to percentages
-    for i, lang in enumerate(top_languages):
-        if lang_total_repos[lang] > 0:
-            lang_issue_matrix[i, :] = (lang_issue_matrix[i, :] / lang_total_repos[lang]) * 100
+    totals = lang_total_repos.to_numpy()[:, np.newaxis]
+    lang_issue_matrix = np.divide(lang_issue_matrix, totals, out=np.zeros_like(lang_issue_matrix), where=totals > 0) * 100
 
     # Plot heatmap
     im = ax2.imshow(lang_issue_matrix, aspect='auto', cmap='YlOrRd', interpolation='nearest', vmin=0, vmax=100)
@@ -211,27 +189,9 @@ def create_figure():
     print("Generating Panel C: Sample Size Distributions by Data Type...")
     ax3 = fig.add_subplot(gs[0, 2])
 
-    # Extract sample sizes by coarse data type
-    datatype_samples = defaultdict(list)
-
-    for _, row in datasets_df.iterrows():
-        # Get sample size
-        size_str = str(row.get('Sample Size', ''))
-        match = re.search(r'([\d,]+)', size_str)
-        if not match:
-            continue
-
-        try:
-            sample_size = float(match.group(1).replace(',', ''))
-            if sample_size < 1:  # Skip invalid sizes
-                continue
-        except ValueError:
-            continue
-
-        # Get coarse types
-        coarse_types = extract_coarse_types(row.get('Coarse Data Modality', ''))
-        for dtype in coarse_types:
-            datatype_samples[dtype].append(sample_size)
+    # Extract sample sizes by coarse data type, skipping missing and invalid (< 1) sizes
+    sized_types = dataset_types[dataset_types['sample_size'] >= 1]
+    datatype_samples = sized_types.groupby('dtype', sort=False)['sample_size'].apply(list).to_dict()
 
     # Plot density curves for top data types (by dataset count from Panel A)
     # Use the same datatype_totals from Panel A to ensure consistency
@@ -257,29 +217,12 @@ def create_figure():
     print("="*70)
 
     # Track which datasets have sample sizes vs which don't
-    datasets_with_samples = defaultdict(set)
-    for _, row in datasets_df.iterrows():
-        size_str = str(row.get('Sample Size', ''))
-        match = re.search(r'([\d,]+)', size_str)
-        if match:
-            try:
-                sample_size = float(match.group(1).replace(',', ''))
-                if sample_size >= 1:
-                    study_name = row.get('Resource Name', 'Unknown')
-                    coarse_types = extract_coarse_types(row.get('Coarse Data Modality', ''))
-                    for dtype in coarse_types:
-                        datasets_with_samples[dtype].add(study_name)
-            except ValueError:
-                pass
+    datasets_with_samples = sized_types.groupby('dtype')['name'].apply(set).to_dict()
 
     # Find datasets with each modality but NO sample size
     for dtype in sorted_datatypes[:5]:
         print(f"\n{dtype.upper()}:")
-        all_datasets_with_modality = set()
-        for _, row in datasets_df.iterrows():
-            coarse_types = extract_coarse_types(row.get('Coarse Data Modality', ''))
-            if dtype in coarse_types:
-                all_datasets_with_modality.add(row.get('Resource Name', 'Unknown'))
+        all_datasets_with_modality = set(dataset_types.loc[dataset_types['dtype'] == dtype, 'name'])
 
         missing_datasets = all_datasets_with_modality - datasets_with_samples.get(dtype, set())
 
@@ -5,6 +5,7 @@ Generate main descriptive statistics table for CARD Catalog paper.
 import pandas as pd
 import numpy as np
 from collections import Counter
+from operator import itemgetter
 import re
 from pathlib import Path
 
@@ -579,7 +580,7 @@ def format_output(datasets_stats, pubs_stats, code_stats, cell_stats):
 
     if 'fair_completeness' in code_stats:
         output.append("FAIR Component Completeness (% with component):")
-        for component, pct in sorted(code_stats['fair_completeness'].items(), key=lambda x: x[1], reverse=True):
+        for component, pct in sorted(code_stats['fair_completeness'].items(), key=itemgetter(1), reverse=True):
             output.append(f"  {component}: {pct:.1f}%")
         output.append("")
 